@@ -9,6 +9,7 @@ import logging
 import sys
 
 import dailyprogrammer.challenges
+from dailyprogrammer.utils.batch import FORMATS, formatResults, readProblems, solveBatch
 from dailyprogrammer.utils.inspection import listModules
 from dailyprogrammer.utils.logging import moduleLogger, timeit
 
@@ -22,6 +23,55 @@ def challengeTimer(elapsed):
     """
     logger.warn("challenge ran in %0.3f s" % elapsed)
 
+def runFile(challenge, path, options):
+    """
+    Run a challenge on the contents of a file
+
+    Challenges defining ``mainFile`` are passed the open file to read as they
+    go. Otherwise the file is read in full and passed to ``main``.
+
+    :param module challenge: Imported challenge module
+    :param string path: File path, or ``-`` for stdin
+    :param dict options: Challenge keyword options
+    """
+    if path == "-":
+        f = sys.stdin
+    else:
+        f = open(path)
+    try:
+        if hasattr(challenge, "mainFile"):
+            return challenge.mainFile(f, **options)
+        return challenge.main(f.read(), **options)
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+def runBatch(challengeModule, path, options, format="blank", processes=None, output=None):
+    """
+    Run a challenge on every problem in a file, writing each result as it is
+    solved, in the same format
+
+    :param string challengeModule: Importable challenge module name
+    :param string path: File path, or ``-`` for stdin
+    :param dict options: Challenge keyword options
+    :param string format: Batch format, as ``readProblems``
+    :param int processes: Worker processes, as ``solveBatch``
+    :param output: File to write results to, defaults to stdout
+    """
+    if output is None:
+        output = sys.stdout
+    if path == "-":
+        f = sys.stdin
+    else:
+        f = open(path)
+    try:
+        results = solveBatch(challengeModule, readProblems(f, format), options=options, processes=processes)
+        for line in formatResults(results, format):
+            output.write(line + "\n")
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
 def mainParser():
     """
     Command line parser
@@ -31,6 +81,9 @@ def mainParser():
     parser.add_argument("-l", "--list", action="store_true", help="List available challanges and exit")
     parser.add_argument("challenge", nargs="?", help="Challenge id. Matches the regex 'c\d{8}[hme]\d+' and style cYYYYMMDD<level><serial>")
     parser.add_argument("input", nargs="?", default=None, help="Challenge input. Defaults to stdin (one-read only)")
+    parser.add_argument("-f", "--file", default=None, help="Read challenge input from a file ('-' for stdin), streamed if the challenge supports it")
+    parser.add_argument("--batch", choices=FORMATS, default=None, help="Solve many problems from --file or stdin, separated by blank lines or as JSON lines, printing results in order in the same format")
+    parser.add_argument("--batch-processes", metavar="PROCESSES", type=int, default=None, help="Worker processes for --batch, defaults to the cpu count")
     return parser
 
 def main():
@@ -46,7 +99,7 @@ def main():
 
     # Take cli arguments
     parser = mainParser()
-    args = parser.parse_args()
+    args, remaining = parser.parse_known_args()
 
     # Alter logging
     if args.verbose == 1:
@@ -61,17 +114,40 @@ def main():
         for module, isPackage in listModules(dailyprogrammer.challenges):
             print(module)
     else:
-        # Running challanges
-        if args.input is None:
-            challengeInput = sys.stdin.read()
-        else:
-            challengeInput = args.input
-        
         challengeModule = "dailyprogrammer.challenges.{0}".format(args.challenge)
         challenge = importlib.import_module(challengeModule)
 
-        result = timeit(challengeTimer)(challenge.main)(challengeInput)
-        print(result)
+        # Challenges may take their own options, passed to main as keywords
+        options = {}
+        if hasattr(challenge, "mainArguments"):
+            common = set(vars(args))
+            challenge.mainArguments(parser.add_argument_group(args.challenge))
+            args = parser.parse_args()
+            options = {k: v for k, v in vars(args).items() if k not in common}
+            logger.debug(options)
+            if hasattr(challenge, "checkArguments"):
+                try:
+                    challenge.checkArguments(options)
+                except ValueError as e:
+                    parser.error(str(e))
+        elif remaining:
+            parser.error("unrecognized arguments: {0}".format(" ".join(remaining)))
+
+        # Running challanges
+        if args.batch is not None:
+            path = "-" if args.file is None else args.file
+            timeit(challengeTimer)(runBatch)(challengeModule, path, options, format=args.batch, processes=args.batch_processes)
+        elif args.file is not None:
+            result = timeit(challengeTimer)(runFile)(challenge, args.file, options)
+            print(result)
+        else:
+            if args.input is None:
+                challengeInput = sys.stdin.read()
+            else:
+                challengeInput = args.input
+
+            result = timeit(challengeTimer)(challenge.main)(challengeInput, **options)
+            print(result)
 
 if __name__ == "__main__":
     main()
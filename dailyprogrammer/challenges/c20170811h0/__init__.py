@@ -4,9 +4,11 @@
 https://www.reddit.com/r/dailyprogrammer/comments/6t0zua/20170811_challenge_326_hard_multifaceted_alphabet/
 """
 
+import bisect
 import collections
 
 from dailyprogrammer.utils.logging import moduleLogger, objectLogger
+from dailyprogrammer.utils.matching import hopcroftKarp
 from dailyprogrammer.utils.structures import sortedDictValues
 
 logger = moduleLogger(__name__)
@@ -14,18 +16,56 @@ logger = moduleLogger(__name__)
 class BrickException(Exception):
     pass
 
+LETTER_BITS = {chr(ord("a") + i): 1 << i for i in range(26)}
+
+def letterBit(letter):
+    """
+    Returns the bit representing a letter in a brick face mask::
+
+        "a" => 1, "c" => 4
+
+    Lowercase ascii letters occupy the lowest 26 bits. Any other character is
+    allocated the next free bit the first time it is seen.
+
+    :param string letter:
+    :rtype: int
+    """
+    try:
+        return LETTER_BITS[letter]
+    except KeyError:
+        bit = 1 << len(LETTER_BITS)
+        LETTER_BITS[letter] = bit
+        return bit
+
+def letterMask(letters):
+    """
+    Returns the face mask for a collection of letters::
+
+        "cab" => 7
+
+    :param letters: Iterable of letters
+    :rtype: int
+    """
+    mask = 0
+    for letter in letters:
+        mask |= letterBit(letter)
+    return mask
+
 class Brick(object):
     """
     An alphabet brick with variable number of faces
 
     :param int id: Position in sequence (also number of faces)
+    :param dict index: Optional shared index of letter to sorted brick ids, kept up to date by this brick
     """
-    def __init__(self, id):
+    def __init__(self, id, index=None):
         self.logger = objectLogger(self)
 
         self.id = id
         self.faces = id + 1
         self.letters = []
+        self.mask = 0
+        self.index = index
 
     def __repr__(self):
         return repr(self.letters)
@@ -36,7 +76,7 @@ class Brick(object):
 
         :param string letter: Letter to check
         """
-        return letter in self.letters
+        return bool(self.mask & letterBit(letter))
 
     def add(self, letter):
         """
@@ -54,6 +94,9 @@ class Brick(object):
             raise BrickException("Brick already contains '{0}'".format(letter))
         else:
             self.letters.append(letter)
+            self.mask |= letterBit(letter)
+            if self.index is not None:
+                bisect.insort(self.index[letter], self.id)
         return self
         
     def remove(self, letter):
@@ -65,6 +108,9 @@ class Brick(object):
         """
         self.logger.debug("Removing letter '%s' from brick" % letter)
         self.letters.remove(letter)
+        self.mask &= ~letterBit(letter)
+        if self.index is not None:
+            self.index[letter].remove(self.id)
         return self
 
     def replace(self, oldLetter, newLetter):
@@ -75,11 +121,14 @@ class Brick(object):
 class Bricks(object):
     """
     A series of alphabet bricks
+
+    ``index`` maps each letter to the sorted ids of bricks carrying it
     """
     def __init__(self):
         self.logger = objectLogger(self)
 
         self.bricks = []
+        self.index = collections.defaultdict(list)
     
     def __repr__(self):
         return repr(self.bricks)
@@ -88,12 +137,35 @@ class Bricks(object):
         self.logger.debug("Getting brick with key '%d'" % key)
         return self.bricks[key]
 
+    @classmethod
+    def fromData(cls, bricksData):
+        """
+        Returns bricks built from raw brick data, as from ``data``
+
+        :param list bricksData: Bricks as a nested list of letters
+        :raises: BrickException if a brick has more letters than faces
+        :rtype: Bricks
+        """
+        bricks = cls()
+        for letters in bricksData:
+            brick = bricks.add()
+            for letter in letters:
+                brick.add(letter)
+        return bricks
+
     def data(self):
         """
         Returns raw brick data as a nested list
         """
         return [[l for l in brick.letters] for brick in self.bricks]
 
+    def masks(self):
+        """
+        Returns each brick as a ``(mask, faces)`` tuple, where ``mask`` has a
+        bit set for every letter on the brick
+        """
+        return [(brick.mask, brick.faces) for brick in self.bricks]
+
     def add(self):
         """
         Add another brick to the series with N+1 faces
@@ -101,29 +173,39 @@ class Bricks(object):
         Returns the added brick
         """
         self.logger.debug("Adding another brick")
-        brick = Brick(len(self.bricks))
+        brick = Brick(len(self.bricks), index=self.index)
         self.bricks.append(brick)
         return brick
 
-    def contains(self, letter, ignore=[]):
+    def contains(self, letter, ignore=()):
         """
         Returns the first brick containing the letter
 
         Raises ValueError if the letter is not found
 
         :param string letter: Letter to check
-        :param list ignore: List of brick ids to ignore during check
+        :param ignore: Collection of brick ids to ignore during check, ideally a set
         :raises: ValueError
         :rtype: Brick
         """
         self.logger.debug("Checking if bricks contain '%s'", letter)
         self.logger.debug("Ignoring %s", ignore)
-        series = [b.contains(letter) and b.id not in ignore for b in self.bricks]
-        try:
-            i = series.index(True)
-        except ValueError:
-            raise ValueError("'{0}' not found in bricks {1}".format(letter, self.bricks))
-        return self.bricks[i]
+        for id in self.index.get(letter, ()):
+            if id not in ignore:
+                return self.bricks[id]
+        raise ValueError("'{0}' not found in bricks {1}".format(letter, self.bricks))
+
+    def canSpell(self, word):
+        """
+        Returns whether the bricks can currently spell a word
+
+        :param string word:
+        :rtype: bool
+        """
+        if len(word) > len(self.bricks):
+            return False
+        adjacency = [self.index.get(letter, []) for letter in word]
+        return None not in hopcroftKarp(adjacency)
 
 class BricksHandler(object):
     """
@@ -134,15 +216,15 @@ class BricksHandler(object):
 
         self.bricks = bricks
 
-        self.ignoreBricks = []
+        self.ignoreBricks = set()
         self.reset()
 
     def reset(self):
         self.logger.debug("Resetting")
-        self.ignoreBricks = []
+        self.ignoreBricks = set()
 
     def ignore(self, id):
-        self.ignoreBricks.append(id)
+        self.ignoreBricks.add(id)
 
     def addLetterToBrick(self, letter, brick):
         self.logger.debug("Trying to add letter to brick '%s'" % brick.id)
@@ -180,6 +262,39 @@ class BricksHandler(object):
                     self.addLetterToBrick(letter, brick)
                     break
 
+    def ensureWordInBricks(self, letters):
+        """
+        Ensure a whole word can be spelled, placing its letters as a bipartite
+        matching of letters to bricks
+
+        Letters are first matched to bricks already carrying them. The matching
+        is then extended by augmenting paths onto free faces, which may move
+        earlier letters of the word to other bricks. Only letters left over
+        after that are given new bricks.
+
+        :param list letters: Letters of the word, in order of preference
+        """
+        self.logger.debug("Ensuring %s in bricks", letters)
+        existing = [self.bricks.index.get(letter, []) for letter in letters]
+        matching = hopcroftKarp(existing)
+
+        if None in matching:
+            free = [b for b in self.bricks.bricks if len(b.letters) < b.faces]
+            extended = []
+            for letter, ids in zip(letters, existing):
+                bit = letterBit(letter)
+                extended.append(ids + [b.id for b in free if not b.mask & bit])
+            matching = hopcroftKarp(extended, matchLeft=matching)
+
+        for letter, id in zip(letters, matching):
+            if id is None:
+                self.logger.debug("No brick available for '%s'", letter)
+                self.bricks.add().add(letter)
+            else:
+                brick = self.bricks[id]
+                if not brick.contains(letter):
+                    brick.add(letter)
+
 def lettersDecreasing(para):
     """
     Return letters in the ``challengeInput`` in decreasing frequency order::
@@ -206,31 +321,297 @@ def wordsDecreasing(words):
     wordsDecreasing = sortedDictValues(wordLengths, reverse=True)
     return wordsDecreasing
 
-def generateAlphabetBricks(words):
+def letterSignature(word):
     """
-    Accepts a list of words and returns an internal representation of a bricks sequence.
+    Return the letter multiset of a word, shared by all its anagrams::
+
+        "banana" => (("a", 3), ("b", 1), ("n", 2))
+
+    :param string word:
+    :rtype: tuple
+    """
+    return tuple(sorted(collections.Counter(word).items()))
+
+def pruneWords(words):
+    """
+    Return words that are not anagrams of, or spellable from the letters of,
+    an earlier word::
+
+        ["banana", "nab", "ban", "spam", "maps"] => ["banana", "spam"]
+
+    Any bricks spelling a word can spell every word whose letters it contains,
+    so only the remaining words need placing. Words must be in decreasing
+    length order, as from ``wordsDecreasing``.
+
+    Kept words are indexed by each letter and count they have at least, as a
+    bitset of the words and a count of them. A word is only checked against
+    the kept words under its rarest entry, as every word containing it must be
+    there, intersected with its other entries until none are left.
 
     :param list words:
-    :rtype: list
+    :rtype: 2-tuple of the kept words list and the number of words eliminated
     """
-    words = wordsDecreasing(words)
-    letters = lettersDecreasing("".join(words))
+    seen = set()
+    atLeast = {}
+    sizes = collections.Counter()
+    kept = []
+    for word in words:
+        signature = letterSignature(word)
+        if signature in seen:
+            continue
+        seen.add(signature)
+
+        # the empty word is spelled by any bricks
+        if not signature:
+            continue
+        entries = sorted(signature, key=sizes.__getitem__)
+        dominators = atLeast.get(entries[0], 0)
+        for entry in entries[1:]:
+            if not dominators:
+                break
+            dominators &= atLeast[entry]
+        if dominators:
+            continue
+
+        bit = 1 << len(kept)
+        kept.append(word)
+        for letter, count in signature:
+            for n in range(1, count + 1):
+                atLeast[(letter, n)] = atLeast.get((letter, n), 0) | bit
+                sizes[(letter, n)] += 1
+
+    eliminated = len(words) - len(kept)
+    logger.info("Pruning eliminated %d of %d words", eliminated, len(words))
+    return kept, eliminated
+
+def placeWords(words, letters, bricks=None, matching=False):
+    """
+    Place each word, in the order given, onto a series of bricks.
+
+    Letters of each word are placed in the order of ``letters``, normally
+    most frequent first.
 
-    bricks = Bricks()
+    :param words: Iterable of words
+    :param list letters: Every letter used in ``words``, in order of placement
+    :param Bricks bricks: Bricks to extend, defaults to a new series
+    :param bool matching: Place words by bipartite matching
+    :rtype: Bricks
+    """
+    letterRanks = {letter: rank for rank, letter in enumerate(letters)}
+
+    if bricks is None:
+        bricks = Bricks()
     builder = BricksHandler(bricks)
 
     for word in words:
         logger.info("Processing '%s'" % word)
         builder.reset()
-        for letter in sorted(word, key=lambda c: letters.index(c)):
-            builder.ensureLetterInBricks(letter)
-                
+        wordLetters = sorted(word, key=letterRanks.__getitem__)
+        if matching:
+            builder.ensureWordInBricks(wordLetters)
+        else:
+            for letter in wordLetters:
+                builder.ensureLetterInBricks(letter)
+
+    return bricks
+
+def generateAlphabetBricks(words, matching=False, prune=False):
+    """
+    Accepts a list of words and returns an internal representation of a bricks sequence.
+
+    By default letters are placed greedily, one at a time. If ``matching`` is
+    set, each word is placed as a whole by ``BricksHandler.ensureWordInBricks``.
+    If ``prune`` is set, words are first reduced by ``pruneWords``.
+
+    :param list words:
+    :param bool matching: Place words by bipartite matching
+    :param bool prune: Skip anagrams and words contained in longer words
+    :rtype: list
+    """
+    words = wordsDecreasing(words)
+    letters = lettersDecreasing("".join(words))
+    if prune:
+        words, _ = pruneWords(words)
+
+    bricks = placeWords(words, letters, matching=matching)
     return bricks.data()
 
 
-def main(challengeInput):
-    words = [w.strip() for w in challengeInput.split("\n")]
-    bricksData = generateAlphabetBricks(words)
+def extendBricks(bricksData, words, matching=False):
+    """
+    Extends an existing series of bricks so it can also spell ``words``
+
+    Words the bricks can already spell are skipped, and the rest are placed
+    as by ``generateAlphabetBricks``, adding faces or bricks only where
+    needed. Only the new words are sorted and counted, so the work done is
+    proportional to them rather than to the words the bricks were built for.
+
+    :param list bricksData: Bricks as a nested list of letters
+    :param words: Iterable of new words
+    :param bool matching: Place words by bipartite matching
+    :rtype: list
+    """
+    bricks = Bricks.fromData(bricksData)
+    words = [w for w in wordsDecreasing(words) if not bricks.canSpell(w)]
+    logger.info("Extending bricks with %d new words", len(words))
+    letters = lettersDecreasing("".join(words))
+    placeWords(words, letters, bricks=bricks, matching=matching)
+    return bricks.data()
+
+def formatBricks(bricksData):
+    """
+    Returns bricks as text, one brick per line::
+
+        [["a"], ["b", "c"]] => "a\nbc"
+
+    :param list bricksData: Bricks as a nested list of letters
+    :rtype: string
+    """
     faces = ["".join(brick) for brick in bricksData]
-    challengeOutput = "\n".join(faces)
-    return challengeOutput
+    return "\n".join(faces)
+
+def parseBricks(text):
+    """
+    Returns bricks from text in the format of ``formatBricks``::
+
+        "a\nbc" => [["a"], ["b", "c"]]
+
+    :param string text:
+    :rtype: list
+    """
+    return [list(line.strip()) for line in text.strip("\n").split("\n")]
+
+def saveBricks(path, bricksData, binary=False):
+    """
+    Saves bricks to a file, in the format of this challenge's output
+
+    :param string path:
+    :param list bricksData: Bricks as a nested list of letters
+    :param bool binary: Save in the compact binary format of ``serialise``
+    """
+    logger.info("Saving bricks to '%s'", path)
+    if binary:
+        from dailyprogrammer.challenges.c20170811h0.serialise import writeBrickFile
+        writeBrickFile(path, bricksData)
+        return
+    with open(path, "w") as f:
+        f.write(formatBricks(bricksData))
+        f.write("\n")
+
+def loadBricks(path):
+    """
+    Returns bricks saved to a file, either as the output of this challenge
+    or in the binary format of ``serialise``
+
+    :param string path:
+    :rtype: list
+    """
+    from dailyprogrammer.challenges.c20170811h0.serialise import isBrickFile, readBrickFile
+    logger.info("Loading bricks from '%s'", path)
+    if isBrickFile(path):
+        bricksData, cursor, checksum = readBrickFile(path)
+        return bricksData
+    with open(path) as f:
+        return parseBricks(f.read())
+
+def mainArguments(parser):
+    """
+    Add challenge options to the command line parser
+
+    :param parser: An ``argparse`` parser or argument group
+    """
+    parser.add_argument("--verify", metavar="BRICKS", default=None, help="Check the input words can be spelled by the bricks in file BRICKS, rather than generating bricks")
+    parser.add_argument("--processes", type=int, default=None, help="Worker processes to use, defaults to the cpu count")
+    parser.add_argument("--prune", action="store_true", help="Skip anagrams and words contained in longer words")
+    parser.add_argument("--extend", metavar="BRICKS", default=None, help="Extend the bricks in file BRICKS to also spell the input words")
+    parser.add_argument("--save", action="store_true", help="With --extend, save the extended bricks back to BRICKS")
+    parser.add_argument("--portfolio", metavar="SECONDS", type=float, default=None, help="Spend SECONDS trying many placement orders in parallel, keeping the best")
+    parser.add_argument("--optimise", metavar="SECONDS", type=float, default=None, help="Spend SECONDS improving the bricks by local search")
+    parser.add_argument("--checkpoint", metavar="PATH", default=None, help="Periodically save progress building bricks to PATH")
+    parser.add_argument("--checkpoint-every", metavar="WORDS", type=int, default=1000, help="Words placed between checkpoints")
+    parser.add_argument("--resume", action="store_true", help="With --checkpoint, continue from the saved progress")
+
+def checkArguments(options):
+    """
+    Check challenge options that only make sense together
+
+    :param dict options: Challenge keyword options, as added by ``mainArguments``
+    :raises: ValueError for an option missing the option it needs
+    """
+    if options.get("resume") and options.get("checkpoint") is None:
+        raise ValueError("--resume needs --checkpoint")
+    if options.get("save") and options.get("extend") is None:
+        raise ValueError("--save needs --extend")
+
+def extendMain(words, extend, save=False):
+    """
+    Extend the bricks saved in file ``extend`` with ``words``, optionally saving them back
+
+    :rtype: string
+    """
+    from dailyprogrammer.challenges.c20170811h0.serialise import isBrickFile
+    bricksData = extendBricks(loadBricks(extend), words)
+    if save:
+        saveBricks(extend, bricksData, binary=isBrickFile(extend))
+    return formatBricks(bricksData)
+
+def buildMain(words, processes=None, prune=False, portfolio=None, optimise=None, checkpoint=None, checkpoint_every=1000, resume=False):
+    """
+    Build bricks for ``words``, by portfolio if a budget is given, or with
+    checkpoints if a path is given, then optionally improve them by local search
+
+    :rtype: string
+    """
+    from dailyprogrammer.challenges.c20170811h0.bounds import lowerBound, gapReport
+    bound = lowerBound(words)
+
+    if portfolio is not None:
+        from dailyprogrammer.challenges.c20170811h0.portfolio import portfolioBricks
+        if prune:
+            words, _ = pruneWords(wordsDecreasing(words))
+        bricksData, candidate = portfolioBricks(words, budget=portfolio, processes=processes, lowerBound=bound)
+    elif checkpoint is not None:
+        from dailyprogrammer.challenges.c20170811h0.serialise import generateAlphabetBricksCheckpointed
+        bricksData = generateAlphabetBricksCheckpointed(words, checkpoint, every=checkpoint_every, resume=resume, prune=prune)
+    else:
+        bricksData = generateAlphabetBricks(words, prune=prune)
+
+    if optimise is not None:
+        from dailyprogrammer.challenges.c20170811h0 import optimise as optimiser
+        bricksData = optimiser.optimise(words, bricksData, budget=optimise, lowerBound=bound)
+
+    logger.warning(gapReport(bricksData, bound))
+    return formatBricks(bricksData)
+
+def main(challengeInput, verify=None, processes=None, prune=False, extend=None, save=False, portfolio=None, optimise=None, checkpoint=None, checkpoint_every=1000, resume=False):
+    words = [w.strip() for w in challengeInput.split("\n")]
+    if verify is not None:
+        from dailyprogrammer.challenges.c20170811h0.verify import verificationReport
+        return verificationReport(loadBricks(verify), words, processes=processes)
+    if extend is not None:
+        return extendMain(words, extend, save=save)
+
+    return buildMain(words, processes=processes, prune=prune, portfolio=portfolio, optimise=optimise,
+                     checkpoint=checkpoint, checkpoint_every=checkpoint_every, resume=resume)
+
+def mainFile(challengeFile, verify=None, processes=None, prune=False, extend=None, save=False, portfolio=None, optimise=None, checkpoint=None, checkpoint_every=1000, resume=False):
+    """
+    As ``main``, but streams words from an open file rather than a string
+    """
+    from dailyprogrammer.challenges.c20170811h0.bounds import LowerBound, gapReport
+    from dailyprogrammer.challenges.c20170811h0.stream import readWords, generateAlphabetBricksStream
+    if verify is not None:
+        from dailyprogrammer.challenges.c20170811h0.verify import verificationReport
+        return verificationReport(loadBricks(verify), readWords(challengeFile), processes=processes)
+    if extend is not None:
+        return extendMain(readWords(challengeFile), extend, save=save)
+    if portfolio is not None or optimise is not None or checkpoint is not None:
+        return buildMain(list(readWords(challengeFile)), processes=processes, prune=prune, portfolio=portfolio, optimise=optimise,
+                         checkpoint=checkpoint, checkpoint_every=checkpoint_every, resume=resume)
+
+    if prune:
+        logger.warning("Pruning needs the whole word list in memory, ignored for file input")
+    bound = LowerBound()
+    bricksData = generateAlphabetBricksStream(challengeFile, bound=bound)
+    logger.warning(gapReport(bricksData, bound.bricks()))
+    return formatBricks(bricksData)
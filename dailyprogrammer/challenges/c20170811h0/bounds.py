@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+"""
+Lower bounds on the number of bricks needed to spell a word list
+
+* Every letter of the longest word needs its own brick
+* A letter appearing ``m`` times in one word must be on ``m`` different
+  bricks, so the bricks need at least the sum of these maximum counts as
+  faces in total. ``n`` bricks have ``n (n + 1) / 2`` faces.
+
+Both are gathered in one pass over the words, so can be computed alongside
+streaming input.
+"""
+
+import collections
+from math import ceil, sqrt
+
+from dailyprogrammer.utils.logging import moduleLogger, objectLogger
+
+logger = moduleLogger(__name__)
+
+def bricksForFaces(faces):
+    """
+    Returns the fewest bricks that have at least ``faces`` faces in total::
+
+        6 => 3, 7 => 4
+
+    :param int faces:
+    :rtype: int
+    """
+    n = int(ceil((sqrt(1 + 8 * faces) - 1) / 2))
+    # guard against float rounding either way
+    while n * (n + 1) // 2 < faces:
+        n += 1
+    while n > 0 and (n - 1) * n // 2 >= faces:
+        n -= 1
+    return n
+
+class LowerBound(object):
+    """
+    Accumulates lower bounds over words as they are added
+    """
+    def __init__(self):
+        self.logger = objectLogger(self)
+
+        self.longest = 0
+        self.maxCounts = collections.Counter()
+
+    def add(self, word):
+        self.longest = max(self.longest, len(word))
+        for letter, count in collections.Counter(word).items():
+            if count > self.maxCounts[letter]:
+                self.maxCounts[letter] = count
+
+    def extend(self, words):
+        for word in words:
+            self.add(word)
+        return self
+
+    def faces(self):
+        """
+        Returns the fewest faces that could spell every word added
+        """
+        return sum(self.maxCounts.values())
+
+    def bricks(self):
+        """
+        Returns the fewest bricks that could spell every word added
+        """
+        bound = max(self.longest, bricksForFaces(self.faces()))
+        self.logger.debug("Longest word %d, faces %d; bound %d", self.longest, self.faces(), bound)
+        return bound
+
+def lowerBound(words):
+    """
+    Returns the fewest bricks that could spell every word in ``words``
+
+    :param words: Iterable of words
+    :rtype: int
+    """
+    return LowerBound().extend(words).bricks()
+
+def gapReport(bricksData, bound):
+    """
+    Returns a summary of how far a set of bricks is from a lower bound
+
+    :param list bricksData: Bricks as a nested list of letters
+    :param int bound: Lower bound on the number of bricks
+    :rtype: string
+    """
+    gap = len(bricksData) - bound
+    if gap <= 0:
+        return "{0} bricks is optimal".format(len(bricksData))
+    return "{0} bricks, lower bound {1}, gap {2} ({3:.1%})".format(len(bricksData), bound, gap, gap / bound)
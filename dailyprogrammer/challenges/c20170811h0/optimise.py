@@ -0,0 +1,285 @@
+#!/usr/bin/env python
+"""
+Local search to reduce the bricks needed to spell a word list
+
+Starting from a valid set of bricks, random moves are tried:
+
+* drop a letter from a brick
+* eliminate a brick, moving its letters onto the others
+* move a letter from one brick to another
+* swap letters between two bricks
+
+A move is kept if the bricks still fit their faces and every word can still
+be spelled. Moves never make the bricks worse, so the search walks plateaus
+of equal score between improvements.
+
+Each word keeps a matching of its letters to bricks, and each brick letter
+the words matched through it. Removing a letter from a brick can only break
+those words, and of them only the letters matched to it. Just those letters
+are matched again, by augmenting paths from the rest of the matching.
+
+Bricks are handled here as plain lists of letters, in any order. A brick
+that loses all its letters stays as an empty list, so bricks keep their
+indices. They are sorted smallest first, without empty bricks, whenever
+returned, so brick ``n`` has at most ``n + 1`` letters.
+"""
+
+import collections
+import random
+import time
+
+from dailyprogrammer.challenges.c20170811h0 import pruneWords, wordsDecreasing
+from dailyprogrammer.utils.logging import moduleLogger, objectLogger
+from dailyprogrammer.utils.matching import hopcroftKarp
+
+logger = moduleLogger(__name__)
+
+def score(bricks):
+    """
+    Returns the ranking of a set of bricks, lower is better
+
+    :param list bricks: Bricks as a nested list of letters
+    :rtype: 2-tuple of (bricks, faces)
+    """
+    return (len(bricks), sum(len(brick) for brick in bricks))
+
+def fits(bricks):
+    """
+    Returns whether bricks can be ordered so brick ``n`` has at most ``n + 1`` letters
+
+    :param list bricks: Bricks as a nested list of letters
+    :rtype: bool
+    """
+    sizes = sorted(len(brick) for brick in bricks)
+    return all(size <= faces for faces, size in enumerate(sizes, 1))
+
+def brickIndex(bricks):
+    """
+    Returns the indices of the bricks with each letter
+
+    :param list bricks: Bricks as a nested list of letters
+    :rtype: dict of lists
+    """
+    index = collections.defaultdict(list)
+    for b, brick in enumerate(bricks):
+        for letter in brick:
+            index[letter].append(b)
+    return index
+
+def matchWord(word, index, matchLeft=None):
+    """
+    Returns a matching of each letter of a word to a different brick
+
+    :param string word:
+    :param dict index: As ``brickIndex``
+    :param list matchLeft: Optional partial matching to extend
+    :rtype: list of brick indices by letter, or ``None`` if the word cannot be spelled
+    """
+    matching = hopcroftKarp([index.get(letter, ()) for letter in word], matchLeft=matchLeft)
+    if None in matching:
+        return None
+    return matching
+
+class BrickSearch(object):
+    """
+    Local search state over a set of bricks
+
+    :param list words: Words the bricks must spell
+    :param list bricksData: Valid starting bricks, as a nested list of letters
+    :param int seed: Random seed for move selection
+    """
+    def __init__(self, words, bricksData, seed=0):
+        self.logger = objectLogger(self)
+
+        self.words, _ = pruneWords(wordsDecreasing(words))
+        self.bricks = [list(brick) for brick in bricksData]
+        self.rng = random.Random(seed)
+        self.moves = [self.drop, self.eliminate, self.move, self.swap]
+
+        index = brickIndex(self.bricks)
+        self.matchings = []
+        self.users = collections.defaultdict(set)
+        for i, word in enumerate(self.words):
+            matching = matchWord(word, index)
+            if matching is None:
+                raise ValueError("Starting bricks cannot spell '{0}'".format(word))
+            self.matchings.append(matching)
+            self.use(i, matching)
+
+    def use(self, i, matching, used=True):
+        """
+        Record (or forget) the brick letters word ``i`` is matched through
+        """
+        word = self.words[i]
+        for letter, b in zip(word, matching):
+            if used:
+                self.users[(b, letter)].add(i)
+            else:
+                self.users[(b, letter)].discard(i)
+
+    def data(self):
+        """
+        Returns the current bricks, smallest first
+        """
+        return sorted((list(brick) for brick in self.bricks if brick), key=len)
+
+    def score(self):
+        return score(self.data())
+
+    def repair(self, bricks):
+        """
+        Returns new matchings for the words broken by changing to ``bricks``,
+        or ``None`` if they are not valid
+
+        :param list bricks: Candidate bricks, by the same index as the current bricks
+        :rtype: dict of matchings by word index
+        """
+        if not fits([brick for brick in bricks if brick]):
+            return None
+        broken = collections.defaultdict(list)
+        for b, (before, after) in enumerate(zip(self.bricks, bricks)):
+            for letter in set(before).difference(after):
+                for i in self.users.get((b, letter), ()):
+                    broken[i].append((b, letter))
+
+        repaired = {}
+        index = brickIndex(bricks) if broken else None
+        for i, edges in broken.items():
+            word = self.words[i]
+            partial = [None if (b, letter) in edges else b for letter, b in zip(word, self.matchings[i])]
+            matching = matchWord(word, index, matchLeft=partial)
+            if matching is None:
+                return None
+            repaired[i] = matching
+        return repaired
+
+    def feasible(self, bricks):
+        """
+        Returns whether ``bricks`` are valid
+
+        :param list bricks: Candidate bricks, by the same index as the current bricks
+        :rtype: bool
+        """
+        return self.repair(bricks) is not None
+
+    def live(self, bricks):
+        return [brick for brick in bricks if brick]
+
+    def drop(self):
+        bricks = [list(brick) for brick in self.bricks]
+        live = self.live(bricks)
+        if not live:
+            return None
+        brick = self.rng.choice(live)
+        brick.remove(self.rng.choice(brick))
+        return bricks
+
+    def eliminate(self):
+        bricks = [list(brick) for brick in self.bricks]
+        live = self.live(bricks)
+        if len(live) < 2:
+            return None
+        brick = live.pop(self.rng.randrange(len(live)))
+        for letter in brick:
+            targets = [b for b in live if letter not in b]
+            if not targets:
+                return None
+            self.rng.choice(targets).append(letter)
+        del brick[:]
+        return bricks
+
+    def move(self):
+        bricks = [list(brick) for brick in self.bricks]
+        live = self.live(bricks)
+        if len(live) < 2:
+            return None
+        source, target = self.rng.sample(live, 2)
+        letter = self.rng.choice(source)
+        if letter in target:
+            return None
+        source.remove(letter)
+        target.append(letter)
+        return bricks
+
+    def swap(self):
+        bricks = [list(brick) for brick in self.bricks]
+        live = self.live(bricks)
+        if len(live) < 2:
+            return None
+        first, second = self.rng.sample(live, 2)
+        a = self.rng.choice(first)
+        b = self.rng.choice(second)
+        if a in second or b in first:
+            return None
+        first[first.index(a)] = b
+        second[second.index(b)] = a
+        return bricks
+
+    def step(self):
+        """
+        Try one random move, keeping it if the bricks remain valid
+
+        :rtype: bool of whether the move was kept
+        """
+        bricks = self.rng.choice(self.moves)()
+        if bricks is None or score(self.live(bricks)) > self.score():
+            return False
+        repaired = self.repair(bricks)
+        if repaired is None:
+            return False
+        for i, matching in repaired.items():
+            self.use(i, self.matchings[i], used=False)
+            self.matchings[i] = matching
+            self.use(i, matching)
+        self.bricks = bricks
+        return True
+
+def optimiseBricks(words, bricksData, iterations=None, budget=None, seed=0, lowerBound=None):
+    """
+    Yields ``(bricksData, score)`` for the starting bricks and then each
+    improvement found, until the iterations or time budget are spent, or the
+    number of bricks reaches ``lowerBound``
+
+    :param list words: Words the bricks must spell
+    :param list bricksData: Valid starting bricks, as a nested list of letters
+    :param int iterations: Maximum moves to try, or ``None`` for no limit
+    :param float budget: Wall clock seconds to spend, or ``None`` for no limit
+    :param int seed: Random seed for move selection
+    :param int lowerBound: Stop once this few bricks are reached
+    :rtype: generator
+    """
+    if iterations is None and budget is None:
+        raise ValueError("An optimisation needs an iteration or time budget")
+    search = BrickSearch(words, bricksData, seed=seed)
+    deadline = None if budget is None else time.time() + budget
+
+    best = search.score()
+    yield (search.data(), best)
+    iteration = 0
+    while iterations is None or iteration < iterations:
+        if deadline is not None and time.time() >= deadline:
+            break
+        if lowerBound is not None and best[0] <= lowerBound:
+            logger.info("Reached the lower bound of %d bricks", lowerBound)
+            break
+        iteration += 1
+        if search.step() and search.score() < best:
+            best = search.score()
+            logger.info("Improved to %s after %d moves", best, iteration)
+            yield (search.data(), best)
+    logger.info("Tried %d moves", iteration)
+
+def optimise(words, bricksData, iterations=None, budget=None, seed=0, lowerBound=None):
+    """
+    Returns the best bricks found by ``optimiseBricks``, logging the
+    improvement over the starting bricks
+
+    :rtype: list
+    """
+    results = optimiseBricks(words, bricksData, iterations=iterations, budget=budget, seed=seed, lowerBound=lowerBound)
+    start = next(results)[1]
+    best, end = bricksData, start
+    for best, end in results:
+        pass
+    logger.warning("Optimised bricks from %d (%d faces) to %d (%d faces)", start[0], start[1], end[0], end[1])
+    return best
@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+"""
+Build bricks with many word and letter orderings in parallel, keeping the best
+
+The greedy construction is sensitive to the order words and letters are
+placed in. Each candidate here is a seeded ordering plus a placement mode;
+candidates are run across a process pool until a wall clock budget is spent.
+Seed ``0`` is the ordering used by ``generateAlphabetBricks``, so the result
+is never worse than it.
+
+Results are ranked by number of bricks, then total faces used.
+"""
+
+import collections
+import itertools
+import multiprocessing
+import os
+import random
+import time
+
+from dailyprogrammer.challenges.c20170811h0 import placeWords, wordsDecreasing
+from dailyprogrammer.utils.logging import moduleLogger
+from dailyprogrammer.utils.structures import sortedDictValues
+
+logger = moduleLogger(__name__)
+
+def candidates():
+    """
+    Yields ``(seed, matching)`` candidates indefinitely, trying both
+    placement modes for each seed
+    """
+    for seed in itertools.count():
+        yield (seed, False)
+        yield (seed, True)
+
+def candidateOrder(words, letterCounts, seed):
+    """
+    Returns the ``(words, letters)`` placement order for a seed
+
+    Seed ``0`` is longest words first and most frequent letters first. Other
+    seeds shuffle words of equal length, and jitter letter frequencies by up
+    to 25% before ordering.
+
+    :param list words: Words in decreasing length order, as from ``wordsDecreasing``
+    :param dict letterCounts: Frequency of every letter in ``words``
+    :param int seed:
+    :rtype: 2-tuple of lists
+    """
+    if seed == 0:
+        return (words, sortedDictValues(letterCounts, reverse=True))
+    rng = random.Random(seed)
+    words = sorted(words, key=lambda w: (-len(w), rng.random()))
+    jittered = {l: c * rng.uniform(0.75, 1.25) for l, c in letterCounts.items()}
+    return (words, sortedDictValues(jittered, reverse=True))
+
+def score(bricksData):
+    """
+    Returns the ranking of a set of bricks, lower is better
+
+    :param list bricksData: Bricks as a nested list of letters
+    :rtype: 2-tuple of (bricks, faces)
+    """
+    return (len(bricksData), sum(len(brick) for brick in bricksData))
+
+def buildCandidate(words, letterCounts, candidate):
+    """
+    Returns ``(score, candidate, bricksData)`` of the bricks built by a candidate
+
+    :param list words: Words in decreasing length order, as from ``wordsDecreasing``
+    :param dict letterCounts: Frequency of every letter in ``words``
+    :param tuple candidate: ``(seed, matching)``
+    :rtype: 3-tuple
+    """
+    seed, matching = candidate
+    ordered, letters = candidateOrder(words, letterCounts, seed)
+    bricksData = placeWords(ordered, letters, matching=matching).data()
+    return (score(bricksData), candidate, bricksData)
+
+_words = None
+_letterCounts = None
+
+def _initialise(words, letterCounts):
+    global _words, _letterCounts
+    _words = words
+    _letterCounts = letterCounts
+
+def _build(candidate):
+    return buildCandidate(_words, _letterCounts, candidate)
+
+def candidateResults(words, letterCounts, queue, deadline, processes):
+    """
+    Yields the results of ``buildCandidate`` for candidates from ``queue``
+    until it is empty or the deadline passes, after at least one completes
+
+    :param list words: Words in decreasing length order
+    :param dict letterCounts: Frequency of every letter in ``words``
+    :param queue: Iterator of candidates
+    :param float deadline: Wall clock time to stop by, or ``None``
+    :param int processes: Worker processes. ``1`` runs in process
+    :rtype: generator of 3-tuples
+    """
+    if processes == 1:
+        for candidate in queue:
+            yield buildCandidate(words, letterCounts, candidate)
+            if deadline is not None and time.time() >= deadline:
+                logger.info("Portfolio budget spent")
+                return
+        return
+
+    with multiprocessing.Pool(processes, initializer=_initialise, initargs=(words, letterCounts)) as pool:
+        pending = collections.deque(pool.apply_async(_build, (c,)) for c in itertools.islice(queue, processes))
+        completed = 0
+        while pending:
+            timeout = None
+            if deadline is not None and completed:
+                timeout = max(deadline - time.time(), 0)
+            try:
+                result = pending.popleft().get(timeout)
+            except multiprocessing.TimeoutError:
+                logger.info("Portfolio budget spent")
+                return
+            completed += 1
+            yield result
+
+            if deadline is None or time.time() < deadline:
+                for c in itertools.islice(queue, 1):
+                    pending.append(pool.apply_async(_build, (c,)))
+
+def portfolioBricks(words, budget=10.0, limit=None, processes=None, lowerBound=None):
+    """
+    Returns the best bricks found by candidate orderings within a budget
+
+    At least one candidate always completes, even if it overruns the budget.
+    The search stops early if a candidate reaches ``lowerBound`` bricks.
+
+    :param list words:
+    :param float budget: Wall clock seconds to spend, or ``None`` for no limit
+    :param int limit: Maximum candidates to run, or ``None`` for no limit
+    :param int processes: Worker processes, defaults to the cpu count. ``1`` runs in process
+    :param int lowerBound: Stop once this few bricks are reached
+    :rtype: 2-tuple of bricks data and the ``(seed, matching)`` candidate that built it
+    """
+    if budget is None and limit is None:
+        raise ValueError("A portfolio needs a time budget or a candidate limit")
+    if processes is None:
+        processes = os.cpu_count() or 1
+
+    words = wordsDecreasing(words)
+    letterCounts = collections.Counter("".join(words))
+    deadline = None if budget is None else time.time() + budget
+    queue = candidates() if limit is None else itertools.islice(candidates(), limit)
+
+    best = None
+    completed = 0
+    results = candidateResults(words, letterCounts, queue, deadline, processes)
+    for result in results:
+        completed += 1
+        logger.debug("Candidate %s scored %s", result[1], result[0])
+        if best is None or result[0] < best[0]:
+            logger.info("New best candidate %s scored %s", result[1], result[0])
+            best = result
+        if lowerBound is not None and best[0][0] <= lowerBound:
+            logger.info("Reached the lower bound of %d bricks", lowerBound)
+            break
+    results.close()
+
+    logger.info("Ran %d candidates, best %s scored %s", completed, best[1], best[0])
+    return (best[2], best[1])
@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+"""
+Compact binary brick files, and checkpointing of brick construction
+
+A brick file is a header followed by each brick's faces::
+
+    header: magic "DPBK", version (uint8), bricks (uint32),
+            word cursor (uint64), word list checksum (uint32)
+    brick:  length (uint16), letters (utf-8 encoded, one character per face)
+
+All integers are little endian. The word cursor and checksum are zero for
+plain brick sets; checkpoints record how many words of a word list, in
+placement order, have been placed.
+
+Face masks are rebuilt from the letters on load, as bits for letters other
+than a-z are only allocated per process.
+"""
+
+import os
+import struct
+import zlib
+
+from dailyprogrammer.challenges.c20170811h0 import Bricks, lettersDecreasing, placeWords, pruneWords, wordsDecreasing
+from dailyprogrammer.utils.logging import moduleLogger
+
+logger = moduleLogger(__name__)
+
+MAGIC = b"DPBK"
+VERSION = 1
+HEADER = struct.Struct("<4sBIQI")
+FACES = struct.Struct("<H")
+
+def dumpBricks(bricksData, cursor=0, checksum=0):
+    """
+    Returns bricks encoded as bytes
+
+    :param list bricksData: Bricks as a nested list of letters
+    :param int cursor: Number of words placed
+    :param int checksum: Checksum of the word list being placed
+    :rtype: bytes
+    """
+    parts = [HEADER.pack(MAGIC, VERSION, len(bricksData), cursor, checksum)]
+    for brick in bricksData:
+        letters = "".join(brick).encode("utf-8")
+        parts.append(FACES.pack(len(letters)))
+        parts.append(letters)
+    return b"".join(parts)
+
+def decodeBricks(data):
+    """
+    Returns bricks decoded from bytes, as a ``(bricksData, cursor, checksum)`` tuple
+
+    :param bytes data:
+    :raises: ValueError if ``data`` is not a brick file
+    :rtype: tuple
+    """
+    magic, version, count, cursor, checksum = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("Not a brick file")
+    if version != VERSION:
+        raise ValueError("Unsupported brick file version {0}".format(version))
+
+    bricksData = []
+    offset = HEADER.size
+    for i in range(count):
+        length, = FACES.unpack_from(data, offset)
+        offset += FACES.size
+        bricksData.append(list(data[offset:offset + length].decode("utf-8")))
+        offset += length
+    return (bricksData, cursor, checksum)
+
+def isBrickFile(path):
+    """
+    Returns whether the file at ``path`` is a binary brick file
+
+    :param string path:
+    :rtype: bool
+    """
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+def readBrickFile(path):
+    """
+    Returns ``(bricksData, cursor, checksum)`` from a binary brick file
+
+    :param string path:
+    :rtype: tuple
+    """
+    with open(path, "rb") as f:
+        return decodeBricks(f.read())
+
+def writeBrickFile(path, bricksData, cursor=0, checksum=0):
+    """
+    Writes a binary brick file, replacing any existing file atomically
+
+    :param string path:
+    :param list bricksData: Bricks as a nested list of letters
+    :param int cursor: Number of words placed
+    :param int checksum: Checksum of the word list being placed
+    """
+    temporary = path + ".tmp"
+    with open(temporary, "wb") as f:
+        f.write(dumpBricks(bricksData, cursor=cursor, checksum=checksum))
+    os.replace(temporary, path)
+
+def wordsChecksum(words):
+    """
+    Returns a checksum of a word list, sensitive to order
+
+    :param list words:
+    :rtype: int
+    """
+    checksum = 0
+    for word in words:
+        checksum = zlib.crc32(word.encode("utf-8") + b"\n", checksum)
+    return checksum
+
+def generateAlphabetBricksCheckpointed(words, path, every=1000, resume=False, matching=False, prune=False):
+    """
+    As ``generateAlphabetBricks``, saving a checkpoint to ``path`` after every
+    ``every`` words
+
+    With ``resume``, an existing checkpoint at ``path`` is loaded and placement
+    continues from the word after the last checkpoint. The checkpoint must have
+    been made for the same word list and options.
+
+    :param list words:
+    :param string path: Checkpoint file
+    :param int every: Words placed between checkpoints
+    :param bool resume: Continue from an existing checkpoint
+    :param bool matching: Place words by bipartite matching
+    :param bool prune: Skip anagrams and words contained in longer words
+    :raises: ValueError if the checkpoint is for a different word list
+    :rtype: list
+    """
+    words = wordsDecreasing(words)
+    letters = lettersDecreasing("".join(words))
+    if prune:
+        words, _ = pruneWords(words)
+    checksum = wordsChecksum(words)
+
+    bricks = Bricks()
+    cursor = 0
+    if resume and os.path.exists(path):
+        bricksData, cursor, saved = readBrickFile(path)
+        if saved != checksum:
+            raise ValueError("Checkpoint '{0}' was made for a different word list".format(path))
+        logger.info("Resuming from word %d of %d", cursor, len(words))
+        bricks = Bricks.fromData(bricksData)
+
+    while cursor < len(words):
+        chunk = words[cursor:cursor + every]
+        placeWords(chunk, letters, bricks=bricks, matching=matching)
+        cursor += len(chunk)
+        writeBrickFile(path, bricks.data(), cursor=cursor, checksum=checksum)
+        logger.info("Checkpointed at word %d of %d", cursor, len(words))
+
+    return bricks.data()
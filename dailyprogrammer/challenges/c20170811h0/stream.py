@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+"""
+Generate bricks from word lists too large to hold in memory
+
+Words are read once, each spilled to a temporary file for its length. Each
+length file is then read back on its own, with repeated words dropped and
+the rest sorted, and letter frequencies counted from what is left. Bricks are
+built by reading the sorted length files back, longest first. Only the letter
+counts, one open file per word length, the largest single length and the
+bricks stay in memory.
+
+Words and letters are placed in the same order as ``generateAlphabetBricks``,
+so the bricks are the same as for the whole list held in memory.
+"""
+
+import collections
+import os
+import tempfile
+
+from dailyprogrammer.challenges.c20170811h0 import placeWords
+from dailyprogrammer.utils.logging import moduleLogger, objectLogger
+from dailyprogrammer.utils.structures import sortedDictValues
+
+logger = moduleLogger(__name__)
+
+def readWords(lines):
+    """
+    Yields stripped, non-empty words from an iterable of lines, such as a file
+
+    :param lines: Iterable of strings
+    :rtype: generator of strings
+    """
+    for line in lines:
+        word = line.strip()
+        if word:
+            yield word
+
+class LengthBuckets(object):
+    """
+    An on-disk bucket sort of words by length, counting letters on the way
+
+    Use as a context manager to remove the bucket files afterwards.
+
+    :param string directory: Where to create bucket files, defaults to the system temporary directory
+    :param LowerBound bound: Optional lower bound to add each word to
+    """
+    def __init__(self, directory=None, bound=None):
+        self.logger = objectLogger(self)
+
+        self.directory = tempfile.mkdtemp(prefix="c20170811h0-", dir=directory)
+        self.buckets = {}
+        self.letterCounts = collections.Counter()
+        self.count = 0
+        self.sorted = False
+        self.bound = bound
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def path(self, length):
+        return os.path.join(self.directory, "{0}.txt".format(length))
+
+    def add(self, word):
+        """
+        Add a word to its length bucket
+
+        :param string word:
+        """
+        try:
+            bucket = self.buckets[len(word)]
+        except KeyError:
+            self.logger.debug("Opening bucket for length %d", len(word))
+            bucket = open(self.path(len(word)), "w+")
+            self.buckets[len(word)] = bucket
+        bucket.write(word)
+        bucket.write("\n")
+        self.count += 1
+        self.sorted = False
+        if self.bound is not None:
+            self.bound.add(word)
+
+    def extend(self, words):
+        for word in words:
+            self.add(word)
+        return self
+
+    def sort(self):
+        """
+        Drop repeated words from each bucket and sort it in decreasing order,
+        as ``wordsDecreasing``, counting the letters of the words left
+        """
+        if self.sorted:
+            return
+        self.letterCounts = collections.Counter()
+        for length, bucket in self.buckets.items():
+            bucket.flush()
+            bucket.seek(0)
+            words = sorted(set(line[:-1] for line in bucket), reverse=True)
+            bucket.seek(0)
+            bucket.truncate()
+            for word in words:
+                bucket.write(word)
+                bucket.write("\n")
+                self.letterCounts.update(word)
+        self.sorted = True
+
+    def lettersDecreasing(self):
+        """
+        Returns all letters seen in decreasing frequency order, as ``lettersDecreasing``
+
+        :rtype: list
+        """
+        self.sort()
+        return sortedDictValues(self.letterCounts, reverse=True)
+
+    def wordsDecreasing(self):
+        """
+        Yields every distinct word added, longest first, as ``wordsDecreasing``
+
+        :rtype: generator of strings
+        """
+        self.sort()
+        for length in sorted(self.buckets, reverse=True):
+            bucket = self.buckets[length]
+            bucket.flush()
+            bucket.seek(0)
+            for line in bucket:
+                yield line[:-1]
+
+    def close(self):
+        for length, bucket in self.buckets.items():
+            bucket.close()
+            os.remove(self.path(length))
+        self.buckets = {}
+        os.rmdir(self.directory)
+
+def generateAlphabetBricksStream(lines, matching=False, directory=None, bound=None):
+    """
+    As ``generateAlphabetBricks``, but reads words lazily from an iterable of
+    lines and keeps them on disk
+
+    :param lines: Iterable of lines, one word per line, such as an open file
+    :param bool matching: Place words by bipartite matching
+    :param string directory: Where to create temporary bucket files
+    :param LowerBound bound: Optional lower bound to add each word to as it is read
+    :rtype: list
+    """
+    with LengthBuckets(directory=directory, bound=bound) as buckets:
+        buckets.extend(readWords(lines))
+        logger.info("Read %d words", buckets.count)
+        letters = buckets.lettersDecreasing()
+        bricks = placeWords(buckets.wordsDecreasing(), letters, matching=matching)
+    return bricks.data()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+"""
+Verify that a set of bricks can spell every word in a list
+
+Each brick is reduced to a face mask, and a word is spellable if its letters
+can be matched to distinct bricks carrying them. Word lists are streamed in
+chunks across a process pool, so they never need to fit in memory.
+"""
+
+import multiprocessing
+import os
+
+from dailyprogrammer.challenges.c20170811h0 import letterBit, letterMask
+from dailyprogrammer.utils.logging import moduleLogger
+from dailyprogrammer.utils.matching import hopcroftKarp
+from dailyprogrammer.utils.pool import imapBounded
+from dailyprogrammer.utils.structures import chunks
+
+logger = moduleLogger(__name__)
+
+class Verifier(object):
+    """
+    Checks words against a fixed set of bricks
+
+    :param list bricksData: Bricks as a nested list of letters, as from ``Bricks.data()``
+    """
+    def __init__(self, bricksData):
+        self.masks = [letterMask(brick) for brick in bricksData]
+        self.available = 0
+        for mask in self.masks:
+            self.available |= mask
+        self.index = {}
+
+    def bricksWith(self, letter):
+        """
+        Returns the ids of bricks carrying ``letter``
+
+        :param string letter:
+        :rtype: list
+        """
+        try:
+            return self.index[letter]
+        except KeyError:
+            bit = letterBit(letter)
+            ids = [i for i, mask in enumerate(self.masks) if mask & bit]
+            self.index[letter] = ids
+            return ids
+
+    def canSpell(self, word):
+        """
+        Returns whether the bricks can spell ``word``
+
+        :param string word:
+        :rtype: bool
+        """
+        if len(word) > len(self.masks):
+            return False
+        if letterMask(word) & ~self.available:
+            return False
+        adjacency = [self.bricksWith(letter) for letter in word]
+        if all(len(ids) >= len(word) for ids in adjacency):
+            return True
+        return None not in hopcroftKarp(adjacency)
+
+    def failures(self, words):
+        """
+        Returns the words in ``words`` that cannot be spelled
+
+        :param list words:
+        :rtype: list
+        """
+        return [word for word in words if not self.canSpell(word)]
+
+_verifier = None
+
+def _initialise(bricksData):
+    global _verifier
+    _verifier = Verifier(bricksData)
+
+def _failures(words):
+    return _verifier.failures(words)
+
+def verifyWords(bricksData, words, processes=None, chunkSize=4096):
+    """
+    Yields every word in ``words`` that ``bricksData`` cannot spell, in input order
+
+    ``words`` may be any iterable, and is consumed lazily in chunks.
+
+    :param list bricksData: Bricks as a nested list of letters
+    :param words: Iterable of words
+    :param int processes: Worker processes, defaults to the cpu count. ``1`` runs in process
+    :param int chunkSize: Words per task
+    :rtype: generator of strings
+    """
+    if processes is None:
+        processes = os.cpu_count() or 1
+    logger.info("Verifying words with %d processes", processes)
+
+    if processes == 1:
+        verifier = Verifier(bricksData)
+        for chunk in chunks(words, chunkSize):
+            for word in verifier.failures(chunk):
+                yield word
+    else:
+        with multiprocessing.Pool(processes, initializer=_initialise, initargs=(bricksData,)) as pool:
+            for failures in imapBounded(pool, _failures, chunks(words, chunkSize), window=4 * processes):
+                for word in failures:
+                    yield word
+
+def verificationReport(bricksData, words, processes=None):
+    """
+    Returns a human readable report of which words cannot be spelled
+
+    :param list bricksData: Bricks as a nested list of letters
+    :param words: Iterable of words
+    :param int processes: Worker processes
+    :rtype: string
+    """
+    counted = [0]
+    def counting(words):
+        for word in words:
+            counted[0] += 1
+            yield word
+
+    failures = list(verifyWords(bricksData, counting(words), processes=processes))
+    total = counted[0]
+    if failures:
+        lines = ["{0} of {1} words cannot be spelled".format(len(failures), total)]
+        lines.extend(failures)
+        return "\n".join(lines)
+    return "All {0} words can be spelled".format(total)
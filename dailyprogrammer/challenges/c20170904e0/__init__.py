@@ -4,10 +4,13 @@
 https://www.reddit.com/r/dailyprogrammer/comments/6y19v2/20170904_challenge_330_easy_surround_the_circles/
 """
 
+from dailyprogrammer.utils.circles import formatBox, readCircles
 from dailyprogrammer.utils.logging import moduleLogger
 
 logger = moduleLogger(__name__)
 
+INF = float('inf')
+
 def minimumBoundingOrthogonal(circles):
     """
     Returns the minimum bounding box (axis-aligned) in the format::
@@ -16,17 +19,35 @@ def minimumBoundingOrthogonal(circles):
 
     Where the tuples are x, y coordinates from the bottom-left point clockwise
 
-    :param list circles: A list of circle 3-tuples (x, y, r)
+    Circles are read in one pass, so may be any iterable, such as a generator
+    over a file.
+
+    :param circles: An iterable of circle 3-tuples (x, y, r)
+    :raises: ValueError if there are no circles
     :rtype: tuple
     """
-    extrema = [(x - r, x + r, y - r, y + r) for x, y, r in circles]
-    xmins, xmaxs, ymins, ymaxs = zip(*extrema)
-    xmin, xmax, ymin, ymax = (min(xmins), max(xmaxs), min(ymins), max(ymaxs))
+    xmin = ymin = INF
+    xmax = ymax = -INF
+    count = 0
+    for x, y, r in circles:
+        xmin = min(xmin, x - r)
+        xmax = max(xmax, x + r)
+        ymin = min(ymin, y - r)
+        ymax = max(ymax, y + r)
+        count += 1
+    if not count:
+        raise ValueError("A bounding box needs at least one circle")
+    logger.debug("Bounded %d circles", count)
     return ((xmin, ymin), (xmin, ymax), (xmax, ymax), (xmax, ymin))
 
 def main(challengeInput):
     circles = [(float(s) for s in l.split(",")) for l in challengeInput.split("\n")]
     points = minimumBoundingOrthogonal(circles)
-    challengeOutput = ", ".join("({0:.3f}, {1:.3f})".format(*point) for point in points)
+    challengeOutput = formatBox(points)
+    return challengeOutput
+
+def mainFile(challengeFile):
+    points = minimumBoundingOrthogonal(readCircles(challengeFile))
+    challengeOutput = formatBox(points)
     return challengeOutput
 
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+"""
+Approximate minimum bounding box, within a relative error of the optimal area
+
+Disks that cannot touch the hull are pruned first, as ``prune``, and the
+envelope is built from those left, so the hull is exact but only costs the
+envelope of the candidates. Boxes are then tried at evenly sampled angles
+against the envelope, so every box found bounds all the disks.
+
+For ``W`` the least width of the hull over every direction, and ``D`` the
+greatest distance between the centres of circles supporting it on opposite
+sides, the width at any angle changes by at most ``D`` per radian. The nearest
+of samples ``2 delta`` apart is within ``delta`` of the optimal angle, so each
+of its two widths is within a factor ``1 + D delta / W`` of the optimal box's.
+Choosing that factor as ``sqrt(1 + epsilon)`` keeps the area within
+``1 + epsilon`` of optimal.
+
+The number of samples depends only on ``epsilon`` and ``D / W``. When it is
+at least the number of arcs of the envelope, the exact box by rotating
+calipers is no more work, and is found instead.
+"""
+
+import bisect
+from math import atan2, ceil, pi, sqrt
+
+from dailyprogrammer.challenges.c20170904e2 import minimumBoundingOrthogonal
+from dailyprogrammer.challenges.c20170904e2.calipers import boundingBoxesEnvelope
+from dailyprogrammer.challenges.c20170904e2.envelope import TAU, support, supportEnvelope
+from dailyprogrammer.challenges.c20170904e2.orientation import OrientationIndex
+from dailyprogrammer.challenges.c20170904e2.prune import pruneDisks
+from dailyprogrammer.utils.logging import moduleLogger
+
+logger = moduleLogger(__name__)
+
+def widthBounds(circles, arcs):
+    """
+    Returns the least width of an envelope over every direction, and the most
+    the width changes per radian
+
+    The width at ``theta`` is ``h(theta) + h(theta + pi)``. Between the starts
+    of arcs at either end it is set by one pair of circles, and is a sinusoid
+    with amplitude the distance between their centres. Its least value is at
+    its trough if that is between the starts, or else at one of them.
+
+    :param list circles: Circles indexed by the envelope
+    :param list arcs: Envelope of ``(theta, index)`` arcs
+    :rtype: 2-tuple of floats, the least width and greatest centre distance
+    """
+    starts = [theta for theta, index in arcs]
+    bounds = sorted(set([0.0, pi] + [theta % pi for theta in starts]))
+    least = float('inf')
+    diameter = 0.0
+    for start, end in zip(bounds, bounds[1:]):
+        middle = (start + end) / 2
+        X, Y, R = circles[arcs[bisect.bisect_right(starts, middle) - 1][1]]
+        x, y, r = circles[arcs[bisect.bisect_right(starts, middle + pi) - 1][1]]
+        dx = X - x
+        dy = Y - y
+        distance = sqrt(dx**2 + dy**2)
+        diameter = max(diameter, distance)
+        trough = (atan2(dy, dx) + pi) % TAU
+        if start <= trough <= end:
+            least = min(least, R + r - distance)
+        else:
+            least = min(least, support((dx, dy, R + r), start), support((dx, dy, R + r), end))
+    return (least, diameter)
+
+def sampling(width, diameter, epsilon):
+    """
+    Returns the number of angles to sample over a quarter turn for a relative
+    error ``epsilon``
+
+    :param float width: Least width of the hull, greater than zero
+    :param float diameter: Most the width changes per radian, greater than zero
+    :param float epsilon: Relative error in area
+    :rtype: int
+    """
+    delta = (sqrt(1 + epsilon) - 1) * width / diameter
+    return int(ceil((pi / 2) / (2 * delta)))
+
+def approximateMinimumBounding(circles, epsilon):
+    """
+    Returns a bounding box with area within ``1 + epsilon`` of the minimum
+
+    :param list circles: A list of circle 3-tuples (x, y, r)
+    :param float epsilon: Relative error in area, greater than zero
+    :rtype: 4-tuple of points, as ``minimumBounding``
+    """
+    if epsilon <= 0:
+        raise ValueError("epsilon must be greater than zero")
+    candidates, removed = pruneDisks(circles)
+    arcs = supportEnvelope(candidates)
+
+    width, diameter = widthBounds(candidates, arcs)
+    if diameter == 0.0:
+        # concentric circles are bounded equally well at any angle
+        return minimumBoundingOrthogonal(candidates)
+    samples = sampling(width, diameter, epsilon) if width > 0.0 else None
+    if samples is None or samples >= len(arcs):
+        logger.info("%s samples needed for %d arcs, finding the exact box", samples, len(arcs))
+        boxes = boundingBoxesEnvelope(candidates, arcs)
+    else:
+        logger.info("Sampling %d angles against %d arcs of %d candidates", samples, len(arcs), len(candidates))
+        boxes = OrientationIndex(candidates, arcs).boxes(k * (pi / 2) / samples for k in range(samples))
+    box, boxArea = min(boxes, key=lambda box: box[1])
+    logger.debug("Best box has area %.6f", boxArea)
+    return box
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+"""
+Rotating calipers minimum bounding box of disks, after Toussaint
+
+A box flush against a hull edge is bounded by the supporting circles in the
+edge's normal direction and at each quarter turn from it. Visiting the hull
+edges in order turns the normal monotonically, so the circle supporting each
+of the four sides only ever moves forward round the envelope. Each side is
+tracked by a caliper, a pointer into the envelope, and all boxes are found in
+O(h) once the envelope is built.
+
+Boxes are the same, and in the same order, as from ``boundingBoxesDisks`` for
+circles in general position. Where circles touch, as integer inputs often
+do, gift wrapping can miss a hull edge that the envelope keeps, so boxes
+here may include a smaller one. Every box is built from the supports of the
+envelope, so bounds every circle only while the envelope is exact.
+"""
+
+from math import atan, pi
+
+from dailyprogrammer.challenges.c20170904e2 import rotatePoint
+from dailyprogrammer.challenges.c20170904e2.envelope import TAU, envelopeEdges, support, supportEnvelope
+from dailyprogrammer.challenges.c20170904e2.store import circleSequence
+from dailyprogrammer.utils.logging import moduleLogger, objectLogger
+
+logger = moduleLogger(__name__)
+
+class Caliper(object):
+    """
+    Tracks the circle supporting an envelope in a moving direction
+
+    Moves are amortised O(1) while the direction turns steadily one way.
+
+    :param list circles: Circles indexed by the envelope
+    :param list arcs: Envelope of ``(theta, index)`` arcs
+    """
+    def __init__(self, circles, arcs):
+        self.logger = objectLogger(self)
+
+        self.circles = circles
+        self.arcs = arcs
+        self.position = 0
+        self.moves = 0
+
+    def support(self, theta):
+        """
+        Returns how far the envelope reaches in direction ``theta``
+
+        :param float theta: Direction in radians
+        :rtype: float
+        """
+        theta %= TAU
+        arcs = self.arcs
+        while arcs[self.position][0] > theta:
+            self.position -= 1
+            self.moves += 1
+        while self.position + 1 < len(arcs) and arcs[self.position + 1][0] <= theta:
+            self.position += 1
+            self.moves += 1
+        return support(self.circles[arcs[self.position][1]], theta)
+
+def boundingBoxesEnvelope(circles, arcs):
+    """
+    Returns bounding boxes against each hull edge of an envelope
+
+    :param list circles: Circles indexed by the envelope
+    :param list arcs: Envelope of ``(theta, index)`` arcs
+    :rtype: generator of (box, area) tuples
+    """
+    edges = envelopeEdges(circles, arcs)
+    if len(edges) < 3:
+        raise ValueError("A hull must have at least three lines - did you provide more than two circles?")
+
+    calipers = [Caliper(circles, arcs) for i in range(4)]
+    for normal, line in edges:
+        m, c = line
+        theta = atan(m)
+        # supports on each side of the box, in the frame rotated by theta
+        reach = [caliper.support(normal + k * pi / 2) for k, caliper in enumerate(calipers)]
+        quarter = int(round((theta - normal) / (pi / 2))) % 4
+        right, top, left, bottom = (reach[(quarter + k) % 4] for k in range(4))
+
+        rotatedBox = ((-left, -bottom), (-left, top), (right, top), (right, -bottom))
+        area = (right + left) * (top + bottom)
+        normalisedBox = tuple(rotatePoint(point, theta) for point in rotatedBox)
+        yield (normalisedBox, area)
+
+    logger.debug("Calipers moved %d times over %d edges", sum(c.moves for c in calipers), len(edges))
+
+def boundingBoxesCalipers(circles):
+    """
+    Returns bounding boxes against each hull edge, as ``boundingBoxesDisks``
+    for circles in general position
+
+    :param list circles: A list of circle 3-tuples (x, y, r)
+    :rtype: generator of (box, area) tuples
+    """
+    circles = circleSequence(circles)
+    for box in boundingBoxesEnvelope(circles, supportEnvelope(circles)):
+        yield box
@@ -0,0 +1,248 @@
+#!/usr/bin/env python
+"""
+Divide and conquer convex hull of disks, after Rappaport
+
+The hull of a disk set is described by its support function; for a
+direction ``theta``, the circle reaching furthest that way::
+
+    h(theta) = max(x cos(theta) + y sin(theta) + r)
+
+In this module an envelope is a list of ``(theta, index)`` arcs, sorted by
+``theta`` and starting at ``0``. Circle ``index`` supports the hull from
+``theta`` up to the start of the next arc, wrapping round at ``2 pi``.
+
+Two envelopes are merged in one pass over their combined arcs, as two
+support functions cross at most twice. Splitting the circles in half and
+merging recursively finds the envelope in O(n log n).
+
+Where the envelope moves from one circle to the next, the hull has a
+straight edge, normal to the direction the change happens at.
+"""
+
+from math import sqrt, atan2, acos, sin, cos, pi
+
+from dailyprogrammer.challenges.c20170904e2.store import circleSequence
+from dailyprogrammer.utils.logging import moduleLogger
+
+logger = moduleLogger(__name__)
+
+INF = float('inf')
+TAU = 2 * pi
+
+# Angles closer than this are treated as equal
+EPSILON = 1e-12
+
+def support(circle, theta):
+    """
+    Returns how far a circle reaches in direction ``theta``
+
+    :param tuple circle: (x, y, r)
+    :param float theta: Direction in radians
+    :rtype: float
+    """
+    x, y, r = circle
+    return x * cos(theta) + y * sin(theta) + r
+
+def crossings(p, q):
+    """
+    Returns the directions in [0, 2 pi) where the supports of ``p`` and ``q`` are equal
+
+    :param tuple p: (x, y, r)
+    :param tuple q: (x, y, r)
+    :rtype: list of floats
+    """
+    dx, dy, dr = (i[0] - i[1] for i in zip(p, q))
+    l = sqrt(dx**2 + dy**2)
+    if l == 0.0 or abs(dr) >= l:
+        return []
+    phi = atan2(dy, dx)
+    alpha = acos(-dr / l)
+    return [(phi + alpha) % TAU, (phi - alpha) % TAU]
+
+def mergeEnvelopes(circles, first, second):
+    """
+    Returns the envelope of the circles of two envelopes
+
+    :param list circles: Circles indexed by the envelopes
+    :param list first: Envelope of ``(theta, index)`` arcs
+    :param list second: As ``first``
+    :rtype: list of ``(theta, index)`` arcs
+    """
+    merged = []
+
+    def append(theta, index):
+        # drop arcs too short to have a meaningful edge either side
+        if merged and theta - merged[-1][0] < EPSILON:
+            theta = merged.pop()[0]
+        if merged and merged[-1][1] == index:
+            return
+        merged.append((theta, index))
+
+    i = j = 0
+    start = 0.0
+    while start < TAU:
+        a = first[i][1]
+        b = second[j][1]
+        endFirst = first[i + 1][0] if i + 1 < len(first) else TAU
+        endSecond = second[j + 1][0] if j + 1 < len(second) else TAU
+        end = min(endFirst, endSecond)
+
+        p = circles[a]
+        q = circles[b]
+        ties = crossings(p, q)
+        if not ties:
+            # one disk contains the other, perhaps touching it from inside,
+            # where the supports are equal in one direction
+            append(start, a if p[2] >= q[2] else b)
+        else:
+            splits = sorted(t for t in ties if start + EPSILON < t < end - EPSILON)
+            bounds = [start] + splits + [end]
+            for t0, t1 in zip(bounds, bounds[1:]):
+                middle = (t0 + t1) / 2
+                winner = a if support(p, middle) >= support(q, middle) else b
+                append(t0, winner)
+
+        if endFirst == end:
+            i += 1
+        if endSecond == end:
+            j += 1
+        start = end
+
+    return merged
+
+def supportEnvelope(circles, indices=None):
+    """
+    Returns the envelope of a set of circles
+
+    :param list circles: A list of circle 3-tuples (x, y, r)
+    :param list indices: Indices of ``circles`` to use, defaults to all
+    :rtype: list of ``(theta, index)`` arcs
+    """
+    if indices is None:
+        indices = range(len(circles))
+    if len(indices) == 0:
+        raise ValueError("An envelope needs at least one circle")
+    if len(indices) == 1:
+        return [(0.0, indices[0])]
+    middle = len(indices) // 2
+    first = supportEnvelope(circles, indices[:middle])
+    second = supportEnvelope(circles, indices[middle:])
+    return mergeEnvelopes(circles, first, second)
+
+def hullIndices(arcs):
+    """
+    Returns the indices of circles on the hull, in order of first appearance
+
+    :param list arcs: Envelope of ``(theta, index)`` arcs
+    :rtype: list of ints
+    """
+    seen = set()
+    indices = []
+    for theta, index in arcs:
+        if index not in seen:
+            seen.add(index)
+            indices.append(index)
+    return indices
+
+def breakpoints(arcs):
+    """
+    Returns ``(theta, previous, next)`` for each direction the supporting circle changes
+
+    :param list arcs: Envelope of ``(theta, index)`` arcs
+    :rtype: list of 3-tuples
+    """
+    changes = [(theta, arcs[k - 1][1], index) for k, (theta, index) in enumerate(arcs) if k > 0]
+    if len(arcs) > 1 and arcs[-1][1] != arcs[0][1]:
+        changes.insert(0, (0.0, arcs[-1][1], arcs[0][1]))
+    return changes
+
+def edgeLine(theta, reach):
+    """
+    Returns the (m, c) line of a hull edge with outward normal ``theta``
+
+    Vertical lines are returned as ``(INF, x)``, as elsewhere in this challenge.
+
+    :param float theta: Direction of the edge normal
+    :param float reach: Support in that direction
+    :rtype: 2-tuple
+    """
+    s = sin(theta)
+    c = cos(theta)
+    if abs(s) < EPSILON:
+        return (INF, reach / c)
+    if abs(c) < EPSILON:
+        return (0.0, reach / s)
+    return (-c / s, reach / s)
+
+def isUpperEdge(theta):
+    """
+    Returns whether an edge with outward normal ``theta`` is on the upper hull
+
+    The left vertical edge belongs to the upper hull, and the right to the lower.
+
+    :param float theta:
+    :rtype: bool
+    """
+    s = sin(theta)
+    if abs(s) < EPSILON:
+        return cos(theta) < 0
+    return s > 0
+
+def envelopeEdges(circles, arcs):
+    """
+    Returns ``(theta, line)`` for each hull edge of an envelope, in the order
+    of ``convexHullDisks``, where ``theta`` is the edge's outward normal
+
+    The upper hull runs left to right, then the lower hull right to left, so
+    ``theta`` decreases from ``pi`` round to ``pi`` again. A half with no
+    edges is given a horizontal line along its extreme circle.
+
+    :param list circles: A list of circle 3-tuples (x, y, r)
+    :param list arcs: Envelope of ``(theta, index)`` arcs
+    :rtype: list of 2-tuples
+    """
+    upper = []
+    lower = []
+    for theta, previous, following in breakpoints(arcs):
+        line = edgeLine(theta, support(circles[following], theta))
+        if isUpperEdge(theta):
+            # measured from the left vertical, clockwise
+            upper.append(((pi - theta) % TAU, theta, line))
+        else:
+            # measured from the right vertical, clockwise
+            lower.append(((TAU - theta) % TAU, theta, line))
+
+    for half, bottom in ((upper, False), (lower, True)):
+        half.sort(key=lambda item: item[0] if item[0] < TAU - EPSILON else 0.0)
+        if not half:
+            if bottom:
+                c = min(y - r for x, y, r in circles)
+                half.append((0.0, 3 * pi / 2, (0.0, c)))
+            else:
+                c = max(y + r for x, y, r in circles)
+                half.append((0.0, pi / 2, (0.0, c)))
+
+    return [(theta, line) for key, theta, line in upper + lower]
+
+def envelopeLines(circles, arcs):
+    """
+    Returns the hull lines of an envelope, in the order of ``convexHullDisks``
+
+    :param list circles: A list of circle 3-tuples (x, y, r)
+    :param list arcs: Envelope of ``(theta, index)`` arcs
+    :rtype: List of (m, c) lines
+    """
+    return [line for theta, line in envelopeEdges(circles, arcs)]
+
+def convexHullDisksDivide(circles):
+    """
+    Returns a set of lines describing the convex hull of the disk set, as
+    ``convexHullDisks``, by divide and conquer
+
+    :param list circles: A list of circle 3-tuples (x, y, r)
+    :rtype: List of (m, c) lines
+    """
+    circles = circleSequence(circles)
+    arcs = supportEnvelope(circles)
+    logger.debug("Envelope; %s", arcs)
+    return envelopeLines(circles, arcs)
@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+"""
+Minimum bounding boxes for a sequence of frames of slowly moving circles
+
+Circle ``i`` of one frame is taken to be circle ``i`` of the last, moved.
+Rather than building each frame's hull from every circle, the circles on the
+last hull are kept, and every other circle carries a certificate: its slack,
+a lower bound on how far it is inside the hull.
+
+Between frames, a circle's support in any direction moves by at most
+``delta``, the distance its centre moved plus its change in radius. The hull
+reaches at least as far as the last hull circles do, so it shrinks by at most
+their largest ``delta``. Slack is reduced by both each frame, and only
+circles whose slack runs out are added back to the hull search.
+
+Slack is measured exactly against the hull's support envelope. The hull is
+rebuilt from every circle on the first frame, when the number of circles
+changes, or when too many certificates expire at once.
+"""
+
+from math import atan2, pi, sqrt
+
+from dailyprogrammer.challenges.c20170904e2.calipers import boundingBoxesEnvelope
+from dailyprogrammer.challenges.c20170904e2.envelope import TAU, hullIndices, support, supportEnvelope
+from dailyprogrammer.utils.logging import moduleLogger, objectLogger
+
+logger = moduleLogger(__name__)
+
+# Circles must be inside by more than this to keep a certificate
+MARGIN = 1e-9
+
+def displacement(before, after):
+    """
+    Returns the most a circle's support moves in any direction between frames
+
+    :param tuple before: (x, y, r)
+    :param tuple after: (x, y, r)
+    :rtype: float
+    """
+    return sqrt((after[0] - before[0])**2 + (after[1] - before[1])**2) + abs(after[2] - before[2])
+
+def slack(circles, arcs, circle):
+    """
+    Returns how far a circle is inside the hull of an envelope, the least
+    difference in support over every direction
+
+    Against one arc's circle the difference is a sinusoid, so its least value
+    is at its trough if that is on the arc, or else at an end of the arc.
+
+    :param list circles: Circles indexed by the envelope
+    :param list arcs: Envelope of ``(theta, index)`` arcs
+    :param tuple circle: (x, y, r)
+    :rtype: float
+    """
+    x, y, r = circle
+    least = float('inf')
+    ends = [theta for theta, index in arcs[1:]] + [TAU]
+    for (start, index), end in zip(arcs, ends):
+        X, Y, R = circles[index]
+        dx = X - x
+        dy = Y - y
+        trough = (atan2(dy, dx) + pi) % TAU
+        if start <= trough <= end:
+            least = min(least, R - r - sqrt(dx**2 + dy**2))
+        else:
+            least = min(least, support((dx, dy, R - r), start), support((dx, dy, R - r), end))
+    return least
+
+class KineticHull(object):
+    """
+    Hull of a set of moving circles, updated a frame at a time
+
+    :param float rebuildFraction: Rebuild from every circle when more than
+        this fraction of certificates expire in one frame
+    """
+    def __init__(self, rebuildFraction=0.25):
+        self.logger = objectLogger(self)
+
+        self.rebuildFraction = rebuildFraction
+        self.circles = None
+        self.hull = []
+        self.slack = []
+        self.rebuilds = 0
+        self.repairs = 0
+
+    def certify(self, circles, arcs, indices):
+        """
+        Set the slack of circles ``indices`` against the current hull
+
+        :param list circles: This frame's circles
+        :param list arcs: This frame's envelope
+        :param indices: Indices of circles not on the hull
+        """
+        for i in indices:
+            self.slack[i] = slack(circles, arcs, circles[i])
+
+    def rebuild(self, circles):
+        """
+        Returns the envelope of every circle, certifying those not on the hull
+        """
+        self.rebuilds += 1
+        arcs = supportEnvelope(circles)
+        self.hull = sorted(hullIndices(arcs))
+        self.slack = [0.0] * len(circles)
+        onHull = set(self.hull)
+        self.certify(circles, arcs, [i for i in range(len(circles)) if i not in onHull])
+        return arcs
+
+    def repair(self, circles):
+        """
+        Returns the envelope of the hull circles and any circles whose
+        certificates expired, or ``None`` if too many expired
+        """
+        previous = self.circles
+        shrink = max(displacement(previous[i], circles[i]) for i in self.hull)
+        onHull = set(self.hull)
+
+        expired = []
+        for i, (before, after) in enumerate(zip(previous, circles)):
+            if i in onHull:
+                continue
+            self.slack[i] -= displacement(before, after) + shrink
+            if self.slack[i] <= MARGIN:
+                expired.append(i)
+        if len(expired) > self.rebuildFraction * len(circles):
+            self.logger.debug("%d certificates expired, rebuilding", len(expired))
+            return None
+
+        self.repairs += 1
+        arcs = supportEnvelope(circles, sorted(self.hull + expired))
+        self.hull = sorted(hullIndices(arcs))
+        # circles that are new to the interior need a certificate
+        current = set(self.hull)
+        self.certify(circles, arcs, [i for i in expired + list(onHull) if i not in current])
+        self.logger.debug("Repaired hull with %d expired certificates", len(expired))
+        return arcs
+
+    def update(self, circles):
+        """
+        Returns the minimum bounding box of the next frame, as ``minimumBounding``
+
+        :param list circles: A list of circle 3-tuples (x, y, r)
+        :rtype: 4-tuple of points
+        """
+        circles = [tuple(c) for c in circles]
+        arcs = None
+        if self.circles is not None and len(circles) == len(self.circles):
+            arcs = self.repair(circles)
+        if arcs is None:
+            arcs = self.rebuild(circles)
+        self.circles = circles
+
+        boxes = boundingBoxesEnvelope(circles, arcs)
+        return min(boxes, key=lambda box: box[1])[0]
+
+def minimumBoundingFrames(frames, rebuildFraction=0.25):
+    """
+    Yields the minimum bounding box of each frame of circles
+
+    :param frames: Iterable of lists of circle 3-tuples (x, y, r)
+    :param float rebuildFraction: As ``KineticHull``
+    :rtype: generator of 4-tuples of points
+    """
+    kinetic = KineticHull(rebuildFraction=rebuildFraction)
+    for circles in frames:
+        yield kinetic.update(circles)
+    logger.info("%d rebuilds and %d repairs", kinetic.rebuilds, kinetic.repairs)
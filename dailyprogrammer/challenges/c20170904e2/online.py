@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+"""
+Maintain the hull of a stream of circles, answering box queries as it grows
+
+Only the circles on the hull are kept, with their support envelope. New
+circles are merged into the envelope in one pass, O(h + k) for a batch of
+``k`` once the batch's own envelope is built. A circle inside the hull leaves
+the envelope, and so every cached answer, unchanged.
+"""
+
+import bisect
+from math import pi
+
+from dailyprogrammer.challenges.c20170904e2 import minimumBoundingOrthogonal
+from dailyprogrammer.challenges.c20170904e2.calipers import boundingBoxesEnvelope
+from dailyprogrammer.challenges.c20170904e2.envelope import envelopeLines, mergeEnvelopes, support, supportEnvelope
+from dailyprogrammer.utils.logging import moduleLogger, objectLogger
+
+logger = moduleLogger(__name__)
+
+class OnlineHull(object):
+    """
+    Convex hull of disks that circles can be added to at any time
+
+    :param circles: Optional iterable of circle 3-tuples (x, y, r) to start with
+    """
+    def __init__(self, circles=()):
+        self.logger = objectLogger(self)
+
+        self.circles = []
+        self.arcs = []
+        self.starts = []
+        self.count = 0
+        self.changes = 0
+        self.cache = {}
+        self.extend(circles)
+
+    def __len__(self):
+        return self.count
+
+    def add(self, circle):
+        """
+        Add one circle
+
+        :param tuple circle: (x, y, r)
+        :rtype: bool of whether the hull changed
+        """
+        return self.extend([circle])
+
+    def extend(self, circles):
+        """
+        Add a batch of circles
+
+        :param circles: Iterable of circle 3-tuples (x, y, r)
+        :rtype: bool of whether the hull changed
+        """
+        batch = [tuple(c) for c in circles]
+        if not batch:
+            return False
+        self.count += len(batch)
+
+        offset = len(self.circles)
+        pool = self.circles + batch
+        arcs = supportEnvelope(pool, range(offset, len(pool)))
+        if self.arcs:
+            arcs = mergeEnvelopes(pool, self.arcs, arcs)
+        if all(index < offset for theta, index in arcs):
+            self.logger.debug("Batch of %d inside the hull", len(batch))
+            return False
+
+        # keep only circles on the hull, in the order they were added
+        kept = sorted(set(index for theta, index in arcs))
+        renumber = {old: new for new, old in enumerate(kept)}
+        self.circles = [pool[i] for i in kept]
+        self.arcs = [(theta, renumber[index]) for theta, index in arcs]
+        self.starts = [theta for theta, index in self.arcs]
+        self.changes += 1
+        self.cache = {}
+        self.logger.debug("Hull now has %d circles of %d", len(self.circles), self.count)
+        return True
+
+    def support(self, theta):
+        """
+        Returns how far the hull reaches in direction ``theta``
+
+        :param float theta: Direction in radians
+        :rtype: float
+        """
+        theta %= 2 * pi
+        index = self.arcs[bisect.bisect_right(self.starts, theta) - 1][1]
+        return support(self.circles[index], theta)
+
+    def cached(self, key, function):
+        if key not in self.cache:
+            self.cache[key] = function()
+        return self.cache[key]
+
+    def hull(self):
+        """
+        Returns the hull lines, as ``convexHullDisks``
+
+        :rtype: List of (m, c) lines
+        """
+        def hull():
+            hullLines = envelopeLines(self.circles, self.arcs)
+            if len(hullLines) < 3:
+                raise ValueError("A hull must have at least three lines - did you provide more than two circles?")
+            return hullLines
+        return list(self.cached("hull", hull))
+
+    def minimumBoundingOrthogonal(self):
+        """
+        Returns the axis-aligned bounding box, as ``minimumBoundingOrthogonal``
+
+        :rtype: 4-tuple of points
+        """
+        # the extreme circles are on the hull, so only those need checking
+        return self.cached("orthogonal", lambda: minimumBoundingOrthogonal(self.circles))
+
+    def minimumBounding(self):
+        """
+        Returns the minimum bounding box, as ``minimumBounding``
+
+        :rtype: 4-tuple of points
+        """
+        def minimum():
+            boxes = boundingBoxesEnvelope(self.circles, self.arcs)
+            return min(boxes, key=lambda box: box[1])[0]
+        return self.cached("minimum", minimum)
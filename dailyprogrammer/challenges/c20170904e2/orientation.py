@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+"""
+Bounding boxes of a disk set at any orientation, from its support envelope
+
+The envelope splits directions into arcs, each supported by one hull circle.
+The side of a box facing a direction is set by the circle supporting it, so a
+box at any angle is four lookups by bisection, O(log h).
+
+Batches of angles are answered in angle order, so the supporting circles are
+walked with calipers rather than searched for, O(h + q log q) for ``q``
+angles.
+"""
+
+import bisect
+from math import cos, pi, sin
+
+from dailyprogrammer.challenges.c20170904e2.calipers import Caliper
+from dailyprogrammer.challenges.c20170904e2.envelope import TAU, support, supportEnvelope
+from dailyprogrammer.challenges.c20170904e2.store import circleSequence
+from dailyprogrammer.utils.logging import moduleLogger, objectLogger
+
+logger = moduleLogger(__name__)
+
+def sideBox(theta, right, top, left, bottom):
+    """
+    Returns the box at angle ``theta`` with sides at the given supports, as
+    ``(box, area)`` in the format of ``boundingBoxesDisks``
+
+    :param float theta: Angle of the box's bottom edge
+    :param float right: Support at ``theta``
+    :param float top: Support at ``theta + pi / 2``
+    :param float left: Support at ``theta + pi``
+    :param float bottom: Support at ``theta + 3 pi / 2``
+    :rtype: 2-tuple
+    """
+    c = cos(theta)
+    s = sin(theta)
+    rotatedBox = ((-left, -bottom), (-left, top), (right, top), (right, -bottom))
+    box = tuple((x * c - y * s, x * s + y * c) for x, y in rotatedBox)
+    return (box, (right + left) * (top + bottom))
+
+class OrientationIndex(object):
+    """
+    Answers bounding box queries at any angle
+
+    :param list circles: A list of circle 3-tuples (x, y, r)
+    :param list arcs: Envelope of ``circles``, built if not given
+    """
+    def __init__(self, circles, arcs=None):
+        self.logger = objectLogger(self)
+
+        circles = circleSequence(circles)
+        if arcs is None:
+            arcs = supportEnvelope(circles)
+        # only hull circles are needed
+        kept = sorted(set(index for theta, index in arcs))
+        renumber = {old: new for new, old in enumerate(kept)}
+        self.circles = [circles[i] for i in kept]
+        self.arcs = [(theta, renumber[index]) for theta, index in arcs]
+        self.starts = [theta for theta, index in self.arcs]
+        self.logger.debug("Indexed %d arcs over %d circles", len(self.arcs), len(self.circles))
+
+    def supporting(self, theta):
+        """
+        Returns the circle reaching furthest in direction ``theta``
+
+        :param float theta: Direction in radians
+        :rtype: 3-tuple
+        """
+        return self.circles[self.arcs[bisect.bisect_right(self.starts, theta % TAU) - 1][1]]
+
+    def support(self, theta):
+        """
+        Returns how far the disk set reaches in direction ``theta``
+
+        :param float theta: Direction in radians
+        :rtype: float
+        """
+        return support(self.supporting(theta), theta)
+
+    def box(self, theta):
+        """
+        Returns the bounding box with its bottom edge at angle ``theta``
+
+        :param float theta: Angle in radians
+        :rtype: 2-tuple of box and area
+        """
+        return sideBox(theta, *(self.support(theta + k * pi / 2) for k in range(4)))
+
+    def boxes(self, thetas):
+        """
+        Returns the bounding boxes at each angle, in the order given
+
+        :param thetas: Iterable of angles in radians
+        :rtype: list of 2-tuples of box and area
+        """
+        thetas = list(thetas)
+        order = sorted(range(len(thetas)), key=lambda i: thetas[i] % (pi / 2))
+        calipers = [Caliper(self.circles, self.arcs) for k in range(4)]
+        results = [None] * len(thetas)
+        for i in order:
+            # caliper k faces alpha + k pi / 2, side k - quarter of this box
+            theta = thetas[i]
+            quarter = int((theta % TAU) // (pi / 2)) % 4
+            alpha = theta % TAU - quarter * pi / 2
+            reach = [None] * 4
+            for k, caliper in enumerate(calipers):
+                reach[(k - quarter) % 4] = caliper.support(alpha + k * pi / 2)
+            results[i] = sideBox(theta, *reach)
+        return results
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+"""
+Find hull candidates for large disk sets across a process pool
+
+Circles are copied once into a shared memory buffer of doubles, laid out as
+``x0, y0, r0, x1, y1, r1, ...``, which workers inherit when the pool starts.
+Tasks are then only ``(start, stop)`` ranges. Each worker builds the hull of
+its range by divide and conquer and returns the indices of the circles on it.
+Only circles on a partial hull can be on the full hull, so the final hull is
+built from these candidates alone. This relies on each partial envelope being
+exact, including for disks touching from inside, as integer inputs often do.
+"""
+
+import itertools
+import multiprocessing
+import os
+from array import array
+from multiprocessing.sharedctypes import RawArray
+
+from dailyprogrammer.challenges.c20170904e2.envelope import hullIndices, supportEnvelope
+from dailyprogrammer.challenges.c20170904e2.store import circleSequence
+from dailyprogrammer.utils.logging import moduleLogger
+from dailyprogrammer.utils.pool import imapBounded
+
+logger = moduleLogger(__name__)
+
+def circleBuffer(circles):
+    """
+    Returns circles copied into a shared memory buffer
+
+    :param list circles: A list of circle 3-tuples (x, y, r)
+    :rtype: RawArray of doubles
+    """
+    values = array("d", itertools.chain.from_iterable(circles))
+    buffer = RawArray("d", len(values))
+    memoryview(buffer).cast("B")[:] = memoryview(values).cast("B")
+    return buffer
+
+def bufferCircles(buffer, start, stop):
+    """
+    Returns circles ``start`` to ``stop`` from a shared memory buffer
+
+    :param buffer: RawArray of doubles, as from ``circleBuffer``
+    :param int start:
+    :param int stop:
+    :rtype: list of 3-tuples
+    """
+    values = buffer[3 * start:3 * stop]
+    return list(zip(values[0::3], values[1::3], values[2::3]))
+
+def chunkHull(buffer, start, stop):
+    """
+    Returns the indices of circles ``start`` to ``stop`` on their own hull
+
+    :param buffer: RawArray of doubles, as from ``circleBuffer``
+    :param int start:
+    :param int stop:
+    :rtype: list of ints
+    """
+    circles = bufferCircles(buffer, start, stop)
+    return [start + i for i in hullIndices(supportEnvelope(circles))]
+
+_buffer = None
+
+def _initialise(buffer):
+    global _buffer
+    _buffer = buffer
+
+def _chunkHull(bounds):
+    return chunkHull(_buffer, *bounds)
+
+def hullCandidates(circles, processes=None, chunks=None):
+    """
+    Returns the circles on the hulls of chunks of ``circles``, in their
+    original order
+
+    :param list circles: A list of circle 3-tuples (x, y, r)
+    :param int processes: Worker processes, defaults to the cpu count. ``1`` runs in process
+    :param int chunks: Number of chunks, defaults to four per process
+    :rtype: list of 3-tuples
+    """
+    circles = circleSequence(circles)
+    if processes is None:
+        processes = os.cpu_count() or 1
+    if chunks is None:
+        chunks = 4 * processes
+    chunks = max(min(chunks, len(circles)), 1)
+    bounds = [(len(circles) * k // chunks, len(circles) * (k + 1) // chunks) for k in range(chunks)]
+    bounds = [b for b in bounds if b[0] < b[1]]
+
+    buffer = circleBuffer(circles)
+    candidates = []
+    if processes == 1:
+        for start, stop in bounds:
+            candidates.extend(chunkHull(buffer, start, stop))
+    else:
+        with multiprocessing.Pool(processes, initializer=_initialise, initargs=(buffer,)) as pool:
+            for indices in imapBounded(pool, _chunkHull, bounds, window=4 * processes):
+                candidates.extend(indices)
+
+    candidates.sort()
+    logger.info("Kept %d hull candidates of %d circles from %d chunks", len(candidates), len(circles), len(bounds))
+    return [circles[i] for i in candidates]
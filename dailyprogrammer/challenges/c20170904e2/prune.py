@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+"""
+Discard disks that cannot touch the convex hull, before building it
+
+Two cheap tests are used, each only ever discarding disks inside the hull of
+the others, so the hull is unchanged:
+
+* Akl-Toussaint: the disks reaching furthest in eight compass directions
+  are found. Their hull contains the convex polygon of their centres, grown
+  by the smallest of their radii. A disk inside that grown polygon is
+  discarded.
+* Containment: a disk inside a single larger disk is discarded. Disks left
+  by the first test are registered on a grid, in each cell the centre of a
+  disk they contain could lie in, so the only candidates checked are those
+  registered in the cell of a disk's centre.
+"""
+
+import collections
+from math import cos, floor, pi, sin, sqrt
+
+from dailyprogrammer.challenges.c20170904e2.store import circleSequence
+from dailyprogrammer.utils.logging import moduleLogger, objectLogger
+
+logger = moduleLogger(__name__)
+
+# Disks must be inside by more than this to be discarded
+MARGIN = 1e-9
+
+# Cells are at least the largest radius divided by this
+GRID_SPAN = 8
+
+DIRECTIONS = [(cos(k * pi / 4), sin(k * pi / 4)) for k in range(8)]
+
+def cross(o, a, b):
+    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+def convexPolygon(points):
+    """
+    Returns the convex hull of points, anticlockwise, by monotone chain
+
+    :param list points: (x, y) tuples
+    :rtype: list of (x, y) tuples
+    """
+    points = sorted(set(points))
+    if len(points) < 3:
+        return points
+    lower = []
+    upper = []
+    for p in points:
+        while len(lower) >= 2 and cross(lower[-2], lower[-1], p) <= 0:
+            lower.pop()
+        lower.append(p)
+    for p in reversed(points):
+        while len(upper) >= 2 and cross(upper[-2], upper[-1], p) <= 0:
+            upper.pop()
+        upper.append(p)
+    return lower[:-1] + upper[:-1]
+
+def extremeDisks(circles):
+    """
+    Returns the indices of disks reaching furthest in eight compass directions
+
+    :param list circles: A list of circle 3-tuples (x, y, r)
+    :rtype: set of ints
+    """
+    extremes = set()
+    for u, v in DIRECTIONS:
+        extremes.add(max(range(len(circles)), key=lambda i: circles[i][0] * u + circles[i][1] * v + circles[i][2]))
+    return extremes
+
+def insetDistance(polygon, point):
+    """
+    Returns how far a point is inside a convex polygon, negative if outside
+
+    :param list polygon: Anticlockwise (x, y) vertices
+    :param tuple point: (x, y)
+    :rtype: float
+    """
+    distance = float('inf')
+    for a, b in zip(polygon, polygon[1:] + polygon[:1]):
+        length = sqrt((b[0] - a[0])**2 + (b[1] - a[1])**2)
+        distance = min(distance, cross(a, b, point) / length)
+    return distance
+
+class ContainmentGrid(object):
+    """
+    Grid of the cells that centres of disks inside each disk could lie in
+
+    :param list circles: A list of circle 3-tuples (x, y, r)
+    :param float size: Width of each cell
+    """
+    def __init__(self, circles, size):
+        self.logger = objectLogger(self)
+
+        self.circles = circles
+        self.size = size
+        self.cells = collections.defaultdict(list)
+        smallest = min(r for x, y, r in circles)
+        for i, (x, y, r) in enumerate(circles):
+            # a disk inside this one has its centre within reach of ours
+            reach = r - smallest
+            columns = range(int(floor((x - reach) / size)), int(floor((x + reach) / size)) + 1)
+            rows = range(int(floor((y - reach) / size)), int(floor((y + reach) / size)) + 1)
+            for column in columns:
+                for row in rows:
+                    self.cells[(column, row)].append(i)
+        self.logger.debug("Registered disks in %d cells", len(self.cells))
+
+    def container(self, i):
+        """
+        Returns the index of a disk strictly containing disk ``i``, or ``None``
+
+        :param int i:
+        :rtype: int
+        """
+        x, y, r = self.circles[i]
+        for j in self.cells.get((int(floor(x / self.size)), int(floor(y / self.size))), ()):
+            cx, cy, cr = self.circles[j]
+            if sqrt((x - cx)**2 + (y - cy)**2) + r < cr - MARGIN:
+                return j
+        return None
+
+def pruneDisks(circles):
+    """
+    Returns the disks that may touch the convex hull, in their original order
+
+    :param list circles: A list of circle 3-tuples (x, y, r)
+    :rtype: 2-tuple of the kept circles list and the number of circles removed
+    """
+    circles = circleSequence(circles)
+    if len(circles) < 4:
+        return (circles, 0)
+
+    keep = [True] * len(circles)
+
+    extremes = extremeDisks(circles)
+    polygon = convexPolygon([circles[i][:2] for i in extremes])
+    if len(polygon) >= 3:
+        grow = min(circles[i][2] for i in extremes)
+        for i, (x, y, r) in enumerate(circles):
+            if i not in extremes and r < insetDistance(polygon, (x, y)) + grow - MARGIN:
+                keep[i] = False
+    octagon = keep.count(False)
+
+    kept = [c for c, k in zip(circles, keep) if k]
+    radii = sorted(c[2] for c in kept)
+    size = max(2 * radii[len(radii) // 2], radii[-1] / GRID_SPAN)
+    if size > 0:
+        grid = ContainmentGrid(kept, size)
+        kept = [c for i, c in enumerate(kept) if grid.container(i) is None]
+    removed = len(circles) - len(kept)
+    logger.info("Pruned %d of %d disks; %d by extreme points, %d by containment", removed, len(circles), octagon, removed - octagon)
+    return (kept, removed)
@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+"""
+Compact storage for large numbers of circles
+
+A list of ``(x, y, r)`` tuples costs a tuple and three float objects per
+circle, around 150 bytes. ``CircleStore`` keeps x, y and r in three typed
+arrays instead, 24 bytes per circle as doubles or 12 as single precision
+floats.
+
+A store is a sequence of circle 3-tuples, so can be passed anywhere a list
+of circles is. Tuples are only made as circles are read, and the functions
+of this challenge use a store as it is rather than copying it to a list.
+"""
+
+from array import array
+import collections.abc
+from math import cos, sin
+import operator
+
+from dailyprogrammer.utils.logging import moduleLogger
+
+logger = moduleLogger(__name__)
+
+# Array typecodes of double and single precision floats
+TYPECODES = ("d", "f")
+
+def circleSequence(circles):
+    """
+    Returns circles as a sequence, only copying iterables that are not one already
+
+    :param circles: An iterable of circle 3-tuples (x, y, r)
+    :rtype: sequence of 3-tuples
+    """
+    if isinstance(circles, collections.abc.Sequence):
+        return circles
+    return list(circles)
+
+class CircleStore(collections.abc.Sequence):
+    """
+    Sequence of circles stored as columns of x, y and r
+
+    :param circles: Optional iterable of circle 3-tuples (x, y, r) to start with
+    :param string typecode: ``d`` for doubles, or ``f`` for single precision
+    """
+    def __init__(self, circles=(), typecode="d"):
+        if typecode not in TYPECODES:
+            raise ValueError("Unknown circle store typecode '{0}'".format(typecode))
+        self.typecode = typecode
+        self.xs = array(typecode)
+        self.ys = array(typecode)
+        self.rs = array(typecode)
+        self.extend(circles)
+
+    @classmethod
+    def fromColumns(cls, xs, ys, rs, typecode="d"):
+        """
+        Returns a store of circles given as separate columns
+
+        :param xs: Iterable of x coordinates
+        :param ys: Iterable of y coordinates
+        :param rs: Iterable of radii
+        :param string typecode: As ``CircleStore``
+        :rtype: CircleStore
+        """
+        store = cls(typecode=typecode)
+        store.xs = array(typecode, xs)
+        store.ys = array(typecode, ys)
+        store.rs = array(typecode, rs)
+        if not len(store.xs) == len(store.ys) == len(store.rs):
+            raise ValueError("Circle columns must be the same length")
+        return store
+
+    def __len__(self):
+        return len(self.xs)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return CircleStore.fromColumns(self.xs[index], self.ys[index], self.rs[index], typecode=self.typecode)
+        return (self.xs[index], self.ys[index], self.rs[index])
+
+    def __iter__(self):
+        return zip(self.xs, self.ys, self.rs)
+
+    def __eq__(self, other):
+        if isinstance(other, CircleStore):
+            return self.xs == other.xs and self.ys == other.ys and self.rs == other.rs
+        if isinstance(other, collections.abc.Sequence):
+            return len(self) == len(other) and all(a == tuple(b) for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "CircleStore(<{0} circles>, typecode='{1}')".format(len(self), self.typecode)
+
+    @property
+    def nbytes(self):
+        """
+        Bytes used by the stored values
+        """
+        return 3 * self.xs.itemsize * len(self)
+
+    def append(self, circle):
+        """
+        Add one circle
+
+        :param tuple circle: (x, y, r)
+        """
+        x, y, r = circle
+        self.xs.append(x)
+        self.ys.append(y)
+        self.rs.append(r)
+
+    def extend(self, circles):
+        """
+        Add circles from an iterable, read lazily
+
+        :param circles: Iterable of circle 3-tuples (x, y, r)
+        """
+        if isinstance(circles, CircleStore):
+            self.xs.extend(circles.xs)
+            self.ys.extend(circles.ys)
+            self.rs.extend(circles.rs)
+            return
+        for circle in circles:
+            self.append(circle)
+
+    def columns(self):
+        """
+        Returns the x, y and r columns
+
+        :rtype: 3-tuple of arrays
+        """
+        return (self.xs, self.ys, self.rs)
+
+    def extents(self):
+        """
+        Returns how far the circles reach along each axis
+
+        :rtype: 4-tuple of xmin, xmax, ymin, ymax
+        """
+        if not len(self):
+            raise ValueError("No circles to find the extents of")
+        return (min(map(operator.sub, self.xs, self.rs)), max(map(operator.add, self.xs, self.rs)),
+                min(map(operator.sub, self.ys, self.rs)), max(map(operator.add, self.ys, self.rs)))
+
+    def rotated(self, theta):
+        """
+        Returns a store of the circles rotated by ``theta`` radians anti-clockwise
+        about the origin, as doubles so as not to round them again
+
+        :param float theta: Angle to rotate by
+        :rtype: CircleStore
+        """
+        c = cos(theta)
+        s = sin(theta)
+        return CircleStore.fromColumns((x * c - y * s for x, y in zip(self.xs, self.ys)),
+                                       (x * s + y * c for x, y in zip(self.xs, self.ys)),
+                                       self.rs)
@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+"""
+Find the minimum bounding box of circle files too large to hold in memory
+
+Circles are read in chunks. After each chunk only the circles on the hull of
+the candidates so far are kept, as no other circle can be on the final hull
+or touch a bounding box. Memory is bounded by the chunk size plus the hull.
+
+Candidates are kept in input order, and the hull of the candidates is the
+hull of the whole file. For circles in general position the box found is the
+same as from reading the whole file. Where circles share a tangent line, as
+integer inputs can, gift wrapping is sensitive to which circles it is given,
+so may find a different box, which still bounds every circle.
+"""
+
+from dailyprogrammer.challenges.c20170904e2.envelope import hullIndices, supportEnvelope
+from dailyprogrammer.utils.logging import moduleLogger
+from dailyprogrammer.utils.structures import chunks
+
+logger = moduleLogger(__name__)
+
+CHUNK_SIZE = 65536
+
+def hullCandidatesStream(circles, chunkSize=CHUNK_SIZE):
+    """
+    Returns the circles on the hull of an iterable of circles, in input order
+
+    :param circles: An iterable of circle 3-tuples (x, y, r)
+    :param int chunkSize: Circles read between reductions
+    :rtype: list of 3-tuples
+    """
+    candidates = []
+    count = 0
+    for chunk in chunks(circles, chunkSize):
+        count += len(chunk)
+        pool = candidates + chunk
+        candidates = [pool[i] for i in sorted(hullIndices(supportEnvelope(pool)))]
+        logger.debug("Kept %d candidates after %d circles", len(candidates), count)
+    logger.info("Kept %d hull candidates of %d circles", len(candidates), count)
+    return candidates
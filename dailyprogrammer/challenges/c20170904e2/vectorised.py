@@ -0,0 +1,220 @@
+#!/usr/bin/env python
+"""
+NumPy backend for the hull and box searches
+
+Circles are held as an (n, 3) float array of (x, y, r) rows. Gift wrapping
+finds the co-tangents from the current circle to every circle in one batch,
+and every hull edge's rotation and box area is evaluated in one broadcast.
+Results are the same as the tuple functions in the challenge module.
+
+NumPy is optional. Without it, the functions here call the tuple path.
+"""
+
+from math import pi
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from dailyprogrammer.challenges.c20170904e2.store import CircleStore, circleSequence
+from dailyprogrammer.utils.logging import moduleLogger
+
+logger = moduleLogger(__name__)
+
+HAVE_NUMPY = np is not None
+
+INF = float('inf')
+
+def circleArray(circles):
+    """
+    Returns circles as an (n, 3) float array
+
+    A ``CircleStore`` is read from its columns without making tuples
+
+    :param list circles: A list of circle 3-tuples (x, y, r)
+    :rtype: numpy.ndarray
+    """
+    if isinstance(circles, CircleStore):
+        dtype = np.float32 if circles.typecode == "f" else np.float64
+        return np.column_stack([np.frombuffer(column, dtype=dtype) for column in circles.columns()]).astype(float)
+    return np.asarray(circles, dtype=float).reshape(-1, 3)
+
+def coTangents(p, circles, anticlockwise=False):
+    """
+    Returns the co-tangents from ``p`` to each circle, as ``coTangent``
+
+    Circles ``coTangent`` would raise a ``GeometryException`` for are marked
+    invalid.
+
+    :param tuple p: A 3-tuple representing the circle (x, y, r)
+    :param circles: An (n, 3) array of circles
+    :rtype: 4-tuple of arrays, tangent points on p (n, 2), tangent points on
+        the circles (n, 2), lines (n, 2) and valid (n,)
+    """
+    px, py, pr = p
+    qx, qy, qr = circles[:, 0], circles[:, 1], circles[:, 2]
+    dx = qx - px
+    dy = qy - py
+    dr = qr - pr
+
+    lowerHull = (dx < 0.0) | ((dx == 0.0) & (dy < 0.0))
+    mirror = np.where(lowerHull != anticlockwise, -1.0, 1.0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        l = np.sqrt(dx**2 + dy**2)
+        phi = np.where(dx == 0.0, pi / 2, np.arctan(dy / dx))
+        ratio = dr / l
+        valid = (l != 0.0) & (np.abs(ratio) <= 1.0)
+        theta = np.arcsin(np.where(valid, ratio, 0.0))
+        psi = phi + theta
+
+        s = np.sin(psi)
+        c = np.cos(psi)
+        tp = np.stack((px - (s * pr * mirror), py + (c * pr * mirror)), axis=1)
+        tq = np.stack((qx - (s * qr * mirror), qy + (c * qr * mirror)), axis=1)
+
+        tdx = tq[:, 0] - tp[:, 0]
+        tdy = tq[:, 1] - tp[:, 1]
+        vertical = tdx == 0.0
+        m = np.where(vertical, INF, tdy / tdx)
+        intercept = np.where(vertical, tp[:, 0], tp[:, 1] - (m * tp[:, 0]))
+
+    return (tp, tq, np.stack((m, intercept), axis=1), valid)
+
+def intraTangents(p, circles, bottom=False):
+    """
+    Returns the co-tangents from ``p`` on the requested half of the hull, as
+    ``intraTangents``
+
+    :param tuple p: A 3-tuple representing the circle (x, y, r)
+    :param circles: An (n, 3) array of circles
+    :rtype: 2-tuple of lines (n, 2) and valid (n,) arrays
+    """
+    tp, tq, lines, valid = coTangents(p, circles)
+    dx = tq[:, 0] - tp[:, 0]
+    dy = tq[:, 1] - tp[:, 1]
+    lowerHull = (dx < 0.0) | ((dx == 0.0) & (dy < 0.0))
+    return (lines, valid & (lowerHull == bottom))
+
+def convexHullDisksHalfVectorised(circles, bottom=False):
+    """
+    Returns a set of lines describing half a convex hull of the disk set, as
+    ``convexHullDisksHalf``
+
+    :param list circles: A list of circle 3-tuples (x, y, r)
+    :rtype: List of (m, c) lines
+    """
+    from dailyprogrammer.challenges.c20170904e2 import findStartingCircle, minimumBoundingOrthogonal
+
+    if not isinstance(circles, CircleStore):
+        circles = [tuple(c) for c in circles]
+    array = circleArray(circles)
+
+    currentCircle = findStartingCircle(circles, bottom=bottom)
+    hullLines = []
+    while True:
+        lines, valid = intraTangents(currentCircle, array, bottom=bottom)
+
+        # Only tangents less steep than the last keep the hull convex
+        if hullLines:
+            valid &= lines[:, 0] < hullLines[-1][0]
+
+        if valid.any():
+            # Steepest tangent, earliest circle on ties
+            k = int(np.argmax(np.where(valid, lines[:, 0], -INF)))
+            hullLines.append((float(lines[k, 0]), float(lines[k, 1])))
+            currentCircle = circles[k]
+        else:
+            if not hullLines:
+                bl, tl, tr, br = minimumBoundingOrthogonal(circles)
+                hullLines.append((0.0, bl[1] if bottom else tl[1]))
+            break
+    return hullLines
+
+def convexHullDisksVectorised(circles):
+    """
+    Returns a set of lines describing the convex hull of the disk set, as
+    ``convexHullDisks`` by gift wrapping
+
+    :param list circles: A list of circle 3-tuples (x, y, r)
+    :rtype: List of (m, c) lines
+    """
+    if not HAVE_NUMPY:
+        from dailyprogrammer.challenges.c20170904e2 import convexHullDisksHalf
+        logger.info("NumPy is not installed, using the tuple path")
+        return convexHullDisksHalf(circles) + convexHullDisksHalf(circles, bottom=True)
+    return convexHullDisksHalfVectorised(circles) + convexHullDisksHalfVectorised(circles, bottom=True)
+
+def boundingBoxesArrays(circles, hullLines):
+    """
+    Returns the bounding box against every hull line, as arrays
+
+    :param list circles: A list of circle 3-tuples (x, y, r)
+    :param list hullLines: List of (m, c) lines
+    :rtype: 2-tuple of boxes (h, 4, 2) and areas (h,) arrays
+    """
+    array = circleArray(circles)
+    theta = np.arctan(np.asarray([m for m, c in hullLines], dtype=float))[:, None]
+    cosTheta = np.cos(theta)
+    sinTheta = np.sin(theta)
+    x, y, r = array[:, 0], array[:, 1], array[:, 2]
+
+    # rotate every circle by -theta for every line at once, (h, n)
+    xRotated = x * cosTheta + y * sinTheta
+    yRotated = y * cosTheta - x * sinTheta
+    xmin = (xRotated - r).min(axis=1)
+    xmax = (xRotated + r).max(axis=1)
+    ymin = (yRotated - r).min(axis=1)
+    ymax = (yRotated + r).max(axis=1)
+    areas = (xmax - xmin) * (ymax - ymin)
+
+    # corners from the bottom-left clockwise, rotated back by theta
+    cornersX = np.stack((xmin, xmin, xmax, xmax), axis=1)
+    cornersY = np.stack((ymin, ymax, ymax, ymin), axis=1)
+    boxes = np.stack((cornersX * cosTheta - cornersY * sinTheta,
+                      cornersX * sinTheta + cornersY * cosTheta), axis=2)
+    return (boxes, areas)
+
+def boxTuple(box):
+    return tuple((float(x), float(y)) for x, y in box)
+
+def boundingBoxesVectorised(circles, method="wrap"):
+    """
+    Returns bounding boxes against each hull line, as ``boundingBoxesDisks``
+
+    :param list circles: A list of circle 3-tuples (x, y, r)
+    :param string method: Hull algorithm to use, as ``convexHullDisks``
+    :rtype: generator of (box, area) tuples
+    """
+    from dailyprogrammer.challenges.c20170904e2 import boundingBoxesDisks, convexHullDisks
+
+    if not HAVE_NUMPY:
+        logger.info("NumPy is not installed, using the tuple path")
+        for box in boundingBoxesDisks(circles, method=method):
+            yield box
+        return
+
+    circles = circleSequence(circles)
+    boxes, areas = boundingBoxesArrays(circles, convexHullDisks(circles, method=method))
+    for box, area in zip(boxes, areas):
+        yield (boxTuple(box), float(area))
+
+def minimumBoundingVectorised(circles, method="wrap"):
+    """
+    Returns the minimum bounding box, as ``minimumBounding``
+
+    :param list circles: A list of circle 3-tuples (x, y, r)
+    :param string method: Hull algorithm to use, as ``convexHullDisks``
+    :rtype: 4-tuple of floats
+    """
+    from dailyprogrammer.challenges.c20170904e2 import convexHullDisks, minimumBounding
+
+    if not HAVE_NUMPY:
+        logger.info("NumPy is not installed, using the tuple path")
+        return minimumBounding(circles, method=method)
+
+    circles = circleSequence(circles)
+    boxes, areas = boundingBoxesArrays(circles, convexHullDisks(circles, method=method))
+    # first smallest, as min() would choose
+    return boxTuple(boxes[int(np.argmin(areas))])
@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+"""
+Solve a stream of independent problems with one challenge
+
+Problems are read lazily, either separated by blank lines or as JSON lines,
+and sent to a process pool in chunks, so the cost of dispatch is shared by
+many small problems. Results are yielded in input order.
+"""
+
+import importlib
+import json
+import multiprocessing
+import os
+
+from dailyprogrammer.utils.logging import moduleLogger
+from dailyprogrammer.utils.pool import imapBounded
+from dailyprogrammer.utils.structures import chunks
+
+logger = moduleLogger(__name__)
+
+FORMATS = ("blank", "json")
+CHUNK_SIZE = 64
+
+# Challenge options overridden in pool workers, which cannot start pools of their own
+WORKER_OPTIONS = {"processes": 1}
+
+# Result given in place of a problem that raised
+ERROR_FORMAT = "Error: {0}: {1}"
+
+def readProblems(lines, format="blank"):
+    """
+    Yields challenge inputs from an iterable of lines, such as a file
+
+    ``blank`` problems are runs of lines separated by one or more blank lines.
+    ``json`` problems are one per line, each a JSON string of the challenge
+    input, or a list of rows, such as circles, written one row per line with
+    values separated by commas.
+
+    :param lines: Iterable of strings
+    :param string format: One of ``FORMATS``
+    :rtype: generator of strings
+    """
+    if format == "blank":
+        problem = []
+        for line in lines:
+            line = line.strip()
+            if line:
+                problem.append(line)
+            elif problem:
+                yield "\n".join(problem)
+                problem = []
+        if problem:
+            yield "\n".join(problem)
+    elif format == "json":
+        for line in lines:
+            if not line.strip():
+                continue
+            problem = json.loads(line)
+            if isinstance(problem, list):
+                problem = "\n".join(",".join(str(value) for value in row) for row in problem)
+            yield problem
+    else:
+        raise ValueError("Unknown batch format '{0}'".format(format))
+
+def formatResults(results, format="blank"):
+    """
+    Yields results as lines of output in the given format, blank lines
+    between results or one JSON string per line
+
+    :param results: Iterable of strings
+    :param string format: One of ``FORMATS``
+    :rtype: generator of strings
+    """
+    for i, result in enumerate(results):
+        if format == "json":
+            yield json.dumps(result)
+        else:
+            if i:
+                yield ""
+            yield result
+
+def solveChunk(challenge, options, problems):
+    """
+    Returns the results of a challenge for a list of problems
+
+    A problem that raises is logged, and ``ERROR_FORMAT`` of its exception
+    given as its result, so one bad problem does not lose the rest.
+
+    :param module challenge: Imported challenge module
+    :param dict options: Challenge keyword options
+    :param list problems: Challenge inputs
+    :rtype: list of strings
+    """
+    results = []
+    for problem in problems:
+        try:
+            results.append(challenge.main(problem, **options))
+        except Exception as e:
+            logger.exception("Failed to solve problem starting '%s'", problem.split("\n", 1)[0])
+            results.append(ERROR_FORMAT.format(type(e).__name__, e))
+    return results
+
+# Challenge module and options, set once per worker process
+_challenge = None
+_options = None
+
+def _initialise(challengeModule, options):
+    global _challenge, _options
+    _challenge = importlib.import_module(challengeModule)
+    _options = options
+
+def _solveChunk(problems):
+    return solveChunk(_challenge, _options, problems)
+
+def solveBatch(challengeModule, problems, options=None, processes=None, chunkSize=CHUNK_SIZE):
+    """
+    Yields the result of a challenge for each problem, in input order
+
+    In a pool, options in ``WORKER_OPTIONS`` that the challenge takes are
+    overridden, so challenges run in each worker process.
+
+    :param string challengeModule: Importable challenge module name
+    :param problems: Iterable of challenge inputs, read lazily
+    :param dict options: Challenge keyword options
+    :param int processes: Worker processes, defaults to the cpu count. ``1`` runs in process
+    :param int chunkSize: Problems sent to a worker at a time
+    :rtype: generator of strings
+    """
+    if options is None:
+        options = {}
+    if processes is None:
+        processes = os.cpu_count() or 1
+
+    count = 0
+    if processes == 1:
+        challenge = importlib.import_module(challengeModule)
+        for chunk in chunks(problems, chunkSize):
+            count += len(chunk)
+            for result in solveChunk(challenge, options, chunk):
+                yield result
+    else:
+        overridden = {k: v for k, v in WORKER_OPTIONS.items() if k in options and options[k] != v}
+        if overridden:
+            logger.info("Overriding %s in batch workers", overridden)
+            options = dict(options, **overridden)
+        with multiprocessing.Pool(processes, initializer=_initialise, initargs=(challengeModule, options)) as pool:
+            for results in imapBounded(pool, _solveChunk, chunks(problems, chunkSize), window=4 * processes):
+                count += len(results)
+                for result in results:
+                    yield result
+    logger.info("Solved %d problems with %s", count, challengeModule)
@@ -0,0 +1,29 @@
+#!/usr/bin/env python
+
+from dailyprogrammer.utils.logging import moduleLogger
+
+logger = moduleLogger(__name__)
+
+def readCircles(lines):
+    """
+    Yields circle 3-tuples from an iterable of ``x,y,r`` lines, such as a file,
+    skipping blank lines
+
+    :param lines: Iterable of strings
+    :rtype: generator of 3-tuples
+    """
+    for line in lines:
+        line = line.strip()
+        if line:
+            yield tuple(float(s) for s in line.split(","))
+
+def formatBox(points):
+    """
+    Returns the points of a box as challenge output::
+
+        ((0, 0), (0, 1), (1, 1), (1, 0)) => "(0.000, 0.000), (0.000, 1.000), (1.000, 1.000), (1.000, 0.000)"
+
+    :param points: Iterable of x, y points
+    :rtype: string
+    """
+    return ", ".join("({0:.3f}, {1:.3f})".format(*point) for point in points)
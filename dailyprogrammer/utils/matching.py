@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+
+import collections
+
+from dailyprogrammer.utils.logging import moduleLogger
+
+logger = moduleLogger(__name__)
+
+INF = float('inf')
+
+def hopcroftKarp(adjacency, matchLeft=None):
+    """
+    Returns a maximum bipartite matching, found by augmenting paths in
+    Hopcroft-Karp phases::
+
+        [["x", "y"], ["x"]] => ["y", "x"]
+
+    Left vertices are the indices of ``adjacency``; right vertices are any
+    hashable values. Each phase finds a layered graph of shortest augmenting
+    paths by breadth first search, then augments along vertex-disjoint paths
+    by depth first search. Edges are tried in adjacency order, so earlier
+    edges are preferred.
+
+    An existing matching can be extended by passing ``matchLeft``; vertices
+    matched in it stay matched, although possibly to other right vertices.
+
+    :param list adjacency: For each left vertex, a list of adjacent right vertices
+    :param list matchLeft: Optional initial matching, as returned
+    :rtype: list of right vertices (or ``None`` if unmatched), by left vertex
+    """
+    size = len(adjacency)
+    if matchLeft is None:
+        matchLeft = [None] * size
+    else:
+        matchLeft = list(matchLeft)
+    matchRight = {r: l for l, r in enumerate(matchLeft) if r is not None}
+
+    def augment(l):
+        for r in adjacency[l]:
+            m = matchRight.get(r)
+            if m is None or (distance[m] == distance[l] + 1 and augment(m)):
+                matchLeft[l] = r
+                matchRight[r] = l
+                return True
+        distance[l] = INF
+        return False
+
+    while True:
+        distance = collections.defaultdict(lambda: INF)
+        queue = collections.deque()
+        for l in range(size):
+            if matchLeft[l] is None:
+                distance[l] = 0
+                queue.append(l)
+
+        augmentable = False
+        while queue:
+            l = queue.popleft()
+            for r in adjacency[l]:
+                m = matchRight.get(r)
+                if m is None:
+                    augmentable = True
+                elif distance[m] == INF:
+                    distance[m] = distance[l] + 1
+                    queue.append(m)
+
+        if not augmentable:
+            break
+        for l in range(size):
+            if matchLeft[l] is None:
+                augment(l)
+
+    logger.debug("Matched %d of %d", size - matchLeft.count(None), size)
+    return matchLeft
@@ -0,0 +1,29 @@
+#!/usr/bin/env python
+
+import collections
+
+from dailyprogrammer.utils.logging import moduleLogger
+
+logger = moduleLogger(__name__)
+
+def imapBounded(pool, function, iterable, window=16):
+    """
+    Like ``pool.imap``, but only reads ``iterable`` as fast as results are consumed
+
+    ``Pool.imap`` queues every task up front, so a long generator is read into
+    memory in full. Here at most ``window`` tasks are in flight at any time.
+    Results are yielded in input order.
+
+    :param multiprocessing.pool.Pool pool: Pool to dispatch to
+    :param function function: Picklable function of one argument
+    :param iterable: Arguments to map over
+    :param int window: Maximum tasks in flight
+    :rtype: generator
+    """
+    pending = collections.deque()
+    for item in iterable:
+        pending.append(pool.apply_async(function, (item,)))
+        if len(pending) >= window:
+            yield pending.popleft().get()
+    while pending:
+        yield pending.popleft().get()
@@ -18,3 +18,22 @@ def sortedDictValues(inputDict, reverse=False):
     values = [k for k, v in sortedDict]
     return values
 
+
+def chunks(iterable, size):
+    """
+    Yields lists of up to ``size`` items from an iterable, consuming it lazily::
+
+        ([1, 2, 3], 2) => [1, 2], [3]
+
+    :param iterable:
+    :param int size: Maximum items in each chunk
+    :rtype: generator of lists
+    """
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
@@ -1,5 +1,7 @@
 #!/usr/bin/env python
 
+import os
+import tempfile
 import unittest
 
 import dailyprogrammer.challenges.c20170811h0 as challenge
@@ -42,6 +44,64 @@ class TestWordsDecreasing(unittest.TestCase):
         actual = challenge.wordsDecreasing(testInput)
         self.assertEqual(actual, expected)
 
+class TestLetterMask(unittest.TestCase):
+    def testBit(self):
+        self.assertEqual(challenge.letterBit("a"), 1)
+        self.assertEqual(challenge.letterBit("z"), 1 << 25)
+
+    def testBitExtra(self):
+        bit = challenge.letterBit("F")
+        self.assertEqual(bit, challenge.letterBit("F"))
+        self.assertTrue(bit >= 1 << 26)
+
+    def testMask(self):
+        testInput = "cab"
+        expected = 7
+        actual = challenge.letterMask(testInput)
+        self.assertEqual(actual, expected)
+
+class TestLetterSignature(unittest.TestCase):
+    def testWord(self):
+        testInput = "banana"
+        expected = (("a", 3), ("b", 1), ("n", 2))
+        actual = challenge.letterSignature(testInput)
+        self.assertEqual(actual, expected)
+
+    def testAnagram(self):
+        self.assertEqual(challenge.letterSignature("spam"), challenge.letterSignature("maps"))
+
+class TestPruneWords(unittest.TestCase):
+    def testAnagrams(self):
+        testInput = ["spam", "maps", "pams"]
+        expected = (["spam"], 2)
+        actual = challenge.pruneWords(testInput)
+        self.assertEqual(actual, expected)
+
+    def testDominated(self):
+        testInput = ["banana", "spam", "nab", "ban", "map"]
+        expected = (["banana", "spam"], 3)
+        actual = challenge.pruneWords(testInput)
+        self.assertEqual(actual, expected)
+
+    def testMultiplicity(self):
+        testInput = ["abc", "aa"]
+        expected = (["abc", "aa"], 0)
+        actual = challenge.pruneWords(testInput)
+        self.assertEqual(actual, expected)
+
+    def testEmpty(self):
+        testInput = ["ab", ""]
+        expected = (["ab"], 1)
+        actual = challenge.pruneWords(testInput)
+        self.assertEqual(actual, expected)
+
+    def testAcrossWords(self):
+        # letters of 'ab' are covered by two different words, but not by either
+        testInput = ["axx", "byy", "ab"]
+        expected = (["axx", "byy", "ab"], 0)
+        actual = challenge.pruneWords(testInput)
+        self.assertEqual(actual, expected)
+
 class TestBrick(unittest.TestCase):
     def setUp(self):
         self.brick = challenge.Brick(2)
@@ -49,6 +109,13 @@ class TestBrick(unittest.TestCase):
     def testDefault(self):
         self.assertEqual(self.brick.letters, [])
         self.assertEqual(self.brick.faces, 3)
+        self.assertEqual(self.brick.mask, 0)
+
+    def testMask(self):
+        self.brick.add("a")
+        self.brick.add("c")
+        self.brick.remove("a")
+        self.assertEqual(self.brick.mask, challenge.letterMask("c"))
 
     def testAdd(self):
         self.brick.add("F")
@@ -140,6 +207,51 @@ class TestBricks(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.bricks.contains("F")
 
+    def testContainsIgnore(self):
+        self.bricks.add().add("x")
+        expected = self.bricks.add().add("x")
+        actual = self.bricks.contains("x", ignore=[0])
+        self.assertEqual(actual, expected)
+
+    def testIndex(self):
+        self.bricks.add().add("x")
+        self.bricks.add().add("y")
+        self.bricks.add().add("x")
+        self.assertEqual(self.bricks.index["x"], [0, 2])
+        self.assertEqual(self.bricks.index["y"], [1])
+
+    def testIndexReplace(self):
+        self.bricks.add()
+        self.bricks.add().add("x")
+        self.bricks[0].add("x")
+        self.assertEqual(self.bricks.index["x"], [0, 1])
+        self.bricks[1].replace("x", "y")
+        self.assertEqual(self.bricks.index["x"], [0])
+        self.assertEqual(self.bricks.index["y"], [1])
+
+    def testFromData(self):
+        testInput = [["a"], ["b", "c"]]
+        bricks = challenge.Bricks.fromData(testInput)
+        self.assertEqual(bricks.data(), testInput)
+        self.assertEqual(bricks.index["c"], [1])
+
+    def testFromDataTooMany(self):
+        with self.assertRaises(challenge.BrickException):
+            challenge.Bricks.fromData([["a", "b"]])
+
+    def testCanSpell(self):
+        bricks = challenge.Bricks.fromData([["a"], ["a", "m"], ["a", "s", "h"]])
+        self.assertTrue(bricks.canSpell("ham"))
+        self.assertFalse(bricks.canSpell("hs"))
+        self.assertFalse(bricks.canSpell("mash"))
+
+    def testMasks(self):
+        self.bricks.add().add("a")
+        self.bricks.add().add("b").add("c")
+        expected = [(1, 1), (6, 2)]
+        actual = self.bricks.masks()
+        self.assertEqual(actual, expected)
+
 class TestGenerateAlphabetBricks(unittest.TestCase):
     def testSimple(self):
         expected = [["s"], ["p"], ["m"], ["a"]]
@@ -191,9 +303,90 @@ class TestGenerateAlphabetBricks(unittest.TestCase):
         actual = challenge.generateAlphabetBricks(["txz", "te", "to"])
         self.assertEqual(actual, expected)
 
+class TestGenerateAlphabetBricksPruned(unittest.TestCase):
+    def testSimpleOverlap(self):
+        expected = [["a"], ["a"], ["a"], ["n"], ["n"], ["b"]]
+        actual = challenge.generateAlphabetBricks(["banana", "ban", "nab"], prune=True)
+        self.assertEqual(actual, expected)
+
+class TestGenerateAlphabetBricksMatching(unittest.TestCase):
+    def testSimpleRepeats(self):
+        expected = [["a"], ["a"], ["a"], ["n"], ["n"], ["b"]]
+        actual = challenge.generateAlphabetBricks(["banana"], matching=True)
+        self.assertEqual(actual, expected)
+
+    def testManyShort(self):
+        expected = [["t"], ["u", "o"], ["e", "a"]]
+        actual = challenge.generateAlphabetBricks(["ta", "te", "to", "tu"], matching=True)
+        self.assertEqual(actual, expected)
+
+    def testFewerThanGreedy(self):
+        testInput = ["adc", "bb", "ada"]
+        expected = [["a"], ["d", "b"], ["c", "a", "b"]]
+        actual = challenge.generateAlphabetBricks(testInput, matching=True)
+        self.assertEqual(actual, expected)
+        self.assertEqual(len(challenge.generateAlphabetBricks(testInput)), 4)
+
+class TestExtendBricks(unittest.TestCase):
+    def testAlreadySpellable(self):
+        testInput = ([["a"], ["a", "m"], ["a", "s", "h"]], ["ham", "as"])
+        expected = [["a"], ["a", "m"], ["a", "s", "h"]]
+        actual = challenge.extendBricks(*testInput)
+        self.assertEqual(actual, expected)
+
+    def testExtended(self):
+        testInput = ([["t"], ["o"], ["a"]], ["tea", "to"])
+        expected = [["t"], ["o", "e"], ["a"]]
+        actual = challenge.extendBricks(*testInput)
+        self.assertEqual(actual, expected)
+
+    def testExtendedNewBricks(self):
+        testInput = ([["t"], ["u", "o"]], ["tea", "to"])
+        expected = [["t"], ["u", "o"], ["e"], ["a"]]
+        actual = challenge.extendBricks(*testInput)
+        self.assertEqual(actual, expected)
+
+class TestSaveBricks(unittest.TestCase):
+    def testRoundTrip(self):
+        testInput = [["a"], ["b", "c"]]
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        try:
+            challenge.saveBricks(path, testInput)
+            actual = challenge.loadBricks(path)
+        finally:
+            os.remove(path)
+        self.assertEqual(actual, testInput)
+
+class TestFormatBricks(unittest.TestCase):
+    def testSimple(self):
+        testInput = [["a"], ["b", "c"]]
+        expected = "a\nbc"
+        actual = challenge.formatBricks(testInput)
+        self.assertEqual(actual, expected)
+
+class TestParseBricks(unittest.TestCase):
+    def testSimple(self):
+        testInput = "a\nbc\n"
+        expected = [["a"], ["b", "c"]]
+        actual = challenge.parseBricks(testInput)
+        self.assertEqual(actual, expected)
+
 class TestMain(unittest.TestCase):
     def testSimple(self):
         expected = "m\na\nsh\np"
         actual = challenge.main("spam\nham")
         self.assertEqual(actual, expected)
 
+
+class TestCheckArguments(unittest.TestCase):
+    def testValid(self):
+        challenge.checkArguments({"resume": True, "checkpoint": "bricks.chk", "save": False, "extend": None})
+
+    def testResumeWithoutCheckpoint(self):
+        with self.assertRaises(ValueError):
+            challenge.checkArguments({"resume": True, "checkpoint": None})
+
+    def testSaveWithoutExtend(self):
+        with self.assertRaises(ValueError):
+            challenge.checkArguments({"save": True, "extend": None})
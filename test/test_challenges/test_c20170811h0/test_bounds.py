@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+
+import unittest
+
+import dailyprogrammer.challenges.c20170811h0.bounds as bounds
+
+class TestBricksForFaces(unittest.TestCase):
+    def testExact(self):
+        self.assertEqual(bounds.bricksForFaces(6), 3)
+
+    def testOver(self):
+        self.assertEqual(bounds.bricksForFaces(7), 4)
+
+    def testNone(self):
+        self.assertEqual(bounds.bricksForFaces(0), 0)
+
+    def testLarge(self):
+        for faces in range(1, 2000):
+            n = bounds.bricksForFaces(faces)
+            self.assertTrue(n * (n + 1) // 2 >= faces > (n - 1) * n // 2)
+
+class TestLowerBound(unittest.TestCase):
+    def testLongest(self):
+        testInput = ["banana", "ban"]
+        expected = 6
+        actual = bounds.lowerBound(testInput)
+        self.assertEqual(actual, expected)
+
+    def testFaces(self):
+        # 7 distinct letters need 7 faces, so 4 bricks
+        testInput = ["ab", "cd", "ef", "g"]
+        expected = 4
+        actual = bounds.lowerBound(testInput)
+        self.assertEqual(actual, expected)
+
+    def testMultiplicity(self):
+        testInput = ["aab", "bbc"]
+        bound = bounds.LowerBound().extend(testInput)
+        self.assertEqual(bound.faces(), 5)
+        self.assertEqual(bound.bricks(), 3)
+
+class TestGapReport(unittest.TestCase):
+    def testOptimal(self):
+        expected = "2 bricks is optimal"
+        actual = bounds.gapReport([["a"], ["b", "c"]], 2)
+        self.assertEqual(actual, expected)
+
+    def testGap(self):
+        expected = "3 bricks, lower bound 2, gap 1 (50.0%)"
+        actual = bounds.gapReport([["a"], ["b"], ["c"]], 2)
+        self.assertEqual(actual, expected)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+
+import unittest
+
+import dailyprogrammer.challenges.c20170811h0 as challenge
+import dailyprogrammer.challenges.c20170811h0.optimise as optimise
+from dailyprogrammer.challenges.c20170811h0.verify import Verifier
+
+WORDS = ["adc", "bb", "ada", "to", "te", "tbc", "banana", "spam", "ham"]
+
+class TestFits(unittest.TestCase):
+    def testFits(self):
+        self.assertTrue(optimise.fits([["a", "b"], ["c"]]))
+
+    def testTooMany(self):
+        self.assertFalse(optimise.fits([["a", "b"], ["c", "d"]]))
+
+class TestBrickSearch(unittest.TestCase):
+    def testStepsStayValid(self):
+        greedy = challenge.generateAlphabetBricks(WORDS)
+        search = optimise.BrickSearch(WORDS, greedy, seed=1)
+        for i in range(200):
+            search.step()
+            self.assertTrue(optimise.fits(search.data()))
+            self.assertEqual(Verifier(search.data()).failures(WORDS), [])
+
+    def testMatchingsStayValid(self):
+        greedy = challenge.generateAlphabetBricks(WORDS)
+        search = optimise.BrickSearch(WORDS, greedy, seed=2)
+        for i in range(200):
+            search.step()
+            for word, matching in zip(search.words, search.matchings):
+                self.assertEqual(len(set(matching)), len(word))
+                for letter, b in zip(word, matching):
+                    self.assertIn(letter, search.bricks[b])
+                    self.assertIn(search.words.index(word), search.users[(b, letter)])
+
+    def testRepairsOnlyBrokenWords(self):
+        search = optimise.BrickSearch(["ab", "c"], [["a"], ["b", "c"], ["a", "b", "c"]])
+        search.matchings = [[0, 1], [2]]
+        search.users.clear()
+        search.use(0, search.matchings[0])
+        search.use(1, search.matchings[1])
+        expected = {0: [0, 2]}
+        actual = search.repair([["a"], ["c"], ["a", "b", "c"]])
+        self.assertEqual(actual, expected)
+
+    def testRepairFails(self):
+        search = optimise.BrickSearch(["ab"], [["a"], ["b"]])
+        self.assertIsNone(search.repair([["a"], ["a"]]))
+        self.assertFalse(search.feasible([["a"], ["a"]]))
+
+    def testRedundantFaceDropped(self):
+        search = optimise.BrickSearch(["ab"], [["a"], ["b", "a"]], seed=0)
+        for i in range(50):
+            search.step()
+        self.assertEqual(search.score(), (2, 2))
+
+class TestOptimiseBricks(unittest.TestCase):
+    def testScoresDecrease(self):
+        greedy = challenge.generateAlphabetBricks(WORDS)
+        results = list(optimise.optimiseBricks(WORDS, greedy, iterations=2000, seed=0))
+        scores = [score for data, score in results]
+        self.assertEqual(scores[0], optimise.score(greedy))
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        best = results[-1][0]
+        self.assertTrue(optimise.fits(best))
+        self.assertEqual(Verifier(best).failures(WORDS), [])
+
+    def testLowerBound(self):
+        greedy = challenge.generateAlphabetBricks(WORDS)
+        results = list(optimise.optimiseBricks(WORDS, greedy, iterations=2000, lowerBound=len(greedy)))
+        self.assertEqual(len(results), 1)
+
+    def testUnbounded(self):
+        with self.assertRaises(ValueError):
+            list(optimise.optimiseBricks(WORDS, [], iterations=None, budget=None))
+
+class TestOptimise(unittest.TestCase):
+    def testNoMoves(self):
+        testInput = (["a"], [["a"]])
+        expected = [["a"]]
+        actual = optimise.optimise(*testInput, iterations=10)
+        self.assertEqual(actual, expected)
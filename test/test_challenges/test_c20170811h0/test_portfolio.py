@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+
+import itertools
+import unittest
+
+import dailyprogrammer.challenges.c20170811h0 as challenge
+import dailyprogrammer.challenges.c20170811h0.portfolio as portfolio
+
+WORDS = ["adc", "bb", "ada", "to", "te", "tbc", "banana", "spam"]
+
+class TestCandidates(unittest.TestCase):
+    def testFirst(self):
+        expected = [(0, False), (0, True), (1, False), (1, True)]
+        actual = list(itertools.islice(portfolio.candidates(), 4))
+        self.assertEqual(actual, expected)
+
+class TestCandidateOrder(unittest.TestCase):
+    def testDefault(self):
+        words = challenge.wordsDecreasing(["banana", "spam"])
+        counts = {"a": 4, "n": 2, "s": 1, "p": 1, "m": 1, "b": 1}
+        expected = (["banana", "spam"], ["a", "n", "s", "p", "m", "b"])
+        actual = portfolio.candidateOrder(words, counts, 0)
+        self.assertEqual(actual, expected)
+
+    def testSeededKeepsLengthOrder(self):
+        words = challenge.wordsDecreasing(WORDS)
+        counts = {l: 1 for l in "".join(WORDS)}
+        actual, letters = portfolio.candidateOrder(words, counts, 7)
+        self.assertEqual([len(w) for w in actual], [len(w) for w in words])
+        self.assertEqual(sorted(actual), sorted(words))
+        self.assertEqual(sorted(letters), sorted(counts))
+
+    def testSeededDeterministic(self):
+        words = challenge.wordsDecreasing(WORDS)
+        counts = {l: 1 for l in "".join(WORDS)}
+        first = portfolio.candidateOrder(words, counts, 3)
+        second = portfolio.candidateOrder(words, counts, 3)
+        self.assertEqual(first, second)
+
+class TestScore(unittest.TestCase):
+    def testSimple(self):
+        testInput = [["a"], ["b", "c"], ["d"]]
+        expected = (3, 4)
+        actual = portfolio.score(testInput)
+        self.assertEqual(actual, expected)
+
+class TestPortfolioBricks(unittest.TestCase):
+    def testNoWorseThanGreedy(self):
+        greedy = challenge.generateAlphabetBricks(WORDS)
+        actual, candidate = portfolio.portfolioBricks(WORDS, budget=None, limit=6, processes=2)
+        self.assertTrue(portfolio.score(actual) <= portfolio.score(greedy))
+
+    def testLowerBound(self):
+        greedy = challenge.generateAlphabetBricks(WORDS)
+        actual, candidate = portfolio.portfolioBricks(WORDS, budget=None, limit=100, processes=1, lowerBound=len(greedy))
+        self.assertEqual(candidate, (0, False))
+
+    def testInProcess(self):
+        expected = portfolio.portfolioBricks(WORDS, budget=None, limit=6, processes=2)
+        actual = portfolio.portfolioBricks(WORDS, budget=None, limit=6, processes=1)
+        self.assertEqual(actual, expected)
+
+    def testUnbounded(self):
+        with self.assertRaises(ValueError):
+            portfolio.portfolioBricks(WORDS, budget=None)
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import dailyprogrammer.challenges.c20170811h0 as challenge
+import dailyprogrammer.challenges.c20170811h0.serialise as serialise
+
+WORDS = ["adc", "bb", "ada", "to", "te", "tbc", "banana", "spam", "ham"]
+
+class TestDumpBricks(unittest.TestCase):
+    def testRoundTrip(self):
+        testInput = [["a"], ["b", "c"], ["d", "é", "f"]]
+        expected = (testInput, 12, 34)
+        actual = serialise.decodeBricks(serialise.dumpBricks(testInput, cursor=12, checksum=34))
+        self.assertEqual(actual, expected)
+
+    def testEmpty(self):
+        expected = ([], 0, 0)
+        actual = serialise.decodeBricks(serialise.dumpBricks([]))
+        self.assertEqual(actual, expected)
+
+    def testNotBricks(self):
+        with self.assertRaises(ValueError):
+            serialise.decodeBricks(b"spam" + bytes(serialise.HEADER.size))
+
+class TestWordsChecksum(unittest.TestCase):
+    def testOrderSensitive(self):
+        self.assertNotEqual(serialise.wordsChecksum(["spam", "ham"]), serialise.wordsChecksum(["ham", "spam"]))
+
+    def testBoundarySensitive(self):
+        self.assertNotEqual(serialise.wordsChecksum(["spam", "ham"]), serialise.wordsChecksum(["spamh", "am"]))
+
+class TestBrickFiles(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "bricks.bin")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def testBinary(self):
+        testInput = [["a"], ["b", "c"]]
+        serialise.writeBrickFile(self.path, testInput)
+        self.assertTrue(serialise.isBrickFile(self.path))
+        self.assertEqual(challenge.loadBricks(self.path), testInput)
+        self.assertEqual(os.listdir(self.directory), ["bricks.bin"])
+
+    def testText(self):
+        testInput = [["a"], ["b", "c"]]
+        challenge.saveBricks(self.path, testInput)
+        self.assertFalse(serialise.isBrickFile(self.path))
+        self.assertEqual(challenge.loadBricks(self.path), testInput)
+
+    def testCheckpointed(self):
+        expected = challenge.generateAlphabetBricks(WORDS)
+        actual = serialise.generateAlphabetBricksCheckpointed(WORDS, self.path, every=2)
+        self.assertEqual(actual, expected)
+        bricksData, cursor, checksum = serialise.readBrickFile(self.path)
+        self.assertEqual(bricksData, expected)
+        self.assertEqual(cursor, len(WORDS))
+
+    def testResume(self):
+        expected = challenge.generateAlphabetBricks(WORDS)
+        words = challenge.wordsDecreasing(WORDS)
+        partial = challenge.placeWords(words[:4], challenge.lettersDecreasing("".join(words))).data()
+        serialise.writeBrickFile(self.path, partial, cursor=4, checksum=serialise.wordsChecksum(words))
+        actual = serialise.generateAlphabetBricksCheckpointed(WORDS, self.path, every=2, resume=True)
+        self.assertEqual(actual, expected)
+
+    def testResumeDifferentWords(self):
+        serialise.generateAlphabetBricksCheckpointed(WORDS, self.path)
+        with self.assertRaises(ValueError):
+            serialise.generateAlphabetBricksCheckpointed(WORDS[1:], self.path, resume=True)
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+
+import io
+import os
+import random
+import unittest
+
+import dailyprogrammer.challenges.c20170811h0 as challenge
+from dailyprogrammer.challenges.c20170811h0.bounds import LowerBound
+import dailyprogrammer.challenges.c20170811h0.stream as stream
+
+class TestReadWords(unittest.TestCase):
+    def testLines(self):
+        testInput = io.StringIO("spam\n\n ham \neggs")
+        expected = ["spam", "ham", "eggs"]
+        actual = stream.readWords(testInput)
+        self.assertEqual(list(actual), expected)
+
+class TestLengthBuckets(unittest.TestCase):
+    def testWordsDecreasing(self):
+        testInput = ["ham", "banana", "eggs", "jam", "spam", "ham"]
+        expected = ["banana", "spam", "eggs", "jam", "ham"]
+        with stream.LengthBuckets() as buckets:
+            actual = list(buckets.extend(testInput).wordsDecreasing())
+        self.assertEqual(actual, expected)
+
+    def testLettersDecreasing(self):
+        testInput = ["banana", "spam", "spam", "spam"]
+        expected = ["a", "n", "s", "p", "m", "b"]
+        with stream.LengthBuckets() as buckets:
+            actual = buckets.extend(testInput).lettersDecreasing()
+        self.assertEqual(actual, expected)
+
+    def testCleanup(self):
+        with stream.LengthBuckets() as buckets:
+            buckets.add("spam")
+            directory = buckets.directory
+            self.assertTrue(os.path.exists(directory))
+        self.assertFalse(os.path.exists(directory))
+
+class TestGenerateAlphabetBricksStream(unittest.TestCase):
+    def testSimpleDistinct(self):
+        testInput = io.StringIO("spam\nbanana\n")
+        expected = [["a"], ["a", "s"], ["a", "p"], ["n", "m"], ["n"], ["b"]]
+        actual = stream.generateAlphabetBricksStream(testInput)
+        self.assertEqual(actual, expected)
+
+    def testBound(self):
+        testInput = io.StringIO("spam\nbanana\n")
+        bound = LowerBound()
+        stream.generateAlphabetBricksStream(testInput, bound=bound)
+        self.assertEqual(bound.bricks(), 6)
+
+    def testMatching(self):
+        testInput = io.StringIO("adc\nbb\nada")
+        expected = [["a"], ["d", "b"], ["c", "a", "b"]]
+        actual = stream.generateAlphabetBricksStream(testInput, matching=True)
+        self.assertEqual(actual, expected)
+
+    def testSameAsInMemory(self):
+        rng = random.Random(0)
+        for i in range(50):
+            words = ["".join(rng.choice("abcdef") for j in range(rng.randint(1, 5))) for k in range(20)]
+            words += rng.sample(words, 5)
+            expected = challenge.generateAlphabetBricks(words)
+            actual = stream.generateAlphabetBricksStream(io.StringIO("\n".join(words)))
+            self.assertEqual(actual, expected)
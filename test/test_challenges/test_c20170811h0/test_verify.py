@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+
+import unittest
+
+import dailyprogrammer.challenges.c20170811h0.verify as verify
+
+BRICKS = [["a"], ["a", "m"], ["a", "s", "h"], ["n", "p"], ["n"], ["b"]]
+
+class TestVerifier(unittest.TestCase):
+    def setUp(self):
+        self.verifier = verify.Verifier(BRICKS)
+
+    def testSpellable(self):
+        for word in ["spam", "ham", "banana", ""]:
+            self.assertTrue(self.verifier.canSpell(word), word)
+
+    def testTooLong(self):
+        self.assertFalse(self.verifier.canSpell("bananas"))
+
+    def testMissingLetter(self):
+        self.assertFalse(self.verifier.canSpell("zap"))
+
+    def testNotEnoughBricks(self):
+        # 's' and 'h' are only on the same brick
+        self.assertFalse(self.verifier.canSpell("hs"))
+
+    def testFailures(self):
+        testInput = ["spam", "mmm", "ham"]
+        expected = ["mmm"]
+        actual = self.verifier.failures(testInput)
+        self.assertEqual(actual, expected)
+
+class TestVerifyWords(unittest.TestCase):
+    def testInProcess(self):
+        testInput = iter(["spam", "zzz", "ham", "mmm"])
+        expected = ["zzz", "mmm"]
+        actual = verify.verifyWords(BRICKS, testInput, processes=1, chunkSize=3)
+        self.assertEqual(list(actual), expected)
+
+    def testPool(self):
+        testInput = ["spam", "zzz", "ham", "mmm"] * 10
+        expected = ["zzz", "mmm"] * 10
+        actual = verify.verifyWords(BRICKS, testInput, processes=2, chunkSize=3)
+        self.assertEqual(list(actual), expected)
+
+class TestVerificationReport(unittest.TestCase):
+    def testAll(self):
+        expected = "All 2 words can be spelled"
+        actual = verify.verificationReport(BRICKS, ["spam", "ham"], processes=1)
+        self.assertEqual(actual, expected)
+
+    def testFailures(self):
+        expected = "1 of 3 words cannot be spelled\nzzz"
+        actual = verify.verificationReport(BRICKS, ["spam", "zzz", "ham"], processes=1)
+        self.assertEqual(actual, expected)
@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 
+import io
 import unittest
 
 import dailyprogrammer.challenges.c20170904e0 as challenge
@@ -17,6 +18,17 @@ class TestMinimumBoundingOrthogonal(unittest.TestCase):
         actual = challenge.minimumBoundingOrthogonal(testInput)
         self.assertEqual(actual, expected)
 
+    def testGenerator(self):
+        testInput = (c for c in [(-0.5, -0.5, 0.5), (0.5, -0.5, 0.5), (0, 0.5, 0.5)])
+        expected = ((-1, -1), (-1, 1), (1, 1), (1, -1))
+        actual = challenge.minimumBoundingOrthogonal(testInput)
+        self.assertEqual(actual, expected)
+
+    def testEmpty(self):
+        testInput = []
+        with self.assertRaises(ValueError):
+            challenge.minimumBoundingOrthogonal(testInput)
+
 class TestMain(unittest.TestCase):
     def testConversion(self):
         testInput = "0,0,1\n0.5,-0.5,1"
@@ -24,3 +36,9 @@ class TestMain(unittest.TestCase):
         actual = challenge.main(testInput)
         self.assertEqual(actual, expected)
 
+class TestMainFile(unittest.TestCase):
+    def testConversion(self):
+        testInput = io.StringIO("0,0,1\n0.5,-0.5,1\n")
+        expected = "(-1.000, -1.500), (-1.000, 1.000), (1.500, 1.000), (1.500, -1.500)"
+        actual = challenge.mainFile(testInput)
+        self.assertEqual(actual, expected)
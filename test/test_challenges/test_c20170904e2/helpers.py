@@ -0,0 +1,37 @@
+#!/usr/bin/env python
+"""
+Helpers shared by the tests of this challenge
+"""
+
+from math import atan2, cos, sin
+import random
+
+def boxContains(box, circle, tolerance=1e-9):
+    """
+    Returns whether a box, in the format of ``minimumBounding``, contains a circle
+    """
+    bl, tl, tr, br = box
+    theta = atan2(br[1] - bl[1], br[0] - bl[0])
+    c, s = cos(-theta), sin(-theta)
+    left, bottom = bl[0] * c - bl[1] * s, bl[0] * s + bl[1] * c
+    right, top = tr[0] * c - tr[1] * s, tr[0] * s + tr[1] * c
+    x, y, r = circle
+    x, y = x * c - y * s, x * s + y * c
+    return (left - tolerance <= x - r and x + r <= right + tolerance and
+            bottom - tolerance <= y - r and y + r <= top + tolerance)
+
+def randomCircles(seed, n):
+    """
+    Returns ``n`` seeded random circles with float centres in [-10, 10] and radii in [0.1, 3]
+    """
+    rng = random.Random(seed)
+    return [(rng.uniform(-10, 10), rng.uniform(-10, 10), rng.uniform(0.1, 3)) for i in range(n)]
+
+def assertPointsAlmostEqual(self, actual, expected):
+    """
+    Assert sequences of (x, y) points are almost equal
+    """
+    self.assertEqual(len(actual), len(expected))
+    for a, e in zip(actual, expected):
+        self.assertAlmostEqual(a[0], e[0])
+        self.assertAlmostEqual(a[1], e[1])
@@ -2,9 +2,12 @@
 
 from math import pi
 import unittest
+from unittest import mock
 
 import dailyprogrammer.challenges.c20170904e2 as challenge
 
+from .helpers import randomCircles
+
 INF = float('inf')
 
 # Testing functions
@@ -216,6 +219,126 @@ class TestCoTangent(unittest.TestCase):
         points, actual = challenge.coTangent(*testInput)
         assertTupleAlmostEqual(self, actual, expected)
 
+class TestLine(unittest.TestCase):
+    def testSloped(self):
+        testInput = ((0, 1), (2, 5))
+        expected = (2.0, 1.0)
+        actual = challenge.line(*testInput)
+        self.assertEqual(actual, expected)
+
+    def testVertical(self):
+        testInput = ((3, 1), (3, 5))
+        expected = (INF, 3)
+        actual = challenge.line(*testInput)
+        self.assertEqual(actual, expected)
+
+class TestCoTangentStatus(unittest.TestCase):
+    def testSameCenter(self):
+        testInput = ((0, 0, 1), (0, 0, 2))
+        expected = (challenge.TANGENT_CONCENTRIC, None)
+        actual = challenge.coTangentStatus(*testInput)
+        self.assertEqual(actual, expected)
+
+    def testSubsetting(self):
+        testInput = ((0, 0, 1), (0.25, 0, 0.25))
+        expected = (challenge.TANGENT_CONTAINED, None)
+        actual = challenge.coTangentStatus(*testInput)
+        self.assertEqual(actual, expected)
+
+    def testSameAsCoTangent(self):
+        for testInput in [((0, 0, 1), (3, 3, 1)), ((0, 0, 1), (0, 2, 1)), ((1.5, 0, 0.5), (0, 0, 1)), ((0, 0, 1), (0.5, 0, 0.5))]:
+            expected = (challenge.TANGENT_OK, challenge.coTangent(*testInput))
+            actual = challenge.coTangentStatus(*testInput)
+            self.assertEqual(actual, expected)
+
+    def testBatch(self):
+        testInput = ((0, 0, 1), [(0, 0, 2), (3, 3, 1), (0.25, 0, 0.25)])
+        expected = [challenge.TANGENT_CONCENTRIC, challenge.TANGENT_OK, challenge.TANGENT_CONTAINED]
+        actual = [status for status, result in challenge.coTangentBatch(*testInput)]
+        self.assertEqual(actual, expected)
+
+class TestTangentCache(unittest.TestCase):
+    def testHitMiss(self):
+        testInput = [(0, 0, 1), (3, 3, 1), (6, 0, 1)]
+        cache = challenge.TangentCache()
+        cache.bind(testInput)
+        expected = list(challenge.intraTangentIndices(0, testInput))
+        self.assertEqual(cache.tangents(0), expected)
+        self.assertEqual(cache.tangents(0), expected)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def testHalves(self):
+        testInput = [(0, 0, 1), (3, 3, 1), (6, 0, 1)]
+        cache = challenge.TangentCache()
+        cache.bind(testInput)
+        expected = list(challenge.intraTangentIndices(2, testInput, bottom=True))
+        cache.tangents(2)
+        actual = cache.tangents(2, bottom=True)
+        self.assertEqual(actual, expected)
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+
+    def testNested(self):
+        testInput = [(0, 0, 1), (0, 0, 0.5), (0.25, 0, 0.25), (3, 3, 1)]
+        cache = challenge.TangentCache()
+        cache.bind(testInput)
+        with mock.patch.object(challenge, "coTangent", side_effect=AssertionError("raising path used")):
+            actual = [i for tangent, i in cache.tangents(0)]
+        self.assertEqual(actual, [3])
+
+    def testEviction(self):
+        cache = challenge.TangentCache(size=2)
+        cache.bind([(0, 0, 1), (3, 3, 1), (6, 0, 1)])
+        cache.tangents(0)
+        cache.tangents(1)
+        cache.tangents(1, bottom=True)
+        cache.tangents(1)
+        self.assertEqual(list(cache.entries), [(1, True), (1, False)])
+        self.assertEqual(len(cache), 2)
+
+    def testOversized(self):
+        cache = challenge.TangentCache(size=1)
+        cache.bind([(0, 0, 1), (3, 3, 1), (6, 0, 1)])
+        cache.tangents(1)
+        cache.tangents(0)
+        self.assertEqual(list(cache.entries), [(0, False)])
+        self.assertEqual(len(cache), 2)
+
+    def testRebind(self):
+        testInput = [(0, 0, 1), (3, 3, 1)]
+        cache = challenge.TangentCache()
+        cache.bind(testInput)
+        cache.tangents(0)
+        cache.bind(testInput)
+        self.assertEqual(len(cache), 1)
+        # an equal list may still be changed apart from the bound one
+        cache.bind(list(testInput))
+        self.assertEqual(len(cache), 0)
+
+    def testShared(self):
+        testInput = [(0, 0, 1), (3, 3, 1), (6, 0, 1), (3, 1, 0.5)]
+        expected = challenge.minimumBounding(testInput)
+        cache = challenge.TangentCache()
+        actual = challenge.minimumBounding(testInput, cache=cache)
+        assertTuplesAlmostEqual(self, actual, expected)
+        misses = cache.misses
+        list(challenge.boundingBoxesDisks(testInput, cache=cache))
+        self.assertEqual(cache.misses, misses)
+        self.assertEqual(cache.hits, misses)
+
+    def testNoExtraWork(self):
+        # co-tangents computed stand in for time: a cold cache computes no
+        # more than no cache, and a warm one none at all
+        circles = randomCircles(5, 2000)
+        counts = []
+        cache = challenge.TangentCache()
+        for kwargs in [{}, {"cache": cache}, {"cache": cache}]:
+            with mock.patch.object(challenge, "coTangentStatus", wraps=challenge.coTangentStatus) as coTangentStatus:
+                actual = challenge.convexHullDisks(circles, **kwargs)
+            counts.append(coTangentStatus.call_count)
+            self.assertEqual(actual, challenge.convexHullDisks(circles))
+        self.assertEqual(counts[1], counts[0])
+        self.assertEqual(counts[2], 0)
+
 class TestFindStartingCircle(unittest.TestCase):
     def testSingle(self):
         testInput = [(0, 0, 1)]
@@ -269,6 +392,22 @@ class TestIntraTangents(unittest.TestCase):
             assertTupleAlmostEqual(self, a[0], e[0])
             self.assertEqual(a[1], e[1])
 
+    def testNestedNeverRaises(self):
+        testInput = ((0, 0, 1), [(0, 0, 1), (0, 0, 2), (0.25, 0, 0.25), (3, 3, 1)])
+        expected = [(3, 3, 1)]
+        with mock.patch.object(challenge, "coTangent", side_effect=AssertionError("raising path used")):
+            actual = [c for tangent, c in challenge.intraTangents(*testInput)]
+        self.assertEqual(actual, expected)
+
+
+class TestIntraTangentIndices(unittest.TestCase):
+    def testCachedSameAsUncached(self):
+        circles = [(0, 0, 1), (3, 3, 1), (6, 0, 1), (0, 0, 0.5)]
+        expected = list(challenge.intraTangentIndices(0, circles))
+        cache = challenge.TangentCache()
+        cache.bind(circles)
+        actual = list(challenge.intraTangentIndices(0, circles, cache=cache))
+        self.assertEqual(actual, expected)
 
 class TestConvexHullDisksHalf(unittest.TestCase):
     def testSimple(self):
@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+
+from math import ceil, cos, hypot, pi, sin, sqrt
+import random
+import unittest
+from unittest import mock
+
+import dailyprogrammer.challenges.c20170904e2 as challenge
+import dailyprogrammer.challenges.c20170904e2.approx as approx
+import dailyprogrammer.challenges.c20170904e2.envelope as envelope
+from dailyprogrammer.challenges.c20170904e2.envelope import TAU
+from dailyprogrammer.challenges.c20170904e2.orientation import OrientationIndex
+
+from .helpers import boxContains
+
+def boxArea(box):
+    bl, tl, tr, br = box
+    return hypot(tl[0] - bl[0], tl[1] - bl[1]) * hypot(br[0] - bl[0], br[1] - bl[1])
+
+class TestWidthBounds(unittest.TestCase):
+    def testSquare(self):
+        testInput = [(1, 1, 1), (-1, 1, 1), (-1, -1, 1), (1, -1, 1)]
+        width, diameter = approx.widthBounds(testInput, envelope.supportEnvelope(testInput))
+        self.assertAlmostEqual(width, 4)
+        self.assertAlmostEqual(diameter, 2 * sqrt(2))
+
+    def testAgainstSampledWidths(self):
+        rng = random.Random(2)
+        circles = [(rng.uniform(-10, 10), rng.uniform(-3, 3), rng.uniform(0, 1)) for i in range(50)]
+        arcs = envelope.supportEnvelope(circles)
+        index = OrientationIndex(circles, arcs)
+        expected = min(index.support(theta) + index.support(theta + pi) for theta in (k * pi / 10000 for k in range(10000)))
+        actual, diameter = approx.widthBounds(circles, arcs)
+        self.assertLessEqual(actual, expected + 1e-9)
+        self.assertGreater(actual, expected - 1e-3)
+
+    def testPoint(self):
+        testInput = [(1, 1, 0)]
+        actual = approx.widthBounds(testInput, envelope.supportEnvelope(testInput))
+        self.assertEqual(actual, (0.0, 0.0))
+
+class TestSampling(unittest.TestCase):
+    def testSimple(self):
+        expected = int(ceil((pi / 2) / (2 * (sqrt(1.21) - 1) * 2)))
+        actual = approx.sampling(4, 2, 0.21)
+        self.assertEqual(actual, expected)
+
+    def testThinner(self):
+        self.assertGreater(approx.sampling(1, 10, 0.1), approx.sampling(2, 10, 0.1))
+
+class TestApproximateMinimumBounding(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(1)
+        self.circles = [(rng.uniform(-10, 10), rng.uniform(-10, 10), rng.uniform(0.5, 3)) for i in range(3000)]
+
+    def testWithinEpsilon(self):
+        for epsilon in [0.5, 0.1]:
+            expected = boxArea(challenge.minimumBounding(self.circles, method="divide", backend="calipers"))
+            actual = boxArea(approx.approximateMinimumBounding(self.circles, epsilon))
+            self.assertLessEqual(actual, expected * (1 + epsilon) + 1e-9)
+            self.assertGreaterEqual(actual, expected - 1e-9)
+
+    def testBoundsEveryCircle(self):
+        box = approx.approximateMinimumBounding(self.circles, 0.5)
+        for circle in self.circles:
+            self.assertTrue(boxContains(box, circle))
+
+    def testInternallyTangent(self):
+        testInput = [(4, -2, 1), (5, -2, 2), (0, 5, 1), (-3, 0, 1)]
+        box = approx.approximateMinimumBounding(testInput, 0.01)
+        for circle in testInput:
+            self.assertTrue(boxContains(box, circle))
+
+    def testContainsIntegers(self):
+        rng = random.Random(3)
+        for i in range(200):
+            circles = [(rng.randint(-5, 5), rng.randint(-5, 5), rng.randint(1, 3)) for j in range(rng.randint(2, 12))]
+            x, y, r = circles[0]
+            circles.append((x + 1, y, r + 1))
+            if len(set(index for theta, index in envelope.supportEnvelope(circles))) < 3:
+                # two disks or fewer on the hull have no box, exactly or not
+                continue
+            for epsilon in [0.5, 0.01]:
+                box = approx.approximateMinimumBounding(circles, epsilon)
+                for circle in circles:
+                    self.assertTrue(boxContains(box, circle), (circles, epsilon, circle))
+
+    def testExactFallback(self):
+        testInput = [(1, 1, 2), (6, 2, 0.5), (-1, -3, 1)]
+        expected = challenge.minimumBounding(testInput, method="divide", backend="calipers")
+        actual = approx.approximateMinimumBounding(testInput, 0.01)
+        self.assertEqual(actual, expected)
+
+    def testConcentric(self):
+        testInput = [(1, 1, 2), (1, 1, 1)]
+        expected = ((-1, -1), (-1, 3), (3, 3), (3, -1))
+        actual = approx.approximateMinimumBounding(testInput, 0.1)
+        self.assertEqual(actual, expected)
+
+    def testZeroRadii(self):
+        testInput = [(x, y, 0.0) for x, y, r in self.circles]
+        expected = boxArea(challenge.minimumBounding(testInput, method="divide", backend="calipers"))
+        actual = boxArea(approx.approximateMinimumBounding(testInput, 0.1))
+        self.assertLessEqual(actual, expected * 1.1 + 1e-9)
+        self.assertGreaterEqual(actual, expected - 1e-9)
+
+    def testEnvelopeOfCandidates(self):
+        with mock.patch.object(approx, "supportEnvelope", wraps=envelope.supportEnvelope) as supportEnvelope:
+            approx.approximateMinimumBounding(self.circles, 0.1)
+        candidates, = supportEnvelope.call_args[0]
+        self.assertLess(len(candidates), len(self.circles) // 10)
+
+    def testFewerBoxes(self):
+        # every circle is on the hull, so the exact search tries a box per circle
+        circles = [(100 * cos(k * TAU / 2000), 100 * sin(k * TAU / 2000), 1) for k in range(2000)]
+        expected = boxArea(challenge.minimumBounding(circles, method="divide", backend="calipers"))
+        with mock.patch.object(approx, "boundingBoxesEnvelope") as boundingBoxesEnvelope:
+            actual = boxArea(approx.approximateMinimumBounding(circles, 0.1))
+        boundingBoxesEnvelope.assert_not_called()
+        self.assertLessEqual(actual, expected * 1.1 + 1e-9)
+
+    def testInvalidEpsilon(self):
+        with self.assertRaises(ValueError):
+            approx.approximateMinimumBounding(self.circles, 0)
+
+class TestMainEpsilon(unittest.TestCase):
+    def testExactWhenSmall(self):
+        testInput = "1,1,2\n6,2,0.5\n-1,-3,1"
+        expected = challenge.main(testInput)
+        actual = challenge.main(testInput, epsilon=0.1)
+        self.assertEqual(actual, expected)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+
+from math import cos, sin
+import random
+import unittest
+
+import dailyprogrammer.challenges.c20170904e2 as challenge
+import dailyprogrammer.challenges.c20170904e2.calipers as calipers
+from dailyprogrammer.challenges.c20170904e2.envelope import supportEnvelope
+
+from .helpers import boxContains
+
+def assertBoxesAlmostEqual(self, actual, expected):
+    """
+    Assert lists of (box, area) tuples are almost equal
+    """
+    self.assertEqual(len(actual), len(expected))
+    for (aBox, aArea), (eBox, eArea) in zip(actual, expected):
+        self.assertAlmostEqual(aArea, eArea)
+        for a, e in zip(aBox, eBox):
+            self.assertAlmostEqual(a[0], e[0])
+            self.assertAlmostEqual(a[1], e[1])
+
+class TestCaliper(unittest.TestCase):
+    def testSweep(self):
+        testInput = [(0, 0, 1), (10, 0, 1), (5, 2, 1)]
+        arcs = supportEnvelope(testInput)
+        caliper = calipers.Caliper(testInput, arcs)
+        for k in range(100, -1, -1):
+            theta = k * 0.0628
+            expected = max(x * cos(theta) + y * sin(theta) + r for x, y, r in testInput)
+            actual = caliper.support(theta)
+            self.assertAlmostEqual(actual, expected)
+
+    def testMovesLinear(self):
+        rng = random.Random(0)
+        testInput = [(rng.uniform(-10, 10), rng.uniform(-10, 10), rng.uniform(0.1, 3)) for i in range(200)]
+        arcs = supportEnvelope(testInput)
+        caliper = calipers.Caliper(testInput, arcs)
+        for k in range(1000, -1, -1):
+            caliper.support(k * 0.00628)
+        self.assertLessEqual(caliper.moves, 2 * len(arcs))
+
+class TestBoundingBoxesCalipers(unittest.TestCase):
+    def testTriangle(self):
+        testInput = [(0, 0, 1), (10, 0, 1), (5, 2, 1)]
+        expected = list(challenge.boundingBoxesDisks(testInput))
+        actual = list(calipers.boundingBoxesCalipers(testInput))
+        assertBoxesAlmostEqual(self, actual, expected)
+
+    def testDoublePointyVertical(self):
+        testInput = [(0, 0, 1), (0, 10, 0.5)]
+        expected = list(challenge.boundingBoxesDisks(testInput))
+        actual = list(calipers.boundingBoxesCalipers(testInput))
+        assertBoxesAlmostEqual(self, actual, expected)
+
+    def testDoublePillar(self):
+        testInput = [(0, 0, 1), (0, 10, 1)]
+        with self.assertRaises(ValueError):
+            list(calipers.boundingBoxesCalipers(testInput))
+
+    def testRandom(self):
+        rng = random.Random(1)
+        for n in (5, 20, 100):
+            testInput = [(rng.uniform(-10, 10), rng.uniform(-10, 10), rng.uniform(0.1, 3)) for i in range(n)]
+            expected = list(challenge.boundingBoxesDisks(testInput))
+            actual = list(calipers.boundingBoxesCalipers(testInput))
+            assertBoxesAlmostEqual(self, actual, expected)
+
+class TestMinimumBoundingCalipers(unittest.TestCase):
+    def testAngledTriangle(self):
+        testInput = [(0, 0, 1), (10, 10, 1), (3, 7, 1)]
+        expected = challenge.minimumBounding(testInput)
+        actual = challenge.minimumBounding(testInput, backend="calipers")
+        for a, e in zip(actual, expected):
+            self.assertAlmostEqual(a[0], e[0])
+            self.assertAlmostEqual(a[1], e[1])
+
+    def testInternallyTangent(self):
+        testInput = [(4, -2, 1), (5, -2, 2), (0, 5, 1), (-3, 0, 1)]
+        box = challenge.minimumBounding(testInput, backend="calipers")
+        for circle in testInput:
+            self.assertTrue(boxContains(box, circle), circle)
+
+    def testContainsIntegers(self):
+        rng = random.Random(0)
+        for trial in range(100):
+            testInput = [(rng.randint(-6, 6), rng.randint(-6, 6), rng.randint(1, 3)) for i in range(rng.randint(3, 15))]
+            try:
+                boxes = list(calipers.boundingBoxesCalipers(testInput))
+            except ValueError:
+                # fewer than three hull lines
+                continue
+            for box, area in boxes:
+                for circle in testInput:
+                    self.assertTrue(boxContains(box, circle), "{0} outside {1}".format(circle, box))
+
+    def testUnknown(self):
+        testInput = [(0, 0, 1), (10, 10, 1), (3, 7, 1)]
+        with self.assertRaises(ValueError):
+            challenge.minimumBounding(testInput, backend="unknown")
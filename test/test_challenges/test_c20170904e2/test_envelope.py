@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+
+from math import pi
+import random
+import unittest
+
+import dailyprogrammer.challenges.c20170904e2 as challenge
+import dailyprogrammer.challenges.c20170904e2.envelope as envelope
+
+INF = float('inf')
+
+def assertTuplesAlmostEqual(self, actual, expected):
+    """
+    Assert an array of lines are almost equal
+    """
+    self.assertEqual(len(actual), len(expected), "Lines {0} were expected to be {1}".format(actual, expected))
+    for a, e in zip(actual, expected):
+        self.assertEqual(len(a), len(e))
+        for i, j in zip(a, e):
+            self.assertAlmostEqual(i, j, msg="Lines {0} were expected to be {1}".format(actual, expected))
+
+class TestCrossings(unittest.TestCase):
+    def testSameSize(self):
+        testInput = ((0, 0, 1), (2, 0, 1))
+        expected = [pi / 2, 3 * pi / 2]
+        actual = sorted(envelope.crossings(*testInput))
+        for a, e in zip(actual, expected):
+            self.assertAlmostEqual(a, e)
+
+    def testContained(self):
+        testInput = ((0, 0, 5), (1, 0, 1))
+        expected = []
+        actual = envelope.crossings(*testInput)
+        self.assertEqual(actual, expected)
+
+    def testSameCenter(self):
+        testInput = ((0, 0, 1), (0, 0, 2))
+        expected = []
+        actual = envelope.crossings(*testInput)
+        self.assertEqual(actual, expected)
+
+class TestSupportEnvelope(unittest.TestCase):
+    def testSingle(self):
+        testInput = [(0, 0, 1)]
+        expected = [(0.0, 0)]
+        actual = envelope.supportEnvelope(testInput)
+        self.assertEqual(actual, expected)
+
+    def testContained(self):
+        testInput = [(0, 0, 5), (1, 0, 1), (0, 2, 2)]
+        expected = [(0.0, 0)]
+        actual = envelope.supportEnvelope(testInput)
+        self.assertEqual(actual, expected)
+
+    def testBruteForce(self):
+        rng = random.Random(0)
+        testInput = [(rng.uniform(-10, 10), rng.uniform(-10, 10), rng.uniform(0.1, 3)) for i in range(50)]
+        arcs = envelope.supportEnvelope(testInput)
+        for k in range(720):
+            theta = k * 2 * pi / 720
+            index = [i for start, i in arcs if start <= theta][-1]
+            expected = max(envelope.support(c, theta) for c in testInput)
+            actual = envelope.support(testInput[index], theta)
+            self.assertAlmostEqual(actual, expected)
+
+    def testInternallyTangent(self):
+        testInput = [(4, -2, 1), (5, -2, 2)]
+        expected = [(0.0, 1)]
+        actual = envelope.supportEnvelope(testInput)
+        self.assertEqual(actual, expected)
+
+    def testInternallyTangentHull(self):
+        testInput = [(4, -2, 1), (5, -2, 2), (0, 5, 1), (-3, 0, 1)]
+        expected = [1, 2, 3]
+        actual = sorted(envelope.hullIndices(envelope.supportEnvelope(testInput)))
+        self.assertEqual(actual, expected)
+
+    def testBruteForceIntegers(self):
+        rng = random.Random(0)
+        for trial in range(100):
+            testInput = [(rng.randint(-6, 6), rng.randint(-6, 6), rng.randint(2, 3)) for i in range(rng.randint(2, 8))]
+            # disks touching another from inside, along an axis
+            for x, y, r in list(testInput):
+                dx, dy = rng.choice([(1, 0), (-1, 0), (0, 1), (0, -1)])
+                testInput.insert(rng.randrange(len(testInput) + 1), (x + dx, y + dy, r - 1))
+            arcs = envelope.supportEnvelope(testInput)
+            for k in range(360):
+                theta = k * 2 * pi / 360
+                index = [i for start, i in arcs if start <= theta][-1]
+                expected = max(envelope.support(c, theta) for c in testInput)
+                actual = envelope.support(testInput[index], theta)
+                self.assertAlmostEqual(actual, expected, msg="{0} at {1}".format(testInput, theta))
+
+class TestHullIndices(unittest.TestCase):
+    def testWrapped(self):
+        testInput = [(0.0, 2), (1.0, 0), (4.0, 2)]
+        expected = [2, 0]
+        actual = envelope.hullIndices(testInput)
+        self.assertEqual(actual, expected)
+
+class TestEdgeLine(unittest.TestCase):
+    def testVertical(self):
+        testInput = (pi, 1.0)
+        expected = (INF, -1.0)
+        actual = envelope.edgeLine(*testInput)
+        self.assertEqual(actual[0], expected[0])
+        self.assertAlmostEqual(actual[1], expected[1])
+
+    def testHorizontal(self):
+        testInput = (pi / 2, 4.0)
+        expected = [(0.0, 4.0)]
+        actual = [envelope.edgeLine(*testInput)]
+        assertTuplesAlmostEqual(self, actual, expected)
+
+class TestConvexHullDisksDivide(unittest.TestCase):
+    def testSimple(self):
+        testInput = [(0, 0, 1), (3, 3, 1), (6, 0, 1)]
+        expected = [(1.0, 1.414213562373095), (-1, 7.414213562373094), (0, -1)]
+        actual = envelope.convexHullDisksDivide(testInput)
+        assertTuplesAlmostEqual(self, actual, expected)
+
+    def testStackedVertical(self):
+        testInput = [(0, 0, 1), (0, 1, 1), (3, 3, 1), (6, 0, 1)]
+        expected = challenge.convexHullDisks(testInput)
+        actual = envelope.convexHullDisksDivide(testInput)
+        assertTuplesAlmostEqual(self, actual, expected)
+
+    def testStackedHorizontal(self):
+        testInput = [(0, 0, 1), (2, 3, 1), (3, 3, 1), (6, 0, 1)]
+        expected = challenge.convexHullDisks(testInput)
+        actual = envelope.convexHullDisksDivide(testInput)
+        assertTuplesAlmostEqual(self, actual, expected)
+
+    def testRandom(self):
+        rng = random.Random(1)
+        for n in (5, 20, 100):
+            testInput = [(rng.uniform(-10, 10), rng.uniform(-10, 10), rng.uniform(0.1, 3)) for i in range(n)]
+            expected = challenge.convexHullDisks(testInput)
+            actual = envelope.convexHullDisksDivide(testInput)
+            assertTuplesAlmostEqual(self, actual, expected)
+
+class TestConvexHullDisksMethod(unittest.TestCase):
+    def testOverlapping(self):
+        testInput = [(0, 0, 1), (10, 0, 1), (5, -10, 1), (5, -3, 1)]
+        expected = [(0.0, 1.0), (2, -22.236067977499786), (-2.0, -2.23606797749979)]
+        actual = challenge.convexHullDisks(testInput, method="divide")
+        assertTuplesAlmostEqual(self, actual, expected)
+
+    def testDoublePillar(self):
+        testInput = [(0, 0, 1), (0, 10, 1)]
+        with self.assertRaises(ValueError):
+            challenge.convexHullDisks(testInput, method="divide")
+
+    def testUnknown(self):
+        testInput = [(0, 0, 1), (3, 3, 1), (6, 0, 1)]
+        with self.assertRaises(ValueError):
+            challenge.convexHullDisks(testInput, method="unknown")
+
+    def testMinimumBounding(self):
+        testInput = [(0, 0, 1), (3, 3, 1), (6, 0, 1)]
+        expected = challenge.minimumBounding(testInput)
+        actual = challenge.minimumBounding(testInput, method="divide")
+        assertTuplesAlmostEqual(self, actual, expected)
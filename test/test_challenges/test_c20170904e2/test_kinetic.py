@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+
+import random
+import unittest
+
+import dailyprogrammer.challenges.c20170904e2 as challenge
+import dailyprogrammer.challenges.c20170904e2.kinetic as kinetic
+from dailyprogrammer.challenges.c20170904e2.envelope import supportEnvelope
+
+from .helpers import assertPointsAlmostEqual
+
+def movingFrames(seed, n, count, speed):
+    rng = random.Random(seed)
+    circles = [(rng.uniform(-10, 10), rng.uniform(-10, 10), rng.uniform(0.1, 3)) for i in range(n)]
+    velocities = [(rng.uniform(-speed, speed), rng.uniform(-speed, speed)) for i in range(n)]
+    frames = []
+    for f in range(count):
+        frames.append(circles)
+        circles = [(x + vx, y + vy, r) for (x, y, r), (vx, vy) in zip(circles, velocities)]
+    return frames
+
+class TestDisplacement(unittest.TestCase):
+    def testMoveAndGrow(self):
+        testInput = ((0, 0, 1), (3, 4, 0.5))
+        expected = 5.5
+        actual = kinetic.displacement(*testInput)
+        self.assertAlmostEqual(actual, expected)
+
+class TestSlack(unittest.TestCase):
+    def testCentre(self):
+        circles = [(0, 0, 1), (10, 0, 1), (10, 10, 1), (0, 10, 1)]
+        testInput = (circles, supportEnvelope(circles), (5, 5, 1))
+        expected = 5.0
+        actual = kinetic.slack(*testInput)
+        self.assertAlmostEqual(actual, expected)
+
+    def testOnHull(self):
+        circles = [(0, 0, 1), (10, 0, 1), (10, 10, 1), (0, 10, 1)]
+        testInput = (circles, supportEnvelope(circles), (5, 0, 1))
+        expected = 0.0
+        actual = kinetic.slack(*testInput)
+        self.assertAlmostEqual(actual, expected)
+
+    def testOutside(self):
+        circles = [(0, 0, 1), (10, 0, 1), (10, 10, 1), (0, 10, 1)]
+        testInput = (circles, supportEnvelope(circles), (5, -2, 1))
+        expected = -2.0
+        actual = kinetic.slack(*testInput)
+        self.assertAlmostEqual(actual, expected)
+
+class TestKineticHull(unittest.TestCase):
+    def testSlowMotion(self):
+        frames = movingFrames(0, 300, 10, 0.05)
+        hull = kinetic.KineticHull()
+        for circles in frames:
+            expected = challenge.minimumBounding(circles, method="divide", backend="calipers")
+            actual = hull.update(circles)
+            assertPointsAlmostEqual(self, actual, expected)
+        self.assertEqual(hull.rebuilds, 1)
+        self.assertEqual(hull.repairs, 9)
+
+    def testFastMotion(self):
+        frames = movingFrames(1, 100, 5, 20)
+        hull = kinetic.KineticHull()
+        for circles in frames:
+            expected = challenge.minimumBounding(circles, method="divide", backend="calipers")
+            actual = hull.update(circles)
+            assertPointsAlmostEqual(self, actual, expected)
+        self.assertGreater(hull.rebuilds, 1)
+
+    def testInteriorEscapes(self):
+        frames = [[(0, 0, 1), (10, 0, 1), (5, 8, 1), (5, 3, 1)],
+                  [(0, 0, 1), (10, 0, 1), (5, 8, 1), (5, -10, 1)]]
+        hull = kinetic.KineticHull(rebuildFraction=1.0)
+        for circles in frames:
+            expected = challenge.minimumBounding(circles, method="divide", backend="calipers")
+            actual = hull.update(circles)
+            assertPointsAlmostEqual(self, actual, expected)
+        self.assertEqual(hull.repairs, 1)
+        self.assertEqual(hull.hull, [0, 1, 2, 3])
+
+    def testSizeChange(self):
+        frames = [[(0, 0, 1), (10, 0, 1), (5, 8, 1)],
+                  [(0, 0, 1), (10, 0, 1), (5, 8, 1), (5, -10, 1)]]
+        hull = kinetic.KineticHull()
+        for circles in frames:
+            hull.update(circles)
+        self.assertEqual(hull.rebuilds, 2)
+
+class TestMinimumBoundingFrames(unittest.TestCase):
+    def testGenerator(self):
+        frames = movingFrames(2, 50, 4, 0.1)
+        expected = [challenge.minimumBounding(circles, method="divide", backend="calipers") for circles in frames]
+        actual = list(kinetic.minimumBoundingFrames(iter(frames)))
+        self.assertEqual(len(actual), len(expected))
+        for a, e in zip(actual, expected):
+            assertPointsAlmostEqual(self, a, e)
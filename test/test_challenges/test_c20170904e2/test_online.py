@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+
+from math import pi
+import unittest
+
+import dailyprogrammer.challenges.c20170904e2 as challenge
+from dailyprogrammer.challenges.c20170904e2.online import OnlineHull
+
+from .helpers import assertPointsAlmostEqual, randomCircles
+
+class TestOnlineHull(unittest.TestCase):
+    def testAddInside(self):
+        hull = OnlineHull([(0, 0, 1), (10, 0, 1), (5, 8, 1)])
+        self.assertFalse(hull.add((5, 3, 1)))
+        self.assertEqual(hull.circles, [(0, 0, 1), (10, 0, 1), (5, 8, 1)])
+        self.assertEqual(len(hull), 4)
+
+    def testAddOutside(self):
+        hull = OnlineHull([(0, 0, 1), (10, 0, 1), (5, 8, 1)])
+        self.assertTrue(hull.add((5, -20, 1)))
+        self.assertEqual(hull.circles, [(0, 0, 1), (10, 0, 1), (5, 8, 1), (5, -20, 1)])
+
+    def testAddReplaces(self):
+        hull = OnlineHull([(0, 0, 1), (10, 0, 1), (5, 8, 1)])
+        self.assertTrue(hull.add((5, 3, 20)))
+        self.assertEqual(hull.circles, [(5, 3, 20)])
+
+    def testInternallyTangent(self):
+        hull = OnlineHull([(4, -2, 1), (5, -2, 2), (0, 5, 1), (-3, 0, 1)])
+        self.assertEqual(hull.circles, [(5, -2, 2), (0, 5, 1), (-3, 0, 1)])
+
+    def testAddInternallyTangent(self):
+        hull = OnlineHull([(0, 5, 1), (-3, 0, 1), (4, -2, 1)])
+        self.assertTrue(hull.add((5, -2, 2)))
+        self.assertEqual(hull.circles, [(0, 5, 1), (-3, 0, 1), (5, -2, 2)])
+        self.assertFalse(hull.add((4, -2, 1)))
+
+    def testEmptyBatch(self):
+        hull = OnlineHull()
+        self.assertFalse(hull.extend([]))
+        self.assertEqual(len(hull), 0)
+
+    def testSupport(self):
+        hull = OnlineHull([(0, 0, 1), (10, 0, 1), (5, 8, 1)])
+        self.assertAlmostEqual(hull.support(0), 11)
+        self.assertAlmostEqual(hull.support(pi / 2), 9)
+        self.assertAlmostEqual(hull.support(-pi / 2), 1)
+
+    def testCached(self):
+        hull = OnlineHull([(0, 0, 1), (10, 0, 1), (5, 8, 1)])
+        expected = hull.minimumBounding()
+        hull.add((5, 3, 1))
+        self.assertIs(hull.minimumBounding(), expected)
+        hull.add((5, -20, 1))
+        self.assertIsNot(hull.minimumBounding(), expected)
+
+    def testQueries(self):
+        testInput = randomCircles(0, 200)
+        hull = OnlineHull()
+        for k in range(0, len(testInput), 25):
+            batch = testInput[k:k + 25]
+            if k % 50:
+                hull.extend(batch)
+            else:
+                for circle in batch:
+                    hull.add(circle)
+            seen = testInput[:k + 25]
+            assertPointsAlmostEqual(self, hull.minimumBounding(), challenge.minimumBounding(seen, method="divide", backend="calipers"))
+            assertPointsAlmostEqual(self, hull.hull(), challenge.convexHullDisks(seen, method="divide"))
+            self.assertEqual(hull.minimumBoundingOrthogonal(), challenge.minimumBoundingOrthogonal(seen))
+
+    def testTooFew(self):
+        hull = OnlineHull([(0, 0, 1), (0, 10, 1)])
+        with self.assertRaises(ValueError):
+            hull.hull()
+        with self.assertRaises(ValueError):
+            hull.minimumBounding()
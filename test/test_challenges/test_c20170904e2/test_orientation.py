@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+
+from math import atan, pi
+import random
+import unittest
+
+import dailyprogrammer.challenges.c20170904e2 as challenge
+import dailyprogrammer.challenges.c20170904e2.orientation as orientation
+
+def rotatedBox(circles, theta):
+    """
+    Box at angle ``theta`` by rotating every circle, as ``boundingBoxesDisks``
+    """
+    box = challenge.minimumBoundingOrthogonal(list(challenge.rotateCircles(circles, -theta)))
+    bl, tl, tr, br = box
+    area = (tr[0] - bl[0]) * (tr[1] - bl[1])
+    return (tuple(challenge.rotatePoint(point, theta) for point in box), area)
+
+def assertBoxAlmostEqual(self, actual, expected):
+    self.assertAlmostEqual(actual[1], expected[1])
+    for a, e in zip(actual[0], expected[0]):
+        self.assertAlmostEqual(a[0], e[0])
+        self.assertAlmostEqual(a[1], e[1])
+
+class TestSideBox(unittest.TestCase):
+    def testOrthogonal(self):
+        testInput = (0.0, 11, 9, 1, 1)
+        expected = (((-1, -1), (-1, 9), (11, 9), (11, -1)), 120)
+        actual = orientation.sideBox(*testInput)
+        assertBoxAlmostEqual(self, actual, expected)
+
+class TestOrientationIndex(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(0)
+        self.circles = [(rng.uniform(-10, 10), rng.uniform(-10, 10), rng.uniform(0.1, 3)) for i in range(200)]
+        self.index = orientation.OrientationIndex(self.circles)
+
+    def testHullOnly(self):
+        self.assertLess(len(self.index.circles), len(self.circles))
+
+    def testSupporting(self):
+        testInput = [(0, 0, 1), (10, 0, 1), (5, 8, 1)]
+        index = orientation.OrientationIndex(testInput)
+        self.assertEqual(index.supporting(0.1), (10, 0, 1))
+        self.assertEqual(index.supporting(pi / 2), (5, 8, 1))
+        self.assertEqual(index.supporting(-pi / 2 + 0.1), (10, 0, 1))
+        self.assertAlmostEqual(index.support(pi), 1)
+
+    def testBox(self):
+        for theta in (0, 0.3, pi / 2, 2.5, pi, -1.0, 10.0):
+            expected = rotatedBox(self.circles, theta)
+            actual = self.index.box(theta)
+            assertBoxAlmostEqual(self, actual, expected)
+
+    def testBoxes(self):
+        rng = random.Random(1)
+        testInput = [rng.uniform(-10, 10) for i in range(50)] + [0, pi / 2, pi, 3 * pi / 2]
+        actual = self.index.boxes(testInput)
+        self.assertEqual(len(actual), len(testInput))
+        for theta, box in zip(testInput, actual):
+            assertBoxAlmostEqual(self, box, rotatedBox(self.circles, theta))
+
+    def testHullEdges(self):
+        hull = challenge.convexHullDisks(self.circles, method="divide")
+        expected = list(challenge.boundingBoxesDisks(self.circles, method="divide"))
+        actual = self.index.boxes(atan(m) for m, c in hull)
+        for a, e in zip(actual, expected):
+            assertBoxAlmostEqual(self, a, e)
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+
+import random
+import unittest
+
+import dailyprogrammer.challenges.c20170904e2 as challenge
+import dailyprogrammer.challenges.c20170904e2.parallel as parallel
+from dailyprogrammer.challenges.c20170904e2.envelope import hullIndices, supportEnvelope
+
+from .helpers import randomCircles
+
+class TestCircleBuffer(unittest.TestCase):
+    def testRoundTrip(self):
+        testInput = [(0.0, 1.0, 2.0), (3.5, -4.0, 0.25), (1e9, 0.0, 1.0)]
+        expected = testInput[1:]
+        buffer = parallel.circleBuffer(testInput)
+        actual = parallel.bufferCircles(buffer, 1, 3)
+        self.assertEqual(actual, expected)
+
+class TestChunkHull(unittest.TestCase):
+    def testOffset(self):
+        testInput = [(100, 100, 1), (0, 0, 1), (10, 0, 1), (5, 2, 0.5), (5, 8, 1)]
+        expected = [1, 2, 4]
+        actual = sorted(parallel.chunkHull(parallel.circleBuffer(testInput), 1, 5))
+        self.assertEqual(actual, expected)
+
+class TestHullCandidates(unittest.TestCase):
+    def testInProcess(self):
+        testInput = [(0, 0, 1), (10, 0, 1), (5, 2, 0.5), (5, 8, 1), (5, 3, 1)]
+        expected = [(0, 0, 1), (10, 0, 1), (5, 8, 1)]
+        actual = parallel.hullCandidates(testInput, processes=1, chunks=1)
+        self.assertEqual(actual, expected)
+
+    def testInternallyTangent(self):
+        testInput = [(4, -2, 1), (5, -2, 2), (0, 5, 1), (-3, 0, 1)]
+        expected = [(5, -2, 2), (0, 5, 1), (-3, 0, 1)]
+        actual = parallel.hullCandidates(testInput, processes=1, chunks=1)
+        self.assertEqual(actual, expected)
+
+    def testIntegersKeepHull(self):
+        rng = random.Random(0)
+        for trial in range(50):
+            testInput = [(rng.randint(-6, 6), rng.randint(-6, 6), rng.randint(1, 3)) for i in range(20)]
+            expected = sorted(set(testInput[i] for i in hullIndices(supportEnvelope(testInput))))
+            actual = parallel.hullCandidates(testInput, processes=1, chunks=3)
+            self.assertLessEqual(set(expected), set(actual))
+
+    def testPool(self):
+        testInput = randomCircles(0, 2000)
+        expected = parallel.hullCandidates(testInput, processes=1, chunks=8)
+        actual = parallel.hullCandidates(testInput, processes=2, chunks=8)
+        self.assertEqual(actual, expected)
+
+    def testMoreChunksThanCircles(self):
+        testInput = [(0, 0, 1), (10, 0, 1), (5, 8, 1)]
+        expected = testInput
+        actual = parallel.hullCandidates(testInput, processes=1, chunks=10)
+        self.assertEqual(actual, expected)
+
+class TestConvexHullDisksParallel(unittest.TestCase):
+    def testHullUnchanged(self):
+        testInput = randomCircles(1, 500)
+        expected = challenge.convexHullDisks(testInput)
+        actual = challenge.convexHullDisks(testInput, parallel=True, processes=2)
+        self.assertEqual(len(actual), len(expected))
+        for a, e in zip(actual, expected):
+            self.assertAlmostEqual(a[0], e[0])
+            self.assertAlmostEqual(a[1], e[1])
+
+    def testMinimumBounding(self):
+        testInput = randomCircles(2, 200)
+        expected = challenge.minimumBounding(testInput)
+        actual = challenge.minimumBounding(testInput, parallel=True, processes=1)
+        for a, e in zip(actual, expected):
+            self.assertAlmostEqual(a[0], e[0])
+            self.assertAlmostEqual(a[1], e[1])
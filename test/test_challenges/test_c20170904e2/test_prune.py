@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+
+import random
+import unittest
+
+import dailyprogrammer.challenges.c20170904e2 as challenge
+import dailyprogrammer.challenges.c20170904e2.prune as prune
+
+class TestConvexPolygon(unittest.TestCase):
+    def testSquare(self):
+        testInput = [(0, 0), (1, 1), (0, 1), (1, 0), (0.5, 0.5)]
+        expected = [(0, 0), (1, 0), (1, 1), (0, 1)]
+        actual = prune.convexPolygon(testInput)
+        self.assertEqual(actual, expected)
+
+    def testLine(self):
+        testInput = [(0, 0), (1, 1)]
+        expected = [(0, 0), (1, 1)]
+        actual = prune.convexPolygon(testInput)
+        self.assertEqual(actual, expected)
+
+class TestInsetDistance(unittest.TestCase):
+    def testInside(self):
+        testInput = ([(0, 0), (4, 0), (4, 4), (0, 4)], (1, 2))
+        expected = 1.0
+        actual = prune.insetDistance(*testInput)
+        self.assertAlmostEqual(actual, expected)
+
+    def testOutside(self):
+        testInput = ([(0, 0), (4, 0), (4, 4), (0, 4)], (6, 2))
+        expected = -2.0
+        actual = prune.insetDistance(*testInput)
+        self.assertAlmostEqual(actual, expected)
+
+class TestContainmentGrid(unittest.TestCase):
+    def testContained(self):
+        testInput = [(0, 0, 10), (1, 1, 1), (9, 0, 2)]
+        grid = prune.ContainmentGrid(testInput, 1.0)
+        self.assertEqual(grid.container(1), 0)
+        self.assertIsNone(grid.container(0))
+        self.assertIsNone(grid.container(2))
+
+    def testEqual(self):
+        testInput = [(0, 0, 10), (0, 0, 10)]
+        grid = prune.ContainmentGrid(testInput, 1.0)
+        self.assertIsNone(grid.container(0))
+        self.assertIsNone(grid.container(1))
+
+class TestPruneDisks(unittest.TestCase):
+    def testInterior(self):
+        testInput = [(0, 0, 1), (10, 0, 1), (10, 10, 1), (0, 10, 1), (5, 5, 2), (4, 6, 1)]
+        expected = ([(0, 0, 1), (10, 0, 1), (10, 10, 1), (0, 10, 1)], 2)
+        actual = prune.pruneDisks(testInput)
+        self.assertEqual(actual, expected)
+
+    def testContained(self):
+        testInput = [(0, 0, 1), (10, 0, 1), (5, 5, 8), (5, 11, 1.5), (5, 12, 0.5)]
+        expected = ([(0, 0, 1), (10, 0, 1), (5, 5, 8)], 2)
+        actual = prune.pruneDisks(testInput)
+        self.assertEqual(actual, expected)
+
+    def testBoundaryKept(self):
+        testInput = [(0, 0, 1), (10, 0, 1), (10, 10, 1), (0, 10, 1), (5, 0, 1), (0, 5, 1)]
+        expected = (testInput, 0)
+        actual = prune.pruneDisks(testInput)
+        self.assertEqual(actual, expected)
+
+    def testFew(self):
+        testInput = [(0, 0, 5), (1, 1, 1)]
+        expected = (testInput, 0)
+        actual = prune.pruneDisks(testInput)
+        self.assertEqual(actual, expected)
+
+    def testHullUnchanged(self):
+        rng = random.Random(0)
+        for n in (10, 50, 200):
+            testInput = [(rng.uniform(-10, 10), rng.uniform(-10, 10), rng.uniform(0.1, 5)) for i in range(n)]
+            expected = challenge.convexHullDisks(testInput)
+            actual = challenge.convexHullDisks(testInput, prune=True)
+            self.assertEqual(len(actual), len(expected))
+            for a, e in zip(actual, expected):
+                self.assertAlmostEqual(a[0], e[0])
+                self.assertAlmostEqual(a[1], e[1])
+
+    def testMinimumBounding(self):
+        testInput = [(0, 0, 1), (10, 10, 1), (3, 7, 1), (5, 5, 1), (4, 4, 0.5)]
+        expected = challenge.minimumBounding(testInput)
+        actual = challenge.minimumBounding(testInput, prune=True)
+        for a, e in zip(actual, expected):
+            self.assertAlmostEqual(a[0], e[0])
+            self.assertAlmostEqual(a[1], e[1])
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+
+import random
+import unittest
+
+import dailyprogrammer.challenges.c20170904e2 as challenge
+import dailyprogrammer.challenges.c20170904e2.store as store
+
+class TestCircleSequence(unittest.TestCase):
+    def testSequenceNotCopied(self):
+        testInput = store.CircleStore([(1, 1, 2)])
+        actual = store.circleSequence(testInput)
+        self.assertIs(actual, testInput)
+
+    def testIterableListed(self):
+        testInput = iter([(1, 1, 2)])
+        expected = [(1, 1, 2)]
+        actual = store.circleSequence(testInput)
+        self.assertEqual(actual, expected)
+
+class TestCircleStore(unittest.TestCase):
+    def setUp(self):
+        self.circles = [(1.0, 1.0, 2.0), (6.0, 2.0, 0.5), (-1.0, -3.0, 1.0)]
+        self.store = store.CircleStore(self.circles)
+
+    def testSequence(self):
+        self.assertEqual(len(self.store), 3)
+        self.assertEqual(self.store[1], (6.0, 2.0, 0.5))
+        self.assertEqual(self.store[-1], (-1.0, -3.0, 1.0))
+        self.assertEqual(list(self.store), self.circles)
+        self.assertEqual(self.store.index((6.0, 2.0, 0.5)), 1)
+
+    def testSlice(self):
+        actual = self.store[1:]
+        self.assertIsInstance(actual, store.CircleStore)
+        self.assertEqual(actual, self.circles[1:])
+
+    def testEqual(self):
+        self.assertEqual(self.store, self.circles)
+        self.assertEqual(self.store, store.CircleStore(self.circles))
+        self.assertNotEqual(self.store, self.circles[:2])
+
+    def testFromColumns(self):
+        actual = store.CircleStore.fromColumns([1, 6, -1], [1, 2, -3], [2, 0.5, 1])
+        self.assertEqual(actual, self.store)
+
+    def testFromColumnsLength(self):
+        with self.assertRaises(ValueError):
+            store.CircleStore.fromColumns([1, 6], [1, 2, -3], [2, 0.5, 1])
+
+    def testSingle(self):
+        testInput = [(0.1, 0.2, 0.3)]
+        actual = store.CircleStore(testInput, typecode="f")
+        self.assertEqual(actual.nbytes, 12)
+        for a, e in zip(actual[0], testInput[0]):
+            self.assertAlmostEqual(a, e, places=6)
+
+    def testTypecode(self):
+        with self.assertRaises(ValueError):
+            store.CircleStore(typecode="i")
+
+    def testExtents(self):
+        expected = (-2.0, 6.5, -4.0, 3.0)
+        actual = self.store.extents()
+        self.assertEqual(actual, expected)
+
+    def testRotated(self):
+        expected = list(challenge.rotateCircles(self.circles, 0.3))
+        actual = self.store.rotated(0.3)
+        for a, e in zip(actual, expected):
+            for ai, ei in zip(a, e):
+                self.assertAlmostEqual(ai, ei)
+
+class TestGeometry(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(0)
+        self.circles = [(rng.uniform(-10, 10), rng.uniform(-10, 10), rng.uniform(0.1, 2)) for i in range(60)]
+        self.store = store.CircleStore(self.circles)
+
+    def assertBoxAlmostEqual(self, actual, expected, places=7):
+        for a, e in zip(actual, expected):
+            self.assertAlmostEqual(a[0], e[0], places=places)
+            self.assertAlmostEqual(a[1], e[1], places=places)
+
+    def testOrthogonal(self):
+        expected = challenge.minimumBoundingOrthogonal(self.circles)
+        actual = challenge.minimumBoundingOrthogonal(self.store)
+        self.assertEqual(actual, expected)
+
+    def testHull(self):
+        for method in ["wrap", "divide"]:
+            expected = challenge.convexHullDisks(self.circles, method=method)
+            actual = challenge.convexHullDisks(self.store, method=method)
+            self.assertEqual(actual, expected)
+
+    def testMinimumBounding(self):
+        for method, backend in [("wrap", "rotate"), ("divide", "calipers"), ("divide", "vectorised")]:
+            expected = challenge.minimumBounding(self.circles, method=method, backend=backend)
+            actual = challenge.minimumBounding(self.store, method=method, backend=backend)
+            self.assertBoxAlmostEqual(actual, expected)
+
+    def testSinglePrecision(self):
+        expected = challenge.minimumBounding(self.circles, method="divide", backend="calipers")
+        actual = challenge.minimumBounding(store.CircleStore(self.circles, typecode="f"), method="divide", backend="calipers")
+        self.assertBoxAlmostEqual(actual, expected, places=4)
+
+    def testCache(self):
+        cache = challenge.TangentCache()
+        expected = challenge.convexHullDisks(self.circles)
+        actual = challenge.convexHullDisks(self.store, cache=cache)
+        self.assertEqual(actual, expected)
+        self.assertIsInstance(cache.circles, store.CircleStore)
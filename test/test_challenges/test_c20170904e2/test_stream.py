@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+
+import io
+import random
+import unittest
+
+import dailyprogrammer.challenges.c20170904e2 as challenge
+import dailyprogrammer.challenges.c20170904e2.stream as stream
+
+from .helpers import boxContains, randomCircles
+
+class TestHullCandidatesStream(unittest.TestCase):
+    def testInputOrder(self):
+        testInput = [(5, 8, 1), (5, 2, 0.5), (0, 0, 1), (5, 3, 1), (10, 0, 1)]
+        expected = [(5, 8, 1), (0, 0, 1), (10, 0, 1)]
+        actual = stream.hullCandidatesStream(iter(testInput), chunkSize=2)
+        self.assertEqual(actual, expected)
+
+    def testChunkSizes(self):
+        testInput = randomCircles(0, 1000)
+        expected = stream.hullCandidatesStream(testInput, chunkSize=1000)
+        for chunkSize in (1, 7, 100):
+            actual = stream.hullCandidatesStream(iter(testInput), chunkSize=chunkSize)
+            self.assertEqual(actual, expected)
+
+    def testEmpty(self):
+        testInput = []
+        expected = []
+        actual = stream.hullCandidatesStream(testInput)
+        self.assertEqual(actual, expected)
+
+class TestMainFile(unittest.TestCase):
+    def testConversion(self):
+        testInput = io.StringIO("0,0,1\n10,10,1\n3,7,1\n")
+        expected = "(-0.000, -1.414), (-3.414, 2.000), (8.000, 13.414), (11.414, 10.000)"
+        actual = challenge.mainFile(testInput)
+        self.assertEqual(actual, expected)
+
+    def testSameAsMain(self):
+        testInput = "\n".join("{0:.3f},{1:.3f},{2:.3f}".format(*c) for c in randomCircles(1, 300))
+        expected = challenge.main(testInput)
+        actual = challenge.mainFile(io.StringIO(testInput))
+        self.assertEqual(actual, expected)
+
+    def testInternallyTangent(self):
+        testInput = "4,-2,1\n5,-2,2\n0,5,1\n-3,0,1"
+        expected = challenge.main(testInput)
+        actual = challenge.mainFile(io.StringIO(testInput))
+        self.assertEqual(actual, expected)
+
+    def testBoundsIntegers(self):
+        rng = random.Random(0)
+        for trial in range(50):
+            circles = [(rng.randint(-6, 6), rng.randint(-6, 6), rng.randint(1, 3)) for i in range(12)]
+            box = challenge.minimumBounding(stream.hullCandidatesStream(circles, chunkSize=4))
+            for circle in circles:
+                self.assertTrue(boxContains(box, circle), "{0} outside {1}".format(circle, box))
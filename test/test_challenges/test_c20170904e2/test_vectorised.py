@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+
+import unittest
+from unittest import mock
+
+import dailyprogrammer.challenges.c20170904e2 as challenge
+import dailyprogrammer.challenges.c20170904e2.vectorised as vectorised
+
+from .helpers import randomCircles
+
+INF = float('inf')
+
+def assertTuplesAlmostEqual(self, actual, expected):
+    """
+    Assert an array of lines or points are almost equal
+    """
+    self.assertEqual(len(actual), len(expected), "{0} was expected to be {1}".format(actual, expected))
+    for a, e in zip(actual, expected):
+        for i, j in zip(a, e):
+            self.assertAlmostEqual(i, j, msg="{0} was expected to be {1}".format(actual, expected))
+
+@unittest.skipIf(not vectorised.HAVE_NUMPY, "NumPy is not installed")
+class TestCoTangents(unittest.TestCase):
+    def testMatchesCoTangent(self):
+        p = (0, 0, 1)
+        testInput = [(3, 3, 1), (0, 5, 1), (0, -5, 1), (-4, 1, 2), (6, 0, 0.5)]
+        tp, tq, lines, valid = vectorised.coTangents(p, vectorised.circleArray(testInput))
+        self.assertTrue(valid.all())
+        for k, q in enumerate(testInput):
+            points, expected = challenge.coTangent(p, q)
+            assertTuplesAlmostEqual(self, [tuple(lines[k])], [expected])
+            assertTuplesAlmostEqual(self, [tuple(tp[k]), tuple(tq[k])], points)
+
+    def testInvalid(self):
+        p = (0, 0, 1)
+        testInput = [(0, 0, 1), (0, 0, 0.5), (5, 0, 1)]
+        tp, tq, lines, valid = vectorised.coTangents(p, vectorised.circleArray(testInput))
+        self.assertEqual(list(valid), [False, False, True])
+
+@unittest.skipIf(not vectorised.HAVE_NUMPY, "NumPy is not installed")
+class TestConvexHullDisksVectorised(unittest.TestCase):
+    def testSimple(self):
+        testInput = [(0, 0, 1), (3, 3, 1), (6, 0, 1)]
+        expected = [(1.0, 1.414213562373095), (-1, 7.414213562373094), (0, -1)]
+        actual = challenge.convexHullDisks(testInput, method="vectorised")
+        assertTuplesAlmostEqual(self, actual, expected)
+
+    def testStackedVertical(self):
+        testInput = [(0, 0, 1), (0, 1, 1), (3, 3, 1), (6, 0, 1)]
+        expected = [(INF, -1), (0.6666666666666666, 2.201850425154663), (-1, 7.414213562373094)]
+        actual = vectorised.convexHullDisksHalfVectorised(testInput)
+        self.assertEqual(actual[0][0], INF)
+        assertTuplesAlmostEqual(self, actual[1:], expected[1:])
+
+    def testRandom(self):
+        for n in (5, 20, 100):
+            testInput = randomCircles(n, n)
+            expected = challenge.convexHullDisks(testInput)
+            actual = challenge.convexHullDisks(testInput, method="vectorised")
+            assertTuplesAlmostEqual(self, actual, expected)
+
+@unittest.skipIf(not vectorised.HAVE_NUMPY, "NumPy is not installed")
+class TestBoundingBoxesVectorised(unittest.TestCase):
+    def testRandom(self):
+        testInput = randomCircles(0, 30)
+        expected = list(challenge.boundingBoxesDisks(testInput))
+        actual = list(vectorised.boundingBoxesVectorised(testInput))
+        self.assertEqual(len(actual), len(expected))
+        for a, e in zip(actual, expected):
+            assertTuplesAlmostEqual(self, a[0], e[0])
+            self.assertAlmostEqual(a[1], e[1])
+
+    def testMinimumBounding(self):
+        testInput = [(0, 0, 1), (10, 10, 1), (3, 7, 1)]
+        expected = ((0.0, -1.414213562373095),
+                    (-3.414213562373095, 2.0),
+                    (8.0, 13.414213562373094),
+                    (11.414213562373096, 10.0))
+        actual = challenge.minimumBounding(testInput, backend="vectorised")
+        assertTuplesAlmostEqual(self, actual, expected)
+
+class TestFallback(unittest.TestCase):
+    def testConvexHullDisks(self):
+        testInput = [(0, 0, 1), (3, 3, 1), (6, 0, 1)]
+        expected = challenge.convexHullDisks(testInput)
+        with mock.patch.object(vectorised, "HAVE_NUMPY", False):
+            actual = challenge.convexHullDisks(testInput, method="vectorised")
+        self.assertEqual(actual, expected)
+
+    def testMinimumBounding(self):
+        testInput = [(0, 0, 1), (10, 10, 1), (3, 7, 1)]
+        expected = challenge.minimumBounding(testInput)
+        with mock.patch.object(vectorised, "HAVE_NUMPY", False):
+            actual = challenge.minimumBounding(testInput, backend="vectorised")
+        self.assertEqual(actual, expected)
@@ -1,9 +1,61 @@
 #!/usr/bin/env python
 
+import io
+import os
+import tempfile
+import types
 import unittest
+from unittest import mock
 
 import dailyprogrammer.__main__ as main
 
 class TestMainParser(unittest.TestCase):
     def testParserCompiles(self):
         parser = main.mainParser()
+
+class TestMain(unittest.TestCase):
+    def testCheckArguments(self):
+        argv = ["dailyprogrammer", "c20170811h0", "spam", "--resume"]
+        with mock.patch("sys.argv", argv), mock.patch("sys.stderr", io.StringIO()) as stderr:
+            with self.assertRaises(SystemExit):
+                main.main()
+        self.assertIn("--resume needs --checkpoint", stderr.getvalue())
+
+class TestRunFile(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        with os.fdopen(fd, "w") as f:
+            f.write("spam")
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def testMain(self):
+        challenge = types.SimpleNamespace(main=lambda challengeInput, suffix: challengeInput + suffix)
+        actual = main.runFile(challenge, self.path, {"suffix": "!"})
+        self.assertEqual(actual, "spam!")
+
+    def testMainFile(self):
+        challenge = types.SimpleNamespace(main=None, mainFile=lambda f: f.read().upper())
+        actual = main.runFile(challenge, self.path, {})
+        self.assertEqual(actual, "SPAM")
+
+class TestRunBatch(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        with os.fdopen(fd, "w") as f:
+            f.write("1,1,2\n6,2,0.5\n-1,-3,1\n\n0,0,1\n10,0,1\n5,5,1\n")
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def testBlank(self):
+        expected = "\n".join([
+            "(-2.000, -4.000), (-2.000, 3.000), (6.500, 3.000), (6.500, -4.000)",
+            "",
+            "(-1.000, -1.000), (-1.000, 6.000), (11.000, 6.000), (11.000, -1.000)",
+            ""])
+        output = io.StringIO()
+        main.runBatch("dailyprogrammer.challenges.c20170904e0", self.path, {}, processes=1, output=output)
+        actual = output.getvalue()
+        self.assertEqual(actual, expected)
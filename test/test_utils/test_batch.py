@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+
+import unittest
+
+import dailyprogrammer.challenges.c20170904e0 as challenge
+import dailyprogrammer.challenges.c20170904e2 as epsilonChallenge
+import dailyprogrammer.utils.batch as batch
+
+PROBLEMS = ["1,1,2\n6,2,0.5\n-1,-3,1", "0,0,1\n10,0,1\n5,5,1", "3,4,1"]
+
+class TestReadProblems(unittest.TestCase):
+    def testBlank(self):
+        testInput = ["\n", "1,1,2\n", "6,2,0.5\n", "-1,-3,1\n", "\n", "\n", "0,0,1\n", "10,0,1\n", "5,5,1\n", "\n", "3,4,1"]
+        expected = PROBLEMS
+        actual = list(batch.readProblems(testInput))
+        self.assertEqual(actual, expected)
+
+    def testJson(self):
+        testInput = ['[[1, 1, 2], [6, 2, 0.5], [-1, -3, 1]]\n', '\n', '"0,0,1\\n10,0,1\\n5,5,1"\n', '[[3, 4, 1]]']
+        expected = PROBLEMS
+        actual = list(batch.readProblems(testInput, "json"))
+        self.assertEqual(actual, expected)
+
+    def testUnknown(self):
+        with self.assertRaises(ValueError):
+            list(batch.readProblems([], "xml"))
+
+class TestFormatResults(unittest.TestCase):
+    def testBlank(self):
+        testInput = ["a\nb", "c"]
+        expected = ["a\nb", "", "c"]
+        actual = list(batch.formatResults(testInput))
+        self.assertEqual(actual, expected)
+
+    def testJson(self):
+        testInput = ["a\nb", "c"]
+        expected = ['"a\\nb"', '"c"']
+        actual = list(batch.formatResults(testInput, "json"))
+        self.assertEqual(actual, expected)
+
+class TestSolveBatch(unittest.TestCase):
+    def setUp(self):
+        self.problems = PROBLEMS * 20
+        self.expected = [challenge.main(problem) for problem in self.problems]
+
+    def testInProcess(self):
+        actual = list(batch.solveBatch("dailyprogrammer.challenges.c20170904e0", iter(self.problems), processes=1, chunkSize=7))
+        self.assertEqual(actual, self.expected)
+
+    def testPool(self):
+        actual = list(batch.solveBatch("dailyprogrammer.challenges.c20170904e0", iter(self.problems), processes=2, chunkSize=7))
+        self.assertEqual(actual, self.expected)
+
+    def testOptions(self):
+        testInput = ["0,0,1\n10,0,1\n5,5,1"]
+        expected = [epsilonChallenge.main(testInput[0], epsilon=0.01)]
+        actual = list(batch.solveBatch("dailyprogrammer.challenges.c20170904e2", testInput, options={"epsilon": 0.01}, processes=1))
+        self.assertEqual(actual, expected)
+
+    def testErrorResult(self):
+        testInput = ["0,0,1", "spam", "3,4,1"]
+        expected = [challenge.main("0,0,1"), "Error: ValueError: could not convert string to float: 'spam'", challenge.main("3,4,1")]
+        with self.assertLogs("dailyprogrammer.utils.batch", "ERROR"):
+            actual = list(batch.solveBatch("dailyprogrammer.challenges.c20170904e0", testInput, processes=1))
+        self.assertEqual(actual, expected)
+
+    def testErrorResultPool(self):
+        testInput = ["0,0,1", "spam", "3,4,1"]
+        expected = [challenge.main("0,0,1"), "Error: ValueError: could not convert string to float: 'spam'", challenge.main("3,4,1")]
+        actual = list(batch.solveBatch("dailyprogrammer.challenges.c20170904e0", testInput, processes=2, chunkSize=2))
+        self.assertEqual(actual, expected)
+
+    def testWorkerOptions(self):
+        testInput = ["spam\nham", "eggs"]
+        options = {"processes": 2, "portfolio": 0.1}
+        actual = list(batch.solveBatch("dailyprogrammer.challenges.c20170811h0", testInput, options=options, processes=2))
+        self.assertEqual(len(actual), len(testInput))
+        for result in actual:
+            self.assertFalse(result.startswith("Error"), result)
@@ -0,0 +1,19 @@
+#!/usr/bin/env python
+
+import unittest
+
+import dailyprogrammer.utils.circles as circles
+
+class TestReadCircles(unittest.TestCase):
+    def testBlankLines(self):
+        testInput = ["0,0,1\n", "\n", "  \n", "0.5, -0.5, 1\n"]
+        expected = [(0.0, 0.0, 1.0), (0.5, -0.5, 1.0)]
+        actual = list(circles.readCircles(testInput))
+        self.assertEqual(actual, expected)
+
+class TestFormatBox(unittest.TestCase):
+    def testRounding(self):
+        testInput = ((-1, -1), (-1, 3), (3.0004, 3), (3, -1.0006))
+        expected = "(-1.000, -1.000), (-1.000, 3.000), (3.000, 3.000), (3.000, -1.001)"
+        actual = circles.formatBox(testInput)
+        self.assertEqual(actual, expected)
@@ -0,0 +1,36 @@
+#!/usr/bin/env python
+
+import unittest
+
+import dailyprogrammer.utils.matching as matching
+
+class TestHopcroftKarp(unittest.TestCase):
+    def testEmpty(self):
+        testInput = []
+        expected = []
+        actual = matching.hopcroftKarp(testInput)
+        self.assertEqual(actual, expected)
+
+    def testSimple(self):
+        testInput = [["x", "y"], ["x"]]
+        expected = ["y", "x"]
+        actual = matching.hopcroftKarp(testInput)
+        self.assertEqual(actual, expected)
+
+    def testUnmatched(self):
+        testInput = [["x"], ["x"], ["y"]]
+        expected = ["x", None, "y"]
+        actual = matching.hopcroftKarp(testInput)
+        self.assertEqual(actual, expected)
+
+    def testLongPath(self):
+        testInput = [[0, 1], [1, 2], [2, 3], [0]]
+        expected = [1, 2, 3, 0]
+        actual = matching.hopcroftKarp(testInput)
+        self.assertEqual(actual, expected)
+
+    def testInitialMatching(self):
+        testInput = [[0], [0, 1]]
+        expected = [0, 1]
+        actual = matching.hopcroftKarp(testInput, matchLeft=[None, 0])
+        self.assertEqual(actual, expected)
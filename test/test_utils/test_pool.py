@@ -0,0 +1,29 @@
+#!/usr/bin/env python
+
+import multiprocessing
+import unittest
+
+import dailyprogrammer.utils.pool as pool
+
+def square(x):
+    return x * x
+
+class TestImapBounded(unittest.TestCase):
+    def testOrdered(self):
+        testInput = range(50)
+        expected = [x * x for x in range(50)]
+        with multiprocessing.Pool(2) as p:
+            actual = list(pool.imapBounded(p, square, testInput, window=3))
+        self.assertEqual(actual, expected)
+
+    def testLazy(self):
+        consumed = []
+        def numbers():
+            for x in range(100):
+                consumed.append(x)
+                yield x
+        with multiprocessing.Pool(2) as p:
+            results = pool.imapBounded(p, square, numbers(), window=4)
+            self.assertEqual(next(results), 0)
+            self.assertEqual(len(consumed), 4)
+            results.close()
@@ -38,3 +38,22 @@ class TestSortedDictValues(unittest.TestCase):
         actual = structures.sortedDictValues(testInput, reverse=True)
         self.assertEqual(actual, expected)
 
+
+class TestChunks(unittest.TestCase):
+    def testEven(self):
+        testInput = ([1, 2, 3, 4], 2)
+        expected = [[1, 2], [3, 4]]
+        actual = structures.chunks(*testInput)
+        self.assertEqual(list(actual), expected)
+
+    def testRemainder(self):
+        testInput = (iter([1, 2, 3]), 2)
+        expected = [[1, 2], [3]]
+        actual = structures.chunks(*testInput)
+        self.assertEqual(list(actual), expected)
+
+    def testEmpty(self):
+        testInput = ([], 2)
+        expected = []
+        actual = structures.chunks(*testInput)
+        self.assertEqual(list(actual), expected)